@@ -0,0 +1,19 @@
+"""bench — Micro-benchmarks des chemins chauds (simulation, réseau, rendu).
+
+Lancement (headless, SDL dummy) :
+    python -m bench run                         # écrit bench/results/latest.json
+    python -m bench run -k pathfind --repeat 9  # filtrer / plus de répétitions
+    python -m bench compare                     # latest.json vs bench/baseline.json
+    python -m bench compare --threshold 0.25    # tolérance de 25 %
+    python -m bench run --save-baseline         # régénérer la référence versionnée
+
+compare échoue (code 1) sur une régression comme sur un cas mesuré absent de
+la référence : tout nouveau cas s'accompagne d'un --save-baseline complet
+(tous les cas en une seule exécution, -k refusé).
+
+Charge réseau (bots WebSocket contre des serveurs dédiés locaux) :
+    python -m bench.loadgen sweep               # voir bench/loadgen.py
+
+Les cas sont déclarés dans bench/cases.py ; les cartes générées (graines
+fixes) dans bench/maps.py.
+"""
@@ -0,0 +1,75 @@
+"""Point d'entrée : python -m bench {run,compare} (voir bench/__init__.py)."""
+import argparse
+import os
+import sys
+
+# Doit être défini AVANT pygame.init()
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from bench import runner
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+BASELINE = os.path.join(_HERE, "baseline.json")
+LATEST   = os.path.join(_HERE, "results", "latest.json")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m bench",
+                                     description="Micro-benchmarks WW2 Survival")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    p_run = sub.add_parser("run", help="exécuter les benchmarks")
+    p_run.add_argument("-k", dest="pattern", default="",
+                       help="ne lancer que les cas contenant ce motif")
+    p_run.add_argument("--repeat", type=int, default=5,
+                       help="nombre de lots mesurés par cas (défaut: 5)")
+    p_run.add_argument("--out", default=LATEST, help="fichier JSON de résultats")
+    p_run.add_argument("--save-baseline", action="store_true",
+                       help="écrire aussi le résultat dans bench/baseline.json")
+
+    p_cmp = sub.add_parser("compare", help="comparer des résultats à la référence")
+    p_cmp.add_argument("results", nargs="?", default=LATEST)
+    p_cmp.add_argument("--baseline", default=BASELINE)
+    p_cmp.add_argument("--threshold", type=float, default=0.15,
+                       help="régression si médiane > référence × (1 + seuil) (défaut: 0.15)")
+    args = parser.parse_args()
+
+    if args.cmd == "run" and args.save_baseline and args.pattern:
+        # La référence est réenregistrée en entier, en une seule exécution
+        parser.error("--save-baseline enregistre tous les cas : retirer -k")
+
+    if args.cmd == "run":
+        pygame.init()
+        pygame.display.set_mode((1, 1))   # surface factice (SDL dummy driver)
+        from bench.cases import CASES
+        print(f"[bench] {len(CASES)} cas déclarés")
+        data = runner.run(CASES, args.pattern, args.repeat)
+        runner.save(data, args.out)
+        print(f"[bench] Résultats → {args.out}")
+        if args.save_baseline:
+            runner.save(data, BASELINE)
+            print(f"[bench] Référence mise à jour → {BASELINE}")
+        pygame.quit()
+        return 0
+
+    current  = runner.load(args.results)
+    baseline = runner.load(args.baseline)
+    regressions, missing = runner.compare(current, baseline, args.threshold)
+    if missing:
+        # Un cas sans référence ne peut jamais être signalé en régression
+        print(f"[bench] {len(missing)} cas sans référence : {', '.join(missing)} "
+              f"(python -m bench run --save-baseline)")
+    if regressions:
+        print(f"[bench] {len(regressions)} régression(s) au-delà de "
+              f"{args.threshold:.0%} : {', '.join(regressions)}")
+    if missing or regressions:
+        return 1
+    print(f"[bench] Aucune régression au-delà de {args.threshold:.0%}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
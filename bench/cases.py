@@ -0,0 +1,363 @@
+"""cases.py — Déclaration des micro-benchmarks.
+
+Chaque cas est une fonction de préparation enregistrée par @case(nom) qui
+renvoie (op, n) : op() exécute n appels de la fonction mesurée. Le runner
+rapporte le temps par appel (op / n). Toutes les données aléatoires sont
+tirées de graines fixes pour que deux exécutions mesurent le même travail.
+"""
+import contextlib
+import importlib.util
+import io
+import itertools
+import math
+import random
+
+import pygame
+
+from settings import SCREEN_W, SCREEN_H, TILE_SIZE, COVER_RANGE, WEAPONS, STATE_PLAYING
+from game.world.map_data import MAP_DATA, PLAYER_START
+from game.world.tilemap import TileMap
+from game.world.camera import Camera
+from game.systems.collision import has_line_of_sight, move_and_collide
+from game.systems.pathfinding import Pathfinder
+from game.network.messages import (
+    encode, decode, make_game_state, make_projectiles, serialize_player, serialize_enemy,
+    serialize_pickup, serialize_explosion, bullet_spawn, grenade_spawn, projectile_despawn,
+)
+from bench.maps import GENERATED_MAPS, generate_map, walkable_tiles
+
+CASES: dict = {}
+
+
+def case(name: str):
+    def deco(fn):
+        CASES[name] = fn
+        return fn
+    return deco
+
+
+def _maps() -> list[tuple[str, list[list[int]]]]:
+    maps = [("map_data", MAP_DATA)]
+    for name, seed, density in GENERATED_MAPS:
+        maps.append((name, generate_map(seed, density)))
+    return maps
+
+
+def _random_pairs(data, count: int, seed: int) -> list[tuple[pygame.Vector2, pygame.Vector2]]:
+    rng = random.Random(seed)
+    tm = TileMap(data)
+    tiles = walkable_tiles(data)
+    return [(tm.tile_center(*rng.choice(tiles)), tm.tile_center(*rng.choice(tiles)))
+            for _ in range(count)]
+
+
+def _worst_pairs(data, count: int, seed: int) -> list[tuple[pygame.Vector2, pygame.Vector2]]:
+    """Les paires les plus éloignées (Manhattan) parmi un échantillon fixe :
+    A* y atteint le plafond MAX_ASTAR_NODES ou s'en approche."""
+    pairs = _random_pairs(data, 2000, seed)
+    pairs.sort(key=lambda p: abs(p[0].x - p[1].x) + abs(p[0].y - p[1].y), reverse=True)
+    return pairs[:count]
+
+
+def _players(count: int) -> list:
+    from game.entities.player import Player
+    return [Player(PLAYER_START[0] + i * 30, PLAYER_START[1], player_id=i + 1,
+                   player_name=f"Bench{i + 1}")
+            for i in range(count)]
+
+
+def _enemies(tm: TileMap, count: int, players: list, seed: int,
+             avoid: pygame.Vector2 | None = None) -> list:
+    from game.entities.enemy import Enemy
+    from settings import ENEMY_TYPES
+    rng = random.Random(seed)
+    tiles = walkable_tiles(tm.data)
+    pathfinder = Pathfinder(tm)
+    types = sorted(ENEMY_TYPES)
+    enemies = []
+    while len(enemies) < count:
+        pos = tm.tile_center(*rng.choice(tiles))
+        if avoid is not None and (pos - avoid).length() < TILE_SIZE * 2:
+            continue
+        enemies.append(Enemy(pos.x, pos.y, rng.choice(types), pathfinder, players, tm))
+    return enemies
+
+
+# ---------------------------------------------------------------- collision
+
+for _name, _data in _maps():
+    def _los(data=_data):
+        tm = TileMap(data)
+        pairs = _random_pairs(data, 256, seed=1)
+
+        def op():
+            for a, b in pairs:
+                has_line_of_sight(a, b, tm)
+        return op, len(pairs)
+    case(f"has_line_of_sight/{_name}")(_los)
+
+
+@case("move_and_collide/map_data")
+def _move_and_collide():
+    tm = TileMap(MAP_DATA)
+    rng = random.Random(2)
+    tiles = walkable_tiles(MAP_DATA)
+
+    class _Body:
+        rect = pygame.Rect(0, 0, 28, 28)
+
+    body = _Body()
+    moves = []
+    for _ in range(256):
+        start = tm.tile_center(*rng.choice(tiles))
+        angle = rng.uniform(0, math.tau)
+        moves.append(((int(start.x), int(start.y)),
+                      math.cos(angle) * 6.0, math.sin(angle) * 6.0))
+
+    def op():
+        for center, dx, dy in moves:
+            body.rect.center = center
+            move_and_collide(body, dx, dy, tm)
+    return op, len(moves)
+
+
+# ---------------------------------------------------------------- pathfinding
+
+# find_path_* : A* + lissage (référence historique) ; theta_path_* : lazy
+# Theta*, mêmes paires. Compteurs par requête : los, lignes de vue demandées
+# (coût de l'algorithme) ; rays, réellement lancées. Le cache de visibilité de
+# Theta* est vidé à chaque exécution de op : rays compte un lot de requêtes
+# distinctes, pas les mêmes paires rejouées.
+for (_name, _data), _mode in itertools.product(_maps(), ("astar", "theta")):
+    def _path_random(data=_data, mode=_mode):
+        pf = Pathfinder(TileMap(data), mode)
+        pairs = _random_pairs(data, 32, seed=3)
+
+        def op():
+            pf._vis.clear()
+            for a, b in pairs:
+                pf.find_path(a, b)
+        return op, len(pairs), lambda: {"los": pf.los_checks, "rays": pf.los_rays}
+
+    def _path_worst(data=_data, mode=_mode):
+        pf = Pathfinder(TileMap(data), mode)
+        pairs = _worst_pairs(data, 8, seed=4)
+
+        def op():
+            pf._vis.clear()
+            for a, b in pairs:
+                pf.find_path(a, b)
+        return op, len(pairs), lambda: {"los": pf.los_checks, "rays": pf.los_rays}
+
+    _prefix = "find_path" if _mode == "astar" else "theta_path"
+    case(f"{_prefix}_random/{_name}")(_path_random)
+    case(f"{_prefix}_worst/{_name}")(_path_worst)
+
+
+# ---------------------------------------------------------------- IA
+
+for _name, _data in _maps():
+    def _cover(data=_data):
+        tm = TileMap(data)
+        players = _players(1)
+        enemy = _enemies(tm, 1, players, seed=5)[0]
+        rng = random.Random(6)
+        tiles = walkable_tiles(data)
+        queries = []
+        while len(queries) < 32:
+            e_pos = tm.tile_center(*rng.choice(tiles))
+            p_pos = tm.tile_center(*rng.choice(tiles))
+            if (e_pos - p_pos).length() <= COVER_RANGE * 2:
+                queries.append((e_pos, p_pos))
+
+        def op():
+            for e_pos, p_pos in queries:
+                enemy.ai._find_cover(e_pos, p_pos)
+        return op, len(queries)
+    case(f"find_cover/{_name}")(_cover)
+
+
+for _mode in ("solo", "squads"):
+    def _enemy_ai(mode=_mode, count=100, ticks=10):
+        """Une vague dense en poursuite : coût de l'IA par ennemi et par tick."""
+        from game.systems.squad import SquadManager
+        tm = TileMap(MAP_DATA)
+        players = _players(2)
+        enemies = _enemies(tm, count, players, seed=7, avoid=pygame.Vector2(PLAYER_START))
+        squads = SquadManager(tm, enemies[0].ai.pathfinder) if mode == "squads" else None
+        start = [pygame.Vector2(e.pos) for e in enemies]
+        bullets, explosions = pygame.sprite.Group(), pygame.sprite.Group()
+        dt = 1 / 60
+
+        def op():
+            for e, pos in zip(enemies, start):
+                e.pos.update(pos)
+                e.rect.center = (int(pos.x), int(pos.y))
+                e.ai.state = "chase"
+            bullets.empty()
+            for _ in range(ticks):
+                if squads:
+                    squads.update(dt, enemies, players)
+                for e in enemies:
+                    e.update(dt, tm, players, bullets, explosions)
+        return op, count * ticks
+    case(f"enemy_ai/{_mode}_100")(_enemy_ai)
+
+
+_PERCEPTION_BACKENDS = ("numpy", "scalar") if importlib.util.find_spec("numpy") else ("scalar",)
+
+for _backend, _n in itertools.product(_PERCEPTION_BACKENDS, (10, 30, 100, 200)):
+    def _perception(backend=_backend, count=_n):
+        """Passe de perception d'un tick : cibles + lignes de vue de count ennemis."""
+        from game.systems.perception import Perception
+        tm = TileMap(MAP_DATA)
+        players = _players(2)
+        enemies = _enemies(tm, count, players, seed=8)
+        for i, e in enumerate(enemies):
+            e.ai.state = "chase" if i % 2 else "patrol"
+        perception = Perception(tm, use_numpy=(backend == "numpy"))
+        perception.numpy_min = 0   # mesurer le backend demandé à toutes les tailles
+
+        def op():
+            perception.update(enemies, players)
+        return op, count
+    case(f"perception/{_backend}_{_n}")(_perception)
+
+
+# ---------------------------------------------------------------- projectiles
+
+for _n in (10, 50, 200):
+    def _bullets(n=_n):
+        from game.entities.bullet import Bullet
+        tm = TileMap(MAP_DATA)
+        players = _players(1)
+        origin = pygame.Vector2(PLAYER_START)
+        enemies = pygame.sprite.Group(_enemies(tm, n, players, seed=7, avoid=origin))
+        bullet = Bullet(origin.x, origin.y, 1.0, 0.0, 10, "player", 10_000,
+                        owner_id=1, weapon="rifle")
+
+        def op():
+            for _ in range(16):
+                bullet.pos.update(origin)
+                bullet.traveled = 0.0
+                bullet.update(1 / 60, tm, enemies, players)
+        return op, 16
+    case(f"bullet_update/{_n}_enemies")(_bullets)
+
+
+# ---------------------------------------------------------------- réseau
+
+for _label, _n_enemies, _n_bullets in (("small", 20, 30), ("large", 80, 150)):
+    def _snapshot(n_enemies=_n_enemies, n_bullets=_n_bullets):
+        from game.entities.bullet import Bullet
+        from game.entities.grenade import Grenade, Explosion
+        from game.entities.pickup import WeaponPickup
+        tm = TileMap(MAP_DATA)
+        players = _players(4)
+        enemies = _enemies(tm, n_enemies, players, seed=8)
+        rng = random.Random(9)
+        bullets = [Bullet(rng.uniform(100, 1800), rng.uniform(100, 1300),
+                          rng.uniform(-600, 600), rng.uniform(-600, 600),
+                          10, rng.choice(("player", "enemy")), 800)
+                   for _ in range(n_bullets)]
+        gdata = WEAPONS["grenade"]
+        grenades = [Grenade(400, 400, 120, -80, gdata["fuse_time"],
+                            gdata["blast_radius"], gdata["damage"])
+                    for _ in range(2)]
+        explosions = [Explosion(600, 600, gdata["blast_radius"], 0) for _ in range(2)]
+        pickups = [WeaponPickup(300 + i * 100, 300, w)
+                   for i, w in enumerate(("rifle", "smg", "pistol"))]
+        wave_info = {"wave_number": 5, "wave_state": "active", "wave_countdown": 0.0,
+                     "enemies_remaining": n_enemies, "total_this_wave": n_enemies}
+
+        # Balles et grenades : plus dans le snapshot, seulement les événements
+        # d'un tick de fusillade (un tir sur 20 balles en vol apparaît / disparaît)
+        churn = max(1, n_bullets // 20)
+
+        def op():
+            encode(make_projectiles(1234,
+                [bullet_spawn(b, i, 1234) for i, b in enumerate(bullets[:churn])]
+                + [grenade_spawn(grenades[0], churn, 1234)]
+                + [projectile_despawn(i, 1234, b.pos) for i, b in enumerate(bullets[-churn:])]))
+            encode(make_game_state(
+                1234,
+                [serialize_player(p) for p in players],
+                [serialize_enemy(e) for e in enemies],
+                [serialize_pickup(pk) for pk in pickups],
+                wave_info,
+                upgrade_levels={"damage": 1},
+                explosions_data=[serialize_explosion(ex) for ex in explosions],
+            ))
+        return op, 1
+    case(f"snapshot_encode/{_label}")(_snapshot)
+
+
+# ---------------------------------------------------------------- rendu
+
+@case("tilemap_draw/map_data")
+def _tilemap_draw():
+    tm = TileMap(MAP_DATA)
+    screen = pygame.Surface((SCREEN_W, SCREEN_H))
+    camera = Camera()
+    offsets = [pygame.Vector2(x, y) for x in (0, 217, 640) for y in (0, 333, 720)]
+
+    def op():
+        for off in offsets:
+            camera.offset.update(off)
+            tm.draw(screen, camera.offset)
+    return op, len(offsets)
+
+
+for _label, _n_enemies, _n_bullets in (("early", 8, 10), ("late", 80, 150)):
+    def _client_frame(n_enemies=_n_enemies, n_bullets=_n_bullets):
+        """Une frame complète de ClientGame._draw (1280x720) sur un état
+        synthétique reçu comme du serveur : coût de rendu côté client."""
+        from main_client import ClientGame
+        from game.network.client import OfflineClient
+        from game.entities.bullet import Bullet
+        tm = TileMap(MAP_DATA)
+        players = _players(4)
+        enemies = _enemies(tm, n_enemies, players, seed=8)
+        rng = random.Random(10)
+        px, py = players[0].pos
+        bullets = [Bullet(px + rng.uniform(-600, 600), py + rng.uniform(-340, 340),
+                          rng.uniform(-900, 900), rng.uniform(-900, 900), 10,
+                          rng.choice(("player", "enemy")), 800,
+                          weapon=rng.choice(("pistol", "rifle", "smg")))
+                   for _ in range(n_bullets)]
+        wave_info = {"wave_number": 5, "wave_state": "active", "wave_countdown": 0.0,
+                     "enemies_remaining": n_enemies, "total_this_wave": n_enemies}
+        with contextlib.redirect_stdout(io.StringIO()):
+            client = ClientGame("hors-ligne", "Bench1",
+                                screen=pygame.Surface((SCREEN_W, SCREEN_H)),
+                                net_client=OfflineClient(player_id=1))
+        client.state = STATE_PLAYING
+        client.net.push([decode(encode(m)) for m in (
+            make_projectiles(1, [bullet_spawn(b, i, 1) for i, b in enumerate(bullets)]),
+            make_game_state(1, [serialize_player(p) for p in players],
+                            [serialize_enemy(e) for e in enemies], [], wave_info),
+        )])
+        client._process_server_messages()
+        client._update_camera()
+
+        def op():
+            client._draw()
+        return op, 1
+    case(f"client_frame/{_label}")(_client_frame)
+
+
+@case("hud_from_state")
+def _hud_from_state():
+    """HUD.draw_from_state seul (panneau, vague, alliés, inventaire) sur un
+    état stable : le cas courant d'une frame client."""
+    from game.ui.hud import HUD
+    players = [serialize_player(p) for p in _players(4)]
+    local = dict(players[0], all_players=players)
+    wave_info = {"wave_number": 5, "wave_state": "active", "wave_countdown": 0.0,
+                 "enemies_remaining": 12, "total_this_wave": 20}
+    screen = pygame.Surface((SCREEN_W, SCREEN_H))
+    hud = HUD()
+
+    def op():
+        hud.draw_from_state(screen, local, wave_info, 0)
+    return op, 1
@@ -0,0 +1,569 @@
+"""loadgen.py — Générateur de charge : bots WebSocket headless contre DedicatedServer.
+
+Lancement :
+    python -m bench.loadgen sweep                          # 1 salle, 1..8 joueurs
+    python -m bench.loadgen sweep --players 2,4,8,16 --rooms 1,2,4 --room-players 4
+    python -m bench.loadgen soak --players 4 --duration 1800 --sample 30
+    python -m bench.loadgen sweep --external 127.0.0.1:8765:8080   # serveur déjà lancé
+
+Chaque salle est un processus `server_headless.py` (port WebSocket + port /status
+dédiés). Les bots parlent le protocole réel (MSG_JOIN, make_input, start_game_req) :
+ils se déplacent, visent et tirent. Le bot hôte lance la partie dès que la salle
+est pleine, et la relance après chaque réinitialisation du lobby.
+
+Mesures par configuration :
+  - temps de tick serveur (moyenne / p99 sur la fenêtre glissante du TickWatchdog)
+  - CPU consommé par processus serveur (/proc, Linux) → salles par cœur
+  - gigue d'inter-arrivée des snapshots, octets/s reçus par client
+  - latence input → état (tick d'input renvoyé par le serveur dans « input_tick »)
+
+Rapport JSON + Markdown dans bench/results/.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+try:
+    from websockets.asyncio.client import connect as ws_connect
+except ImportError:
+    ws_connect = None
+
+from game.network.messages import (
+    MSG_JOIN, MSG_WELCOME, MSG_GAME_STATE, MSG_LOBBY_STATE, MSG_START_GAME,
+    encode, decode, make_input,
+)
+from settings import FPS, NET_PORT, NET_BROADCAST_RATE
+
+_ROOT    = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_RESULTS = os.path.join(_ROOT, "bench", "results")
+
+TICK_BUDGET_MS = 1000.0 / FPS
+
+
+def _percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+# ====================================================================== bots
+
+class Bot:
+    """Client scripté : un cap aléatoire changé toutes les 1–2 s, visée tournante
+    vers l'ennemi le plus proche, tir continu, changement d'arme occasionnel."""
+
+    def __init__(self, host: str, port: int, name: str, room_size: int,
+                 seed: int, input_rate: float):
+        self.uri        = f"ws://{host}:{port}"
+        self.name       = name
+        self.room_size  = room_size
+        self.rng        = random.Random(seed)
+        self.input_dt   = 1.0 / input_rate
+        self.player_id  = None
+        self.error      = ""
+
+        self._tick       = 0
+        self._sent_at: dict[int, float] = {}
+        self._acked_tick = 0
+        self._pos        = (0.0, 0.0)
+        self._aim        = 0.0
+        self._move       = (0.0, 0.0)
+        self._move_timer = 0.0
+        self._weapon_idx = 0
+        self._playing    = False
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        self.bytes_in      = 0
+        self.snapshots     = 0
+        self.arrivals: list[float] = []
+        self.latencies: list[float] = []
+        self.stats_since   = time.perf_counter()
+
+    # ------------------------------------------------------------------
+    async def run(self, stop: asyncio.Event) -> None:
+        try:
+            async with ws_connect(self.uri, max_queue=None) as ws:
+                await ws.send(encode({"type": MSG_JOIN, "player_name": self.name}))
+                welcome = decode(await asyncio.wait_for(ws.recv(), timeout=10.0))
+                if welcome.get("type") != MSG_WELCOME:
+                    self.error = welcome.get("reason", "refused")
+                    return
+                self.player_id = welcome["player_id"]
+                sender = asyncio.create_task(self._send_loop(ws, stop))
+                try:
+                    await self._recv_loop(ws, stop)
+                finally:
+                    sender.cancel()
+        except Exception as e:   # connexion refusée, serveur arrêté…
+            self.error = self.error or str(e)
+
+    async def _recv_loop(self, ws, stop: asyncio.Event) -> None:
+        while not stop.is_set():
+            try:
+                raw = await asyncio.wait_for(ws.recv(), timeout=0.5)
+            except asyncio.TimeoutError:
+                continue
+            now = time.perf_counter()
+            self.bytes_in += len(raw)
+            msg = decode(raw)
+            mtype = msg.get("type")
+            if mtype == MSG_GAME_STATE:
+                self._playing = True
+                self.snapshots += 1
+                self.arrivals.append(now)
+                self._on_snapshot(msg, now)
+            elif mtype == MSG_LOBBY_STATE:
+                self._playing = False
+                players = msg.get("players", [])
+                me_host = any(p["player_id"] == self.player_id and p.get("is_host")
+                              for p in players)
+                if me_host and len(players) >= self.room_size:
+                    await ws.send(encode({"type": "start_game_req"}))
+            elif mtype == MSG_START_GAME:
+                self._playing = True
+
+    def _on_snapshot(self, msg: dict, now: float) -> None:
+        me = next((p for p in msg.get("players", [])
+                   if p.get("player_id") == self.player_id), None)
+        if me is None:
+            return
+        self._pos = (me["x"], me["y"])
+        acked = me.get("input_tick", 0)
+        if acked > self._acked_tick:
+            sent = self._sent_at.pop(acked, None)
+            if sent is not None:
+                self.latencies.append((now - sent) * 1000.0)
+            for t in [t for t in self._sent_at if t <= acked]:
+                del self._sent_at[t]
+            self._acked_tick = acked
+
+        enemies = msg.get("enemies", [])
+        if enemies:
+            px, py = self._pos
+            tgt = min(enemies, key=lambda e: (e["x"] - px) ** 2 + (e["y"] - py) ** 2)
+            self._aim = math.degrees(math.atan2(tgt["y"] - py, tgt["x"] - px))
+
+    async def _send_loop(self, ws, stop: asyncio.Event) -> None:
+        next_t = time.perf_counter()
+        while not stop.is_set():
+            next_t += self.input_dt
+            await asyncio.sleep(max(0.0, next_t - time.perf_counter()))
+            if not self._playing:
+                await ws.send(encode({"type": "ping"}))
+                await asyncio.sleep(0.5)
+                next_t = time.perf_counter()
+                continue
+
+            self._move_timer -= self.input_dt
+            if self._move_timer <= 0:
+                self._move = (self.rng.choice((-1.0, 0.0, 1.0)),
+                              self.rng.choice((-1.0, 0.0, 1.0)))
+                self._move_timer = self.rng.uniform(1.0, 2.0)
+                if self.rng.random() < 0.1:
+                    self._weapon_idx = self.rng.randrange(3)   # pas la grenade
+            self._aim += self.rng.uniform(-4.0, 4.0)
+
+            self._tick += 1
+            self._sent_at[self._tick] = time.perf_counter()
+            if len(self._sent_at) > 4 * FPS:   # inputs jamais appliqués (joueur à terre)
+                del self._sent_at[min(self._sent_at)]
+            await ws.send(encode(make_input(
+                player_id  = self.player_id,
+                tick       = self._tick,
+                dx         = self._move[0],
+                dy         = self._move[1],
+                aim_angle  = self._aim,
+                shooting   = True,
+                weapon_idx = self._weapon_idx,
+                revive_held= False,
+            )))
+
+    # ------------------------------------------------------------------
+    def stats(self) -> dict:
+        elapsed = max(1e-6, time.perf_counter() - self.stats_since)
+        gaps = [(b - a) * 1000.0 for a, b in zip(self.arrivals, self.arrivals[1:])]
+        return {
+            "bytes_per_s":   self.bytes_in / elapsed,
+            "snapshots":     self.snapshots,
+            "gaps_ms":       gaps,
+            "latencies_ms":  self.latencies,
+        }
+
+
+# ====================================================================== salles
+
+class Room:
+    """Un processus server_headless.py local, ou un serveur externe déjà lancé."""
+
+    def __init__(self, host: str, port: int, status_port: int,
+                 max_players: int, external: bool = False, log_path: str = ""):
+        self.host        = host
+        self.port        = port
+        self.status_port = status_port
+        self.max_players = max_players
+        self.external    = external
+        self.log_path    = log_path
+        self.proc: subprocess.Popen | None = None
+        self._log = None                           # journal du processus, fermé par stop()
+        self._cpu_mark: tuple[float, float] | None = None
+
+    def start(self, timeout: float = 15.0) -> None:
+        if not self.external:
+            if self.log_path:
+                self._log = open(self.log_path, "w")
+            self.proc = subprocess.Popen(
+                [sys.executable, "server_headless.py",
+                 "--port", str(self.port), "--status-port", str(self.status_port),
+                 "--max-players", str(self.max_players)],
+                cwd=_ROOT, stdout=self._log or subprocess.DEVNULL, stderr=subprocess.STDOUT,
+            )
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.status() is not None:
+                return
+            time.sleep(0.2)
+        raise RuntimeError(f"serveur {self.host}:{self.port} injoignable")
+
+    def stop(self) -> None:
+        if self.proc is not None:
+            self.proc.terminate()
+            try:
+                self.proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+                self.proc.wait()
+            self.proc = None
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def status(self) -> dict | None:
+        try:
+            url = f"http://{self.host}:{self.status_port}/status"
+            with urllib.request.urlopen(url, timeout=1.0) as r:
+                return json.loads(r.read().decode())
+        except Exception:
+            return None
+
+    # ---- CPU du processus serveur (Linux uniquement) ----
+    def _cpu_seconds(self) -> float | None:
+        if self.proc is None:
+            return None
+        try:
+            with open(f"/proc/{self.proc.pid}/stat") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+            return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+        except (OSError, ValueError, IndexError):
+            return None
+
+    def cpu_mark(self) -> None:
+        cpu = self._cpu_seconds()
+        self._cpu_mark = (cpu, time.perf_counter()) if cpu is not None else None
+
+    def cpu_fraction(self) -> float | None:
+        """Fraction d'un cœur consommée depuis cpu_mark()."""
+        cpu = self._cpu_seconds()
+        if cpu is None or self._cpu_mark is None:
+            return None
+        return (cpu - self._cpu_mark[0]) / max(1e-6, time.perf_counter() - self._cpu_mark[1])
+
+
+# ====================================================================== mesure
+
+async def _drive(rooms: list[Room], players_per_room: int, warmup: float,
+                 duration: float, input_rate: float, seed: int,
+                 sample_every: float = 0.0, on_sample=None) -> list[Bot]:
+    stop = asyncio.Event()
+    bots = []
+    for ri, room in enumerate(rooms):
+        for i in range(players_per_room):
+            bots.append(Bot(room.host, room.port, f"Bot{ri}_{i}", players_per_room,
+                            seed=seed + ri * 1000 + i, input_rate=input_rate))
+    tasks = []
+    for bot in bots:
+        tasks.append(asyncio.create_task(bot.run(stop)))
+        await asyncio.sleep(0.05)   # connexions échelonnées (ordre hôte stable)
+
+    await asyncio.sleep(warmup)
+    for bot in bots:
+        bot.reset_stats()
+    for room in rooms:
+        room.cpu_mark()
+
+    if sample_every > 0 and on_sample is not None:
+        t_end = time.perf_counter() + duration
+        while time.perf_counter() < t_end:
+            await asyncio.sleep(min(sample_every, max(0.0, t_end - time.perf_counter())))
+            on_sample(bots)
+    else:
+        await asyncio.sleep(duration)
+
+    stop.set()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return bots
+
+
+def _summarize(rooms: list[Room], bots: list[Bot], players_per_room: int,
+               duration: float, budget_ms: float) -> dict:
+    room_rows = []
+    for room in rooms:
+        st  = room.status() or {}
+        wd  = st.get("watchdog", {})
+        cpu = room.cpu_fraction()
+        room_rows.append({
+            "port":        room.port,
+            "state":       st.get("state", "?"),
+            "wave":        st.get("wave", 0),
+            "enemies":     st.get("enemies_remaining", 0),
+            "avg_tick_ms": wd.get("avg_tick_ms", 0.0),
+            "p99_tick_ms": wd.get("p99_tick_ms", 0.0),
+            "cpu_core":    round(cpu, 3) if cpu is not None else None,
+        })
+        if cpu is not None:
+            room.cpu_mark()
+
+    gaps, lat, bps = [], [], []
+    for bot in bots:
+        s = bot.stats()
+        gaps.extend(s["gaps_ms"])
+        lat.extend(s["latencies_ms"])
+        bps.append(s["bytes_per_s"])
+    errors = sorted({b.error for b in bots if b.error})
+
+    p99_tick = max((r["p99_tick_ms"] for r in room_rows), default=0.0)
+    cpus = [r["cpu_core"] for r in room_rows if r["cpu_core"] is not None]
+    interval = 1000.0 / NET_BROADCAST_RATE
+    return {
+        "rooms":            len(rooms),
+        "players_per_room": players_per_room,
+        "duration_s":       duration,
+        "connected":        sum(1 for b in bots if b.player_id is not None),
+        "errors":           errors,
+        "room_stats":       room_rows,
+        "tick_p99_ms":      round(p99_tick, 2),
+        "tick_avg_ms":      round(statistics.mean(r["avg_tick_ms"] for r in room_rows), 2)
+                            if room_rows else 0.0,
+        "cpu_per_room":     round(statistics.mean(cpus), 3) if cpus else None,
+        "snapshot_gap_ms":  {"mean": round(statistics.mean(gaps), 2) if gaps else 0.0,
+                             "p99":  round(_percentile(gaps, 0.99), 2),
+                             "jitter": round(statistics.pstdev(gaps), 2) if gaps else 0.0,
+                             "target": round(interval, 2)},
+        "bytes_per_s_per_client": round(statistics.mean(bps)) if bps else 0,
+        "input_latency_ms": {"p50": round(_percentile(lat, 0.50), 2),
+                             "p99": round(_percentile(lat, 0.99), 2),
+                             "samples": len(lat)},
+        "ok": (not errors and p99_tick <= budget_ms
+               and all(b.player_id is not None for b in bots)),
+    }
+
+
+def _make_rooms(count: int, players: int, base_port: int, base_status: int,
+                external: list[tuple[str, int, int]], log_dir: str) -> list[Room]:
+    if external:
+        return [Room(h, p, s, players, external=True) for h, p, s in external[:count]]
+    return [Room("127.0.0.1", base_port + i, base_status + i, players,
+                 log_path=os.path.join(log_dir, f"server_{base_port + i}.log"))
+            for i in range(count)]
+
+
+def measure(rooms_n: int, players: int, args, log_dir: str,
+            sample_every: float = 0.0, on_sample=None) -> dict:
+    rooms = _make_rooms(rooms_n, players, args.base_port, args.base_status_port,
+                        args.external, log_dir)
+    try:
+        for room in rooms:
+            room.start()
+        bots = asyncio.run(_drive(rooms, players, args.warmup, args.duration,
+                                  args.input_rate, args.seed, sample_every,
+                                  (lambda b: on_sample(rooms, b)) if on_sample else None))
+        proc_cpu = time.process_time()
+        summary = _summarize(rooms, bots, players, args.duration, args.tick_budget)
+        summary["loadgen_cpu_s"] = round(proc_cpu, 1)
+        return summary
+    finally:
+        for room in rooms:
+            room.stop()
+
+
+# ====================================================================== rapport
+
+def _report_md(report: dict) -> str:
+    lines = [f"# Rapport de charge — {report['date']}", "",
+             f"- Cœurs : {report['cpu_count']}  |  budget tick : {report['tick_budget_ms']:.1f} ms"
+             f"  |  entrées bots : {report['input_rate']:.0f}/s",
+             f"- Mesure : {report['duration_s']:.0f} s après {report['warmup_s']:.0f} s de chauffe", ""]
+    lines += ["| salles | joueurs/salle | tick moy (ms) | tick p99 (ms) | CPU/salle | "
+              "gigue snapshots (ms) | p99 écart (ms) | o/s par client | latence p50/p99 (ms) | OK |",
+              "|---|---|---|---|---|---|---|---|---|---|"]
+    for r in report["runs"]:
+        cpu = f"{r['cpu_per_room']:.2f}" if r["cpu_per_room"] is not None else "—"
+        lines.append(
+            f"| {r['rooms']} | {r['players_per_room']} | {r['tick_avg_ms']:.2f} | "
+            f"{r['tick_p99_ms']:.2f} | {cpu} | {r['snapshot_gap_ms']['jitter']:.2f} | "
+            f"{r['snapshot_gap_ms']['p99']:.2f} | {r['bytes_per_s_per_client']} | "
+            f"{r['input_latency_ms']['p50']:.1f} / {r['input_latency_ms']['p99']:.1f} | "
+            f"{'oui' if r['ok'] else 'NON'} |")
+    lines += ["", "## Capacité", ""]
+    for key, label in (("max_players_per_room", "Joueurs max par salle"),
+                       ("max_rooms", "Salles simultanées max"),
+                       ("rooms_per_core_est", "Salles par cœur (estimation CPU)"),
+                       ("worst_tick_p99_ms", "Pire p99 de tick sur la durée (ms)")):
+        if key in report["capacity"]:
+            val = report["capacity"][key]
+            lines.append(f"- {label} : {val if val is not None else '—'}")
+    for r in report["runs"]:
+        if r["errors"]:
+            lines.append(f"- Erreurs ({r['rooms']}x{r['players_per_room']}) : {', '.join(r['errors'])}")
+    return "\n".join(lines) + "\n"
+
+
+def _write_report(report: dict, prefix: str) -> str:
+    os.makedirs(_RESULTS, exist_ok=True)
+    base = os.path.join(_RESULTS, f"{prefix}_{time.strftime('%Y%m%d-%H%M%S')}")
+    with open(base + ".json", "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    with open(base + ".md", "w", encoding="utf-8") as f:
+        f.write(_report_md(report))
+    return base
+
+
+def _report_header(args) -> dict:
+    return {
+        "date":           time.strftime("%Y-%m-%d %H:%M:%S"),
+        "cpu_count":      os.cpu_count(),
+        "tick_budget_ms": args.tick_budget,
+        "input_rate":     args.input_rate,
+        "duration_s":     args.duration,
+        "warmup_s":       args.warmup,
+        "runs":           [],
+        "capacity":       {},
+    }
+
+
+def _print_run(r: dict) -> None:
+    cpu = f"{r['cpu_per_room']:.2f}" if r["cpu_per_room"] is not None else "—"
+    print(f"[charge] {r['rooms']} salle(s) x {r['players_per_room']} joueurs : "
+          f"tick p99 {r['tick_p99_ms']:.2f} ms, CPU/salle {cpu}, "
+          f"gigue {r['snapshot_gap_ms']['jitter']:.2f} ms, "
+          f"{r['bytes_per_s_per_client']} o/s/client, "
+          f"latence p99 {r['input_latency_ms']['p99']:.1f} ms → {'OK' if r['ok'] else 'ÉCHEC'}")
+
+
+def cmd_sweep(args) -> None:
+    report = _report_header(args)
+    log_dir = os.path.join(_RESULTS, "logs")
+    os.makedirs(log_dir, exist_ok=True)
+
+    best_players = None
+    for n in args.players:
+        r = measure(1, n, args, log_dir)
+        report["runs"].append(r)
+        _print_run(r)
+        if not r["ok"]:
+            break
+        best_players = n
+
+    best_rooms = None
+    cpus = []
+    if not args.external:
+        for k in args.rooms:
+            r = measure(k, args.room_players, args, log_dir)
+            report["runs"].append(r)
+            _print_run(r)
+            if r["cpu_per_room"]:
+                cpus.append(r["cpu_per_room"])
+            if not r["ok"]:
+                break
+            best_rooms = k
+
+    report["capacity"] = {
+        "max_players_per_room": best_players,
+        "max_rooms":            best_rooms,
+        "rooms_per_core_est":   round(1.0 / max(cpus), 2) if cpus else None,
+    }
+    base = _write_report(report, "loadgen")
+    print(f"[charge] Rapport → {base}.md / .json")
+
+
+def cmd_soak(args) -> None:
+    report = _report_header(args)
+    report["samples"] = []
+    report["duration_s"] = args.sample
+    log_dir = os.path.join(_RESULTS, "logs")
+    os.makedirs(log_dir, exist_ok=True)
+    t0 = time.perf_counter()
+
+    def on_sample(rooms, bots):
+        s = _summarize(rooms, bots, args.players[0], args.sample, args.tick_budget)
+        s["t_s"] = round(time.perf_counter() - t0, 1)
+        report["samples"].append(s)
+        for bot in bots:
+            bot.reset_stats()
+        print(f"[soak] t={s['t_s']:.0f}s vague {s['room_stats'][0]['wave']} "
+              f"tick p99 {s['tick_p99_ms']:.2f} ms, latence p99 "
+              f"{s['input_latency_ms']['p99']:.1f} ms")
+
+    measure(args.rooms[0], args.players[0], args, log_dir,
+            sample_every=args.sample, on_sample=on_sample)
+    report["runs"] = report.pop("samples")   # une ligne du rapport par échantillon
+    worst = max(report["runs"], key=lambda s: s["tick_p99_ms"], default=None)
+    report["capacity"] = {"worst_tick_p99_ms": worst["tick_p99_ms"] if worst else None}
+    base = _write_report(report, "soak")
+    print(f"[soak] Rapport → {base}.md / .json")
+
+
+def _int_list(text: str) -> list[int]:
+    return [int(x) for x in text.split(",") if x.strip()]
+
+
+def _external(text: str) -> tuple[str, int, int]:
+    host, port, status = text.rsplit(":", 2)
+    return host, int(port), int(status)
+
+
+def main() -> int:
+    if ws_connect is None:
+        print("[charge] Le paquet websockets est requis (pip install -r requirements.txt).")
+        return 1
+    parser = argparse.ArgumentParser(prog="python -m bench.loadgen",
+                                     description="Bots de charge pour DedicatedServer")
+    parser.add_argument("cmd", choices=("sweep", "soak"))
+    parser.add_argument("--players", type=_int_list, default=[1, 2, 4, 8],
+                        help="joueurs par salle à tester (sweep) / 1re valeur (soak)")
+    parser.add_argument("--rooms", type=_int_list, default=[1, 2, 4],
+                        help="nombres de salles à tester (sweep) / 1re valeur (soak)")
+    parser.add_argument("--room-players", type=int, default=4,
+                        help="joueurs par salle pendant le balayage des salles")
+    parser.add_argument("--duration", type=float, default=20.0, help="secondes mesurées")
+    parser.add_argument("--warmup", type=float, default=5.0, help="secondes de chauffe")
+    parser.add_argument("--sample", type=float, default=30.0,
+                        help="période d'échantillonnage du soak (s)")
+    parser.add_argument("--input-rate", type=float, default=FPS, help="inputs/s par bot")
+    parser.add_argument("--tick-budget", type=float, default=TICK_BUDGET_MS,
+                        help="p99 de tick maximal accepté (ms)")
+    parser.add_argument("--base-port", type=int, default=NET_PORT + 100)
+    parser.add_argument("--base-status-port", type=int, default=8180)
+    parser.add_argument("--external", type=_external, action="append", default=[],
+                        help="hôte:port:port_status d'un serveur déjà lancé (répétable)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    if args.cmd == "sweep":
+        cmd_sweep(args)
+    else:
+        cmd_soak(args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+"""maps.py — Cartes générées pour les benchmarks (déterministes par graine).
+
+Mêmes dimensions que MAP_DATA (MAP_COLS x MAP_ROWS) : move_and_collide et la
+caméra bornent les positions à MAP_W x MAP_H.
+"""
+import random
+
+from settings import (
+    MAP_COLS, MAP_ROWS, TILE_GROUND, TILE_WALL, TILE_SANDBAG, TILE_BUNKER,
+    TILE_DIRT, SOLID_TILES,
+)
+
+
+def generate_map(seed: int, density: float = 0.12,
+                 cols: int = MAP_COLS, rows: int = MAP_ROWS) -> list[list[int]]:
+    """Carte bordée de murs avec segments de murs, sacs de sable et bunkers.
+
+    density ≈ fraction de tuiles intérieures solides visée.
+    """
+    rng = random.Random(seed)
+    data = [[TILE_GROUND] * cols for _ in range(rows)]
+    for c in range(cols):
+        data[0][c] = data[rows - 1][c] = TILE_WALL
+    for r in range(rows):
+        data[r][0] = data[r][cols - 1] = TILE_WALL
+
+    target = int((cols - 2) * (rows - 2) * density)
+    placed = 0
+    while placed < target:
+        tid = rng.choice((TILE_WALL, TILE_WALL, TILE_SANDBAG, TILE_BUNKER))
+        length = rng.randint(2, 7)
+        horizontal = rng.random() < 0.5
+        c, r = rng.randint(1, cols - 2), rng.randint(1, rows - 2)
+        for _ in range(length):
+            if not (1 <= c < cols - 1 and 1 <= r < rows - 1):
+                break
+            if data[r][c] == TILE_GROUND:
+                data[r][c] = tid
+                placed += 1
+            if horizontal:
+                c += 1
+            else:
+                r += 1
+
+    # Quelques cratères décoratifs (non solides)
+    for _ in range(cols * rows // 40):
+        c, r = rng.randint(1, cols - 2), rng.randint(1, rows - 2)
+        if data[r][c] == TILE_GROUND:
+            data[r][c] = TILE_DIRT
+    return data
+
+
+def walkable_tiles(data: list[list[int]]) -> list[tuple[int, int]]:
+    """(col, row) de toutes les tuiles praticables."""
+    return [(c, r)
+            for r, row in enumerate(data)
+            for c, tid in enumerate(row)
+            if tid not in SOLID_TILES]
+
+
+# Cartes de référence : (nom, graine, densité)
+GENERATED_MAPS = (
+    ("gen_sparse", 101, 0.08),
+    ("gen_dense",  202, 0.22),
+)
@@ -0,0 +1,112 @@
+"""runner.py — Chronométrage des cas et comparaison avec la référence."""
+import json
+import os
+import platform
+import statistics
+import time
+
+import pygame
+
+MIN_BATCH_S = 0.05   # durée minimale d'un lot de mesures (calibrage)
+
+
+def time_case(setup, repeat: int = 5) -> dict:
+    """Chronométrer un cas : calibrage puis `repeat` lots, temps par appel en µs.
+
+    Un cas peut renvoyer (op, n, counters) : counters() donne des compteurs
+    cumulés ({nom: valeur}), rapportés par appel sur une exécution de op."""
+    op, n, *extra = setup()
+    op()   # échauffement (caches, imports paresseux)
+    counts = {}
+    if extra:
+        before = extra[0]()
+        op()
+        after = extra[0]()
+        counts = {k: round((after[k] - before[k]) / n, 2) for k in after}
+
+    loops = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            op()
+        elapsed = time.perf_counter() - t0
+        if elapsed >= MIN_BATCH_S:
+            break
+        loops *= 2
+
+    per_call = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            op()
+        per_call.append((time.perf_counter() - t0) / (loops * n) * 1e6)
+
+    res = {
+        "median_us": round(statistics.median(per_call), 3),
+        "min_us":    round(min(per_call), 3),
+        "calls":     loops * n * repeat,
+    }
+    if counts:
+        res["counters"] = counts
+    return res
+
+
+def run(cases: dict, pattern: str = "", repeat: int = 5) -> dict:
+    results = {}
+    for name, setup in cases.items():
+        if pattern and pattern not in name:
+            continue
+        res = time_case(setup, repeat)
+        results[name] = res
+        counters = "".join(f"  {k} {v:g}/appel" for k, v in res.get("counters", {}).items())
+        print(f"  {name:<38} {res['median_us']:>12.2f} µs  (min {res['min_us']:.2f}){counters}")
+    return {
+        "meta": {
+            "date":     time.strftime("%Y-%m-%d %H:%M:%S"),
+            "python":   platform.python_version(),
+            "pygame":   pygame.version.ver,
+            "platform": platform.platform(),
+            "machine":  platform.machine(),
+            "repeat":   repeat,
+        },
+        "results": results,
+    }
+
+
+def save(data: dict, path: str) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def load(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(current: dict, baseline: dict,
+            threshold: float) -> tuple[list[str], list[str]]:
+    """Afficher le tableau comparatif. Renvoie (noms en régression : médiane >
+    référence × (1 + threshold), noms mesurés absents de la référence)."""
+    cur, ref = current["results"], baseline["results"]
+    regressions, missing = [], []
+    print(f"  {'cas':<38} {'référence':>12} {'actuel':>12}  ratio")
+    for name in sorted(set(cur) | set(ref)):
+        if name not in ref:
+            print(f"  {name:<38} {'—':>12} {cur[name]['median_us']:>12.2f}  SANS RÉFÉRENCE")
+            missing.append(name)
+            continue
+        if name not in cur:
+            print(f"  {name:<38} {ref[name]['median_us']:>12.2f} {'—':>12}  (absent)")
+            continue
+        ratio = cur[name]["median_us"] / max(ref[name]["median_us"], 1e-9)
+        flag = ""
+        if ratio > 1.0 + threshold:
+            flag = "  RÉGRESSION"
+            regressions.append(name)
+        elif ratio < 1.0 - threshold:
+            flag = "  amélioration"
+        print(f"  {name:<38} {ref[name]['median_us']:>12.2f} "
+              f"{cur[name]['median_us']:>12.2f}  x{ratio:.2f}{flag}")
+    return regressions, missing
@@ -2,6 +2,7 @@
 import pygame
 import math
 from settings import TILE_SIZE, COL_BULLET_P, COL_BULLET_E, SUPPRESSION_DIST, POINTS_HIT
+from game.render.sprite_atlas import SPRITES
 
 
 def _make_bullet_surf(color: tuple, length: int = 8, width: int = 3) -> pygame.Surface:
@@ -10,6 +11,28 @@ def _make_bullet_surf(color: tuple, length: int = 8, width: int = 3) -> pygame.S
     return surf
 
 
+# Couleur des balles joueur selon l'arme (COL_BULLET_P sinon)
+_WEAPON_BULLET_COLORS = {
+    "pistol": (255, 230, 60),    # jaune dore
+    "rifle":  (220, 235, 255),   # blanc bleu acier
+    "smg":    (255, 145, 30),    # orange
+}
+
+
+def bullet_sprite(weapon: str, owner: str, angle: float) -> pygame.Surface:
+    """Sprite pivote d'une balle (couleur et forme selon l'arme et le tireur)."""
+    if owner == "player":
+        color = _WEAPON_BULLET_COLORS.get(weapon, COL_BULLET_P)
+    else:
+        color = COL_BULLET_E
+    # Rifle : balle allongee (9x2), autres : compacte (5x3)
+    if weapon == "rifle" and owner == "player":
+        return SPRITES.rotated("bullet_long", color, angle,
+                               lambda: _make_bullet_surf(color, 9, 2))
+    return SPRITES.rotated("bullet", color, angle,
+                           lambda: _make_bullet_surf(color, 5, 3))
+
+
 class Bullet(pygame.sprite.Sprite):
     def __init__(self, x: float, y: float,
                  vel_x: float, vel_y: float,
@@ -28,80 +51,82 @@ class Bullet(pygame.sprite.Sprite):
         self.max_range = bullet_range
         self.traveled  = 0.0
 
-        # Couleur et forme selon l'arme
-        if owner == "player":
-            if weapon == "pistol":
-                color = (255, 230, 60)    # jaune dore
-            elif weapon == "rifle":
-                color = (220, 235, 255)   # blanc bleu acier
-            elif weapon == "smg":
-                color = (255, 145, 30)    # orange
-            else:
-                color = COL_BULLET_P
-        else:
-            color = COL_BULLET_E
-
         angle = math.degrees(math.atan2(-vel_y, vel_x))
-        # Rifle : balle allongee (9x2), autres : compacte (5x3)
-        if weapon == "rifle" and owner == "player":
-            base_surf = _make_bullet_surf(color, length=9, width=2)
-        else:
-            base_surf = _make_bullet_surf(color, length=5, width=3)
-        self._surf = pygame.transform.rotate(base_surf, angle)
+        self._surf = bullet_sprite(weapon, owner, angle)
         self.image = self._surf
         self.rect  = self.image.get_rect(center=(int(x), int(y)))
 
     def update(self, dt: float, tilemap, enemy_group=None, players=None):
+        """Balayage continu du pas (segment pos -> pos + velocity * dt) : murs,
+        cibles et fin de portee sont detectes le long du trajet, le resultat
+        ne depend pas de la frequence de tick."""
+        from game.systems.collision import sweep_tiles, sweep_rect
         players_list = players or []
 
-        move = self.velocity * dt
-        self.pos += move
-        self.traveled += move.length()
+        start = self.pos
+        move  = self.velocity * dt
+        end   = start + move
+        step  = move.length()
+
+        # Le pas s'arrete au premier evenement : mur, cible ou fin de portee
+        t_stop = 1.0
+        if step > 0 and self.traveled + step >= self.max_range:
+            t_stop = max(0.0, (self.max_range - self.traveled) / step)
+        wall = sweep_tiles(start, end, tilemap)
+        if wall is not None and wall[0] <= t_stop:
+            t_stop = wall[0]
+        else:
+            wall = None
+
+        if self.owner == "player":
+            targets = enemy_group or ()
+        else:
+            targets = [p for p in players_list if getattr(p, "state", "alive") == "alive"]
+        hit, t_hit = None, t_stop
+        if targets:
+            # Cible touchee la plus tot sur le segment, avant le mur (a egalite, le mur)
+            w, h = self.rect.size
+            box = pygame.Rect(min(start.x, end.x), min(start.y, end.y),
+                              abs(move.x) + 1, abs(move.y) + 1).inflate(w, h)
+            for target in targets:
+                if not box.colliderect(target.rect):
+                    continue
+                t = sweep_rect(start, end, target.rect.inflate(w, h))
+                if t is not None and (t < t_hit or (hit is None and wall is None and t == t_hit)):
+                    hit, t_hit = target, t
+
+        t = t_hit if hit is not None else t_stop
+        self.pos = start + move * t
+        self.traveled += step * t
         self.rect.center = (int(self.pos.x), int(self.pos.y))
 
-        # Collision tuile
-        from game.systems.collision import bullet_hits_tile
-        if bullet_hits_tile(self, tilemap):
+        if hit is not None:
+            if self.owner == "player":
+                self._hit_enemy(hit, enemy_group, players_list)
+            else:
+                hit.take_damage(self.damage)
             self.kill()
-            return
-
-        # Hors portee
-        if self.traveled >= self.max_range:
+        elif wall is not None or self.traveled >= self.max_range:
             self.kill()
-            return
-
-        # Collision avec ennemis (balle joueur)
-        if self.owner == "player" and enemy_group:
-            for enemy in enemy_group:
-                if self.rect.colliderect(enemy.rect):
-                    enemy.take_damage(self.damage)
-                    # Score : chercher le joueur proprietaire
-                    if players_list:
-                        owner_player = next(
-                            (p for p in players_list
-                             if getattr(p, "player_id", -1) == self.owner_id),
-                            players_list[0] if players_list else None
-                        )
-                        if owner_player and owner_player.state == "alive":
-                            owner_player.add_score(POINTS_HIT)
-                            owner_player.add_score_popup(f"+{POINTS_HIT}", self.pos)
-                    # Suppression ennemis proches
-                    for e in enemy_group:
-                        if e != enemy:
-                            d = (pygame.Vector2(e.rect.center) - self.pos).length()
-                            if d < SUPPRESSION_DIST * 3:
-                                e.suppression_timer = max(e.suppression_timer, 1.2)
-                    self.kill()
-                    return
-
-        # Collision avec joueurs (balle ennemi)
-        elif self.owner == "enemy" and players_list:
-            for player in players_list:
-                if getattr(player, "state", "alive") == "alive":
-                    if self.rect.colliderect(player.rect):
-                        player.take_damage(self.damage)
-                        self.kill()
-                        return
+
+    def _hit_enemy(self, enemy, enemy_group, players_list):
+        enemy.take_damage(self.damage)
+        # Score : chercher le joueur proprietaire
+        if players_list:
+            owner_player = next(
+                (p for p in players_list
+                 if getattr(p, "player_id", -1) == self.owner_id),
+                players_list[0] if players_list else None
+            )
+            if owner_player and owner_player.state == "alive":
+                owner_player.add_score(POINTS_HIT)
+                owner_player.add_score_popup(f"+{POINTS_HIT}", self.pos)
+        # Suppression ennemis proches
+        for e in enemy_group:
+            if e != enemy:
+                d = (pygame.Vector2(e.rect.center) - self.pos).length()
+                if d < SUPPRESSION_DIST * 3:
+                    e.suppression_timer = max(e.suppression_timer, 1.2)
 
     def draw(self, surface: pygame.Surface, camera):
         sx, sy = camera.apply_pos(self.pos.x, self.pos.y)
@@ -9,9 +9,11 @@ from settings import (
 )
 from game.systems.ai import AIController, AI_SHOOT, AI_PATROL
 from game.systems.collision import move_and_collide
+from game.render.sprite_atlas import SPRITES
 
 
 _enemy_counter = itertools.count(1)   # IDs uniques globaux
+ENEMY_SPRITE_SIZES = {"soldier": 32, "officer": 26, "heavy": 40}
 
 
 def _make_enemy_surf(color: tuple, size: int = 32,
@@ -78,13 +80,30 @@ def _make_enemy_surf(color: tuple, size: int = 32,
     return surf
 
 
+def enemy_base_surf(enemy_type: str, color: tuple) -> pygame.Surface:
+    """Surface non pivotee d'un type d'ennemi, partagee via l'atlas."""
+    return SPRITES.base("enemy_" + enemy_type, color, lambda: _make_enemy_surf(
+        color, ENEMY_SPRITE_SIZES.get(enemy_type, 32), enemy_type))
+
+
 def draw_enemy_at(surface: pygame.Surface, sx: int, sy: int,
-                  base_surf: pygame.Surface, facing_angle: float,
+                  enemy_type: str, color: tuple, facing_angle: float,
                   hp: int, max_hp: int, ai_state: str):
     """Rendu partagé d'un ennemi (serveur solo et client réseau)."""
-    rotated = pygame.transform.rotate(base_surf, -facing_angle)
+    rotated = enemy_sprite(enemy_type, color, facing_angle)
     surface.blit(rotated, rotated.get_rect(center=(sx, sy)))
+    draw_enemy_overlay(surface, sx, sy, hp, max_hp, ai_state)
+
+
+def enemy_sprite(enemy_type: str, color: tuple, facing_angle: float) -> pygame.Surface:
+    """Sprite pivote d'un ennemi (pour SpriteBatch.add_centered)."""
+    return SPRITES.rotated("enemy_" + enemy_type, color, -facing_angle,
+                           lambda: enemy_base_surf(enemy_type, color))
+
 
+def draw_enemy_overlay(surface: pygame.Surface, sx: int, sy: int,
+                       hp: int, max_hp: int, ai_state: str):
+    """Barre de vie et indicateur d'etat IA, dessines par-dessus le sprite."""
     # Barre de vie
     bar_w, bar_h = 28, 4
     bx = sx - bar_w // 2
@@ -108,8 +127,9 @@ def draw_enemy_at(surface: pygame.Surface, sx: int, sy: int,
 
 class Enemy(pygame.sprite.Sprite):
     def __init__(self, x: float, y: float, enemy_type: str,
-                 pathfinder, players, tilemap, groups=()):
+                 pathfinder, players, tilemap, groups=(), rng=None):
         super().__init__(*groups)
+        self.rng        = rng if rng is not None else random   # flux de la partie
         self.enemy_id   = next(_enemy_counter)
         self.enemy_type = enemy_type
         data            = ENEMY_TYPES[enemy_type]
@@ -126,19 +146,17 @@ class Enemy(pygame.sprite.Sprite):
         self.color           = data["color"]
 
         self.velocity          = pygame.Vector2(0, 0)
-        self.facing_angle      = random.uniform(0, 360)
-        self.fire_timer        = random.uniform(0, self.fire_rate)
+        self.facing_angle      = self.rng.uniform(0, 360)
+        self.fire_timer        = self.rng.uniform(0, self.fire_rate)
         self.suppression_timer = 0.0
         self.alive             = True
 
         self.players = players
 
         # IA
-        self.ai = AIController(self, self.players, tilemap, pathfinder)
+        self.ai = AIController(self, self.players, tilemap, pathfinder, rng=self.rng)
 
-        _size_map = {"soldier": 32, "officer": 26, "heavy": 40}
-        _size = _size_map.get(enemy_type, 32)
-        self._base_surf = _make_enemy_surf(self.color, _size, enemy_type)
+        self._base_surf = enemy_base_surf(enemy_type, self.color)
         self.image      = self._base_surf
         self.rect       = self.image.get_rect(center=(int(x), int(y)))
 
@@ -194,7 +212,7 @@ class Enemy(pygame.sprite.Sprite):
         dy = p_pos.y - self.pos.y
         base_angle = math.atan2(dy, dx)
         spread_rad = math.radians(ENEMY_SPREAD)
-        angle = base_angle + random.uniform(-spread_rad, spread_rad)
+        angle = base_angle + self.rng.uniform(-spread_rad, spread_rad)
 
         Bullet(
             self.pos.x, self.pos.y,
@@ -220,21 +238,21 @@ class Enemy(pygame.sprite.Sprite):
     def draw(self, surface: pygame.Surface, camera):
         sx, sy = camera.apply_pos(self.pos.x, self.pos.y)
         draw_enemy_at(surface, int(sx), int(sy),
-                      self._base_surf, self.facing_angle,
+                      self.enemy_type, self.color, self.facing_angle,
                       self.hp, self.max_hp, self.ai.state)
 
 
 # ---- Sous-classes ---------------------------------------------------
 class SoldierEnemy(Enemy):
-    def __init__(self, x, y, pathfinder, players, tilemap, groups=()):
-        super().__init__(x, y, "soldier", pathfinder, players, tilemap, groups)
+    def __init__(self, x, y, pathfinder, players, tilemap, groups=(), rng=None):
+        super().__init__(x, y, "soldier", pathfinder, players, tilemap, groups, rng)
 
 
 class OfficerEnemy(Enemy):
-    def __init__(self, x, y, pathfinder, players, tilemap, groups=()):
-        super().__init__(x, y, "officer", pathfinder, players, tilemap, groups)
+    def __init__(self, x, y, pathfinder, players, tilemap, groups=(), rng=None):
+        super().__init__(x, y, "officer", pathfinder, players, tilemap, groups, rng)
 
 
 class HeavyEnemy(Enemy):
-    def __init__(self, x, y, pathfinder, players, tilemap, groups=()):
-        super().__init__(x, y, "heavy", pathfinder, players, tilemap, groups)
+    def __init__(self, x, y, pathfinder, players, tilemap, groups=(), rng=None):
+        super().__init__(x, y, "heavy", pathfinder, players, tilemap, groups, rng)
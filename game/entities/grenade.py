@@ -3,20 +3,24 @@ import pygame
 import math
 from settings import (
     TILE_SIZE, GRENADE_FRICTION, GRENADE_BOUNCE_DAMP,
-    COL_GRENADE, COL_EXPLOSION, COL_YELLOW, COL_BLACK,
+    COL_GRENADE, COL_EXPLOSION, COL_YELLOW, COL_BLACK, EXPL_CACHE_MAX_BYTES,
 )
+from game.systems.collision import sweep_tiles
+from game.render.surface_cache import SurfaceCache
 
 
-_EXPL_SURF_CACHE: dict = {}   # {(blast_radius, frame_idx): Surface}
+_MAX_BOUNCES_PER_STEP = 4     # rebonds resolus dans un meme pas (coin)
+_BOUNCE_BACKOFF       = 0.01  # px laisses entre la grenade et le mur touche
+
+_EXPL_SURF_CACHE = SurfaceCache("explosions", EXPL_CACHE_MAX_BYTES)   # {(blast_radius, frame_idx)}
 _EXPL_FRAMES = 6
 
 
-def draw_explosion_at(surface: pygame.Surface, esx: int, esy: int,
-                      blast_radius: int, progress: float):
-    """Rendu partagé d'une explosion (serveur solo et client réseau)."""
-    frame_idx = min(_EXPL_FRAMES - 1, int(progress * _EXPL_FRAMES))
+def explosion_frame(blast_radius: int, frame_idx: int) -> pygame.Surface:
+    """Image frame_idx (0.._EXPL_FRAMES-1) d'une explosion, partagee par rayon."""
     key = (blast_radius, frame_idx)
-    if key not in _EXPL_SURF_CACHE:
+    s = _EXPL_SURF_CACHE.get(key)
+    if s is None:
         t       = frame_idx / max(1, _EXPL_FRAMES - 1)
         cur_r   = max(4, int(blast_radius * (0.3 + 0.7 * t)))
         alpha   = int(200 * (1.0 - t))
@@ -24,10 +28,17 @@ def draw_explosion_at(surface: pygame.Surface, esx: int, esy: int,
         sz      = blast_radius * 2 + 8
         s       = pygame.Surface((sz, sz), pygame.SRCALPHA)
         cx = cy = sz // 2
-        pygame.draw.circle(s, (255, 160, 30, alpha), (cx, cy), cur_r)
+        pygame.draw.circle(s, (*COL_EXPLOSION, alpha), (cx, cy), cur_r)
         pygame.draw.circle(s, (255, 240, 150, alpha), (cx, cy), inner_r)
-        _EXPL_SURF_CACHE[key] = s
-    cached = _EXPL_SURF_CACHE[key]
+        _EXPL_SURF_CACHE.put(key, s)
+    return s
+
+
+def draw_explosion_at(surface: pygame.Surface, esx: int, esy: int,
+                      blast_radius: int, progress: float):
+    """Rendu partagé d'une explosion (serveur solo et client réseau)."""
+    frame_idx = min(_EXPL_FRAMES - 1, int(progress * _EXPL_FRAMES))
+    cached = explosion_frame(blast_radius, frame_idx)
     surface.blit(cached, (esx - cached.get_width() // 2, esy - cached.get_height() // 2))
 
 
@@ -45,25 +56,10 @@ class Explosion(pygame.sprite.Sprite):
         self._damaged     = False
 
         r = int(blast_radius)
-        self._surfs = self._build_surfs(r)
+        self._surfs = [explosion_frame(r, i) for i in range(self.FRAMES)]
         self.image  = self._surfs[0]
         self.rect   = self.image.get_rect(center=(int(x), int(y)))
 
-    def _build_surfs(self, r: int) -> list[pygame.Surface]:
-        surfs = []
-        for i in range(self.FRAMES):
-            t = i / max(1, self.FRAMES - 1)
-            cur_r = int(r * (0.3 + 0.7 * t))
-            surf = pygame.Surface((r * 2 + 4, r * 2 + 4), pygame.SRCALPHA)
-            cx, cy = r + 2, r + 2
-            # Halo externe
-            alpha = int(200 * (1 - t))
-            inner_r = max(1, cur_r - 15)
-            pygame.draw.circle(surf, (*COL_EXPLOSION, alpha), (cx, cy), cur_r)
-            pygame.draw.circle(surf, (255, 240, 150, alpha), (cx, cy), inner_r)
-            surfs.append(surf)
-        return surfs
-
     def update(self, dt: float, enemy_group=None, players=None):
         if not self._damaged:
             self._damaged = True
@@ -118,35 +114,44 @@ class Grenade(pygame.sprite.Sprite):
         self.image = surf
         self.rect  = self.image.get_rect(center=(int(x), int(y)))
 
-    def _collides_tile(self, tilemap) -> bool:
-        col = int(self.pos.x // TILE_SIZE)
-        row = int(self.pos.y // TILE_SIZE)
-        return tilemap.is_solid(col, row)
-
     def update(self, dt: float, tilemap, enemy_group=None, players=None):
-        # Friction
-        factor = GRENADE_FRICTION ** dt
-        self.velocity *= factor
-
-        # Mouvement X
-        self.pos.x += self.velocity.x * dt
-        self.rect.centerx = int(self.pos.x)
-        if self._collides_tile(tilemap):
-            self.pos.x -= self.velocity.x * dt
-            self.velocity.x *= -GRENADE_BOUNCE_DAMP
-
-        # Mouvement Y
-        self.pos.y += self.velocity.y * dt
-        self.rect.centery = int(self.pos.y)
-        if self._collides_tile(tilemap):
-            self.pos.y -= self.velocity.y * dt
-            self.velocity.y *= -GRENADE_BOUNCE_DAMP
+        self.step(dt, tilemap)
 
         # Compte a rebours
         self.fuse_timer -= dt
         if self.fuse_timer <= 0:
             self._detonate(enemy_group, players)
 
+    def step(self, dt: float, tilemap):
+        """Physique seule (friction + rebonds) : aussi rejouee par les clients
+        a partir de l'evenement d'apparition."""
+        # Friction
+        factor = GRENADE_FRICTION ** dt
+        self.velocity *= factor
+
+        # Deplacement balaye : a chaque mur traverse sur le pas, rebond sur la
+        # face franchie puis fin du pas avec la vitesse reflechie
+        remaining = dt
+        for _ in range(_MAX_BOUNCES_PER_STEP):
+            move = self.velocity * remaining
+            if move.length_squared() == 0:
+                break
+            hit = sweep_tiles(self.pos, self.pos + move, tilemap)
+            if hit is None:
+                self.pos += move
+                break
+            t, axis = hit
+            if axis is None:   # deja dans un mur : rester sur place
+                break
+            # S'arreter juste avant la face touchee
+            self.pos += move * max(0.0, t - _BOUNCE_BACKOFF / move.length())
+            if axis == "x":
+                self.velocity.x *= -GRENADE_BOUNCE_DAMP
+            else:
+                self.velocity.y *= -GRENADE_BOUNCE_DAMP
+            remaining *= 1.0 - t
+        self.rect.center = (int(self.pos.x), int(self.pos.y))
+
     def _detonate(self, enemy_group, players):
         players_list = players or []
         expl = Explosion(
@@ -3,8 +3,10 @@ import pygame
 import math
 from settings import (
     TILE_SIZE, WEAPONS, WEAPON_ORDER,
-    COL_PICKUP, COL_BLACK, COL_WHITE, COL_YELLOW,
+    COL_PICKUP, COL_BLACK, COL_WHITE, COL_YELLOW, ICON_CACHE_MAX_BYTES,
 )
+from game.render.text import render_text
+from game.render.surface_cache import SurfaceCache
 
 
 # Couleurs et formes par arme
@@ -120,6 +122,31 @@ def _make_weapon_icon(weapon_name: str, size: int = 28) -> pygame.Surface:
     return surf
 
 
+_ICONS = SurfaceCache("icons", ICON_CACHE_MAX_BYTES)   # {("icon", arme, taille) | ("pickup", arme)}
+
+
+def weapon_icon(weapon_name: str, size: int = 28) -> pygame.Surface:
+    """Icone d'arme partagee (HUD, pickups) ; ne pas la modifier."""
+    return _ICONS.get_or_make(("icon", weapon_name, size),
+                              lambda: _make_weapon_icon(weapon_name, size))
+
+
+def _make_pickup_surf(weapon_name: str) -> pygame.Surface:
+    # Fond colore + icone
+    size = 36
+    base = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(base, (*COL_YELLOW, 180), (size // 2, size // 2), size // 2)
+    pygame.draw.circle(base, (*COL_BLACK, 120), (size // 2, size // 2), size // 2, 2)
+    base.blit(weapon_icon(weapon_name, 28), (4, 4))
+    return base
+
+
+def pickup_surf(weapon_name: str) -> pygame.Surface:
+    """Sprite d'un pickup au sol (serveur solo et client reseau)."""
+    return _ICONS.get_or_make(("pickup", weapon_name),
+                              lambda: _make_pickup_surf(weapon_name))
+
+
 class WeaponPickup(pygame.sprite.Sprite):
     BOB_AMP    = 3.0   # amplitude du flottement
     BOB_SPEED  = 2.5   # cycles/s
@@ -132,16 +159,9 @@ class WeaponPickup(pygame.sprite.Sprite):
         self.ammo        = ammo if ammo >= 0 else WEAPONS[weapon_name].get("max_ammo", 1)
         self._bob_time   = 0.0
 
-        icon = _make_weapon_icon(weapon_name, 28)
-        # Fond colore
-        size = 36
-        base = pygame.Surface((size, size), pygame.SRCALPHA)
-        pygame.draw.circle(base, (*COL_YELLOW, 180), (size // 2, size // 2), size // 2)
-        pygame.draw.circle(base, (*COL_BLACK, 120), (size // 2, size // 2), size // 2, 2)
-        base.blit(icon, (4, 4))
-        self._base_surf = base
+        self._base_surf = pickup_surf(weapon_name)
 
-        self.image = base
+        self.image = self._base_surf
         self.rect  = self.image.get_rect(center=(int(x), int(y)))
 
     def update(self, dt: float):
@@ -157,5 +177,5 @@ class WeaponPickup(pygame.sprite.Sprite):
         surface.blit(self._base_surf, r)
 
         # Label au dessus
-        label = font.render(self.weapon_name.upper(), True, COL_YELLOW)
+        label = render_text(font, self.weapon_name.upper(), True, COL_YELLOW)
         surface.blit(label, (r.centerx - label.get_width() // 2, r.top - 14))
@@ -10,6 +10,8 @@ from settings import (
     TILE_SIZE, PLAYER_COLORS, DOWN_TIMEOUT, REVIVE_TIME, KEYBINDS,
 )
 from game.systems.collision import move_and_collide
+from game.render.sprite_atlas import SPRITES
+from game.render.text import get_font, render_text
 
 
 def _make_player_surf(color: tuple, size: int = 40) -> pygame.Surface:
@@ -102,7 +104,8 @@ class Player(pygame.sprite.Sprite):
         self.is_reloading      = False
         self.iframe_timer      = 0.0
 
-        self._base_surf = _make_player_surf(self.color, 40)
+        self._base_surf = SPRITES.base("player", self.color,
+                                       lambda: _make_player_surf(self.color, 40))
         self.facing_angle = 0.0
 
         self.image = self._base_surf
@@ -321,8 +324,8 @@ class Player(pygame.sprite.Sprite):
             pygame.draw.circle(surface, col, (int(sx), int(sy)), 14)
             pygame.draw.circle(surface, (255, 255, 255), (int(sx), int(sy)), 14, 2)
             # Countdown
-            font = pygame.font.SysFont("Arial", 13, bold=True)
-            txt  = font.render(f"{int(self.down_timer)}s", True, (255, 200, 50))
+            font = get_font(13, bold=True)
+            txt  = render_text(font, f"{int(self.down_timer)}s", True, (255, 200, 50))
             surface.blit(txt, (int(sx) - txt.get_width() // 2, int(sy) - 30))
             # Barre revive si en cours
             if self.revive_progress > 0:
@@ -338,14 +341,15 @@ class Player(pygame.sprite.Sprite):
             return   # N'affiche pas les joueurs definitivement morts
 
         # Rotation selon l'angle de visee
-        rotated = pygame.transform.rotate(self._base_surf, -self.facing_angle)
+        rotated = SPRITES.rotated("player", self.color, -self.facing_angle,
+                                  lambda: self._base_surf)
         r = rotated.get_rect(center=(int(sx), int(sy)))
         surface.blit(rotated, r)
 
         # Nom du joueur (en multi)
         if self.player_id > 0:
-            font = pygame.font.SysFont("Arial", 12)
-            name_surf = font.render(self.player_name, True, (220, 220, 220))
+            font = get_font(12)
+            name_surf = render_text(font, self.player_name, True, (220, 220, 220))
             surface.blit(name_surf, (int(sx) - name_surf.get_width() // 2, int(sy) - 28))
 
         # Barre de vie
@@ -7,6 +7,7 @@ from settings import (
     UPGRADE_MACHINE_COST, UPGRADE_MACHINE_MAX_LVL,
     COL_WHITE, COL_BLACK, COL_YELLOW,
 )
+from game.render.text import get_font, render_text
 
 # Couleur de la machine (définie localement pour éviter les imports circulaires)
 _COL_MACH_BASE  = (30,  40,  60)
@@ -138,9 +139,9 @@ class UpgradeMachine:
         sx, sy = int(sx), int(sy)
 
         if self._font_sm  is None:
-            self._font_sm  = pygame.font.SysFont("Arial", 11, bold=True)
+            self._font_sm  = get_font(11, bold=True)
         if self._font_med is None:
-            self._font_med = pygame.font.SysFont("Arial", 14, bold=True)
+            self._font_med = get_font(14, bold=True)
 
         # Pulsation lumineuse
         pulse = (math.sin(self._anim_t * 3.0) + 1.0) / 2.0   # 0..1
@@ -186,21 +187,21 @@ class UpgradeMachine:
             cost_col = _COL_MACH_TEXT
             cost_str = f"{UPGRADE_MACHINE_COST} pts"
 
-        cost_surf = self._font_sm.render(cost_str, True, cost_col)
+        cost_surf = render_text(self._font_sm, cost_str, True, cost_col)
         surface.blit(cost_surf,
                      (sx - cost_surf.get_width() // 2,
                       sy + self.HEIGHT // 2 + 4))
 
         # Étiquette "UPGRADE"
-        label = self._font_sm.render("UPGRADE", True, _COL_MACH_TEXT)
+        label = render_text(self._font_sm, "UPGRADE", True, _COL_MACH_TEXT)
         surface.blit(label, (sx - label.get_width() // 2, body.y - 14))
 
     def draw_hud_prompt(self, surface: pygame.Surface,
                         screen_w: int, screen_h: int, player):
         """Affiche le prompt [F] et le message de résultat en bas de l'écran."""
         if self._font_med is None:
-            self._font_med = pygame.font.SysFont("Arial", 14, bold=True)
-        font_big = pygame.font.SysFont("Arial", 20, bold=True)
+            self._font_med = get_font(14, bold=True)
+        font_big = get_font(20, bold=True)
 
         wname = player.active_weapon
         lvl   = self.get_level(wname)
@@ -217,7 +218,7 @@ class UpgradeMachine:
             pcol   = COL_YELLOW
 
         # Fond semi-transparent
-        psurf = font_big.render(prompt, True, pcol)
+        psurf = render_text(font_big, prompt, True, pcol)
         bx = screen_w // 2 - psurf.get_width() // 2 - 10
         by = screen_h - 160
         bg = pygame.Surface((psurf.get_width() + 20, psurf.get_height() + 10),
@@ -228,7 +229,7 @@ class UpgradeMachine:
 
         # Niveau actuel
         lvl_str  = f"Niveau actuel : {lvl}/{UPGRADE_MACHINE_MAX_LVL}"
-        lvl_surf = self._font_med.render(lvl_str, True, _COL_MACH_TEXT)
+        lvl_surf = render_text(self._font_med, lvl_str, True, _COL_MACH_TEXT)
         surface.blit(lvl_surf, (screen_w // 2 - lvl_surf.get_width() // 2,
                                 by + psurf.get_height() + 12))
 
@@ -238,11 +239,11 @@ class UpgradeMachine:
         if self.last_message_timer <= 0 or not self.last_message:
             return
         if self._font_med is None:
-            self._font_med = pygame.font.SysFont("Arial", 14, bold=True)
-        font = pygame.font.SysFont("Arial", 22, bold=True)
+            self._font_med = get_font(14, bold=True)
+        font = get_font(22, bold=True)
 
         alpha = min(255, int(self.last_message_timer / 3.0 * 255))
-        surf  = font.render(self.last_message, True, COL_YELLOW)
+        surf  = render_text(font, self.last_message, True, COL_YELLOW).copy()
         surf.set_alpha(alpha)
         x = screen_w // 2 - surf.get_width() // 2
         y = screen_h // 2 - 80
@@ -8,18 +8,39 @@ try:
 except ImportError:
     websockets = None
 
-from game.network.messages import MSG_JOIN, MSG_WELCOME, encode, decode
+from game.network.messages import (
+    MSG_JOIN, MSG_WELCOME, MSG_GAME_STATE, encode, decode,
+)
 from settings import NET_PORT
 
 
+WAVE_KEYS = ("wave_number", "wave_state", "wave_countdown", "enemies_remaining")
+
+
+def prepare_game_state(msg: dict) -> dict:
+    """Snapshot decode -> structures pretes pour ClientGame._apply_state
+    (fait sur le thread reseau, hors de la frame) :
+      players_by_id : {player_id: dict joueur}
+      wave_info     : champs de vague seuls"""
+    msg["players_by_id"] = {p["player_id"]: p for p in msg.get("players", [])}
+    msg["wave_info"]     = {k: msg[k] for k in WAVE_KEYS if k in msg}
+    return msg
+
+
 class GameClient:
     """
     Client WebSocket tourne dans un thread asyncio daemon.
     Communique avec le thread pygame via :
       - _async_send_queue : asyncio.Queue (zéro latence côté envoi)
-      - receive_queue     : queue.Queue thread-safe (lecture pygame)
-
-    Le thread pygame appelle send_input() et get_messages() librement.
+      - receive_queue     : queue.Queue thread-safe des événements fiables
+                            (lobby, début/fin de partie, projectiles, erreurs...),
+                            lus dans l'ordre
+      - _snapshot         : dernier MSG_GAME_STATE seulement (le plus récent
+                            gagne), décodé et préparé sur le thread réseau
+
+    Le thread pygame appelle send_input(), get_messages() et get_snapshot()
+    librement. Après un à-coup, la frame suivante n'applique qu'un seul
+    snapshot au lieu de rattraper tous ceux reçus entre-temps.
     L'envoi est event-driven : dès qu'un message est mis dans _async_send_queue
     il part immédiatement sans polling ni sleep.
     """
@@ -31,6 +52,11 @@ class GameClient:
 
         # Queue de réception (thread pygame lit ici)
         self.receive_queue: queue.Queue = queue.Queue()
+        # Boîte aux lettres du dernier snapshot (écrasé à chaque réception)
+        self._snapshot: dict | None = None
+        self._snapshot_lock = threading.Lock()
+        self.snapshots_received = 0
+        self.snapshots_dropped  = 0   # écrasés avant d'avoir été lus
 
         # asyncio.Queue créée dans le thread asyncio (évite les race conditions)
         self._async_send_queue: asyncio.Queue | None = None
@@ -55,12 +81,22 @@ class GameClient:
     async def _recv_loop(self, ws):
         async for raw in ws:
             msg = decode(raw)
-            self.receive_queue.put(msg)
+            if msg.get("type") == MSG_GAME_STATE:
+                self._store_snapshot(prepare_game_state(msg))
+            else:
+                self.receive_queue.put(msg)
         # La boucle s'est terminée = serveur a fermé la connexion
         if self._running:
             self.receive_queue.put({"type": "error", "reason": "disconnected_by_server"})
             self._running = False
 
+    def _store_snapshot(self, snap: dict) -> None:
+        with self._snapshot_lock:
+            if self._snapshot is not None:
+                self.snapshots_dropped += 1
+            self._snapshot = snap
+            self.snapshots_received += 1
+
     async def _connect_and_run(self):
         # Créer la asyncio.Queue dans le bon loop
         self._async_send_queue = asyncio.Queue()
@@ -122,6 +158,7 @@ class GameClient:
             self._loop.call_soon_threadsafe(self._async_send_queue.put_nowait, input_dict)
 
     def get_messages(self) -> list[dict]:
+        """Événements fiables reçus depuis le dernier appel, dans l'ordre."""
         msgs = []
         while not self.receive_queue.empty():
             try:
@@ -129,3 +166,58 @@ class GameClient:
             except queue.Empty:
                 break
         return msgs
+
+    def get_snapshot(self) -> dict | None:
+        """Dernier snapshot reçu (préparé), ou None si rien de neuf."""
+        with self._snapshot_lock:
+            snap, self._snapshot = self._snapshot, None
+        return snap
+
+
+class OfflineClient:
+    """
+    Remplaçant de GameClient sans réseau (bench, rendu hors ligne).
+    Même interface que celle utilisée par ClientGame : les messages injectés
+    via push() sont triés comme par GameClient (snapshots dans la boîte aux
+    lettres rendue par get_snapshot(), le reste par get_messages()),
+    send_input() ne fait que compter les messages qui auraient été envoyés.
+    """
+
+    def __init__(self, player_id: int = 1, player_name: str = "Hors ligne"):
+        self.player_name = player_name
+        self.player_id   = player_id
+        self.inputs_sent = 0
+        self.snapshots_received = 0
+        self.snapshots_dropped  = 0
+        self._pending: list[dict] = []
+        self._snapshot: dict | None = None
+
+    def start_in_thread(self):
+        pass
+
+    def wait_connected(self, timeout: float = 10.0) -> bool:
+        return True
+
+    def stop(self):
+        pass
+
+    def push(self, msgs: list[dict]) -> None:
+        for msg in msgs:
+            if msg.get("type") == MSG_GAME_STATE:
+                if self._snapshot is not None:
+                    self.snapshots_dropped += 1
+                self._snapshot = prepare_game_state(msg)
+                self.snapshots_received += 1
+            else:
+                self._pending.append(msg)
+
+    def send_input(self, input_dict: dict):
+        self.inputs_sent += 1
+
+    def get_messages(self) -> list[dict]:
+        msgs, self._pending = self._pending, []
+        return msgs
+
+    def get_snapshot(self) -> dict | None:
+        snap, self._snapshot = self._snapshot, None
+        return snap
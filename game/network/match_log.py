@@ -0,0 +1,132 @@
+# match_log.py - Enregistrement compact d'une partie (inputs reseau par tick)
+#
+# Format JSON Lines, ecrit en ajout seul et bufferise :
+#   {"v": 1, "t": 0, "seed": 123, "fixed_dt": null, "created": "..."}   <- en-tete
+#   {"t": 57, "dt": 0.016, "m": [...], "w": [456]}                        <- tick
+#   {"t": 9000, "end": true}                                             <- fin
+#
+# Une ligne de tick n'est ecrite que si le tick contient des messages ("m"),
+# une nouvelle graine de monde ("w") ou un dt different du precedent : les
+# ticks absents rejouent le dernier dt sans message.
+# Les inputs MSG_INPUT (l'essentiel du volume) sont compactes en liste :
+#   ["i", player_id, tick, dx, dy, aim_angle, shooting, weapon_idx, revive_held]
+# Les autres messages (player_joined, player_left, start_game_req, ...) et
+# les inputs partiels (make_input_delta) sont conserves tels quels.
+import json
+import time
+
+from game.network.messages import MSG_INPUT, INPUT_FIELDS
+
+_WRITE_BUFFER = 1 << 16   # octets bufferises avant ecriture disque
+
+
+def _pack(msg: dict):
+    inp = msg.get("input")
+    if (isinstance(inp, dict) and inp.get("type") == MSG_INPUT
+            and all(k in inp for k in INPUT_FIELDS)):
+        return ["i", msg["player_id"], inp.get("tick", 0),
+                inp.get("dx", 0), inp.get("dy", 0), inp.get("aim_angle", 0),
+                inp.get("shooting", False), inp.get("weapon_idx", 0),
+                inp.get("revive_held", False)]
+    return msg
+
+
+def _unpack(item) -> dict:
+    if isinstance(item, list) and item and item[0] == "i":
+        _, pid, tick, dx, dy, aim, shooting, widx, revive = item
+        return {"player_id": pid, "input": {
+            "type": MSG_INPUT, "player_id": pid, "tick": tick,
+            "dx": dx, "dy": dy, "aim_angle": aim, "shooting": shooting,
+            "weapon_idx": widx, "revive_held": revive,
+        }}
+    return item
+
+
+class MatchRecorder:
+    """
+    Enregistreur branche sur ServerGame (attribut recorder).
+
+    Appels depuis la boucle de jeu :
+      begin_tick(tick, dt)  - debut de tick (ecrit la ligne du tick precedent)
+      messages(msgs)        - messages reseau traites pendant le tick
+      world(seed)           - nouveau monde (_init_world) avec sa graine
+      close()               - fin d'enregistrement
+    """
+
+    def __init__(self, path: str, tick: int, seed: int,
+                 fixed_dt: float | None = None):
+        self.path = path
+        self._f = open(path, "a", encoding="utf-8", buffering=_WRITE_BUFFER)
+        self._write({"v": 1, "t": tick, "seed": seed, "fixed_dt": fixed_dt,
+                     "created": time.strftime("%Y-%m-%d %H:%M:%S")})
+        self._tick = tick
+        self._dt: float | None = None
+        self._last_dt: float | None = None
+        self._msgs: list = []
+        self._worlds: list[int] = []
+
+    def _write(self, obj: dict) -> None:
+        self._f.write(json.dumps(obj, separators=(",", ":")))
+        self._f.write("\n")
+
+    def _flush_tick(self) -> None:
+        if self._dt is None:
+            return
+        if self._msgs or self._worlds or self._dt != self._last_dt:
+            line = {"t": self._tick, "dt": self._dt}
+            if self._msgs:
+                line["m"] = self._msgs
+            if self._worlds:
+                line["w"] = self._worlds
+            self._write(line)
+            self._last_dt = self._dt
+        self._msgs = []
+        self._worlds = []
+
+    def begin_tick(self, tick: int, dt: float) -> None:
+        self._flush_tick()
+        self._tick = tick
+        self._dt = dt
+
+    def messages(self, msgs: list[dict]) -> None:
+        if msgs:
+            self._msgs.extend(_pack(m) for m in msgs)
+
+    def world(self, seed: int) -> None:
+        self._worlds.append(seed)
+
+    def close(self) -> None:
+        self._flush_tick()
+        self._write({"t": self._tick, "end": True})
+        self._f.close()
+
+
+def read_match_log(path: str):
+    """Lit un enregistrement. Renvoie (en-tete, iterateur de ticks).
+
+    L'iterateur donne (tick, dt, messages, graines_de_monde) pour CHAQUE tick
+    de la partie, y compris ceux absents du fichier (dt precedent, sans message).
+    """
+    f = open(path, encoding="utf-8")
+    header = json.loads(f.readline())
+
+    def ticks():
+        with f:
+            tick = header["t"]
+            dt = header.get("fixed_dt") or 0.0
+            for raw in f:
+                line = json.loads(raw)
+                t = line["t"]
+                end = line.get("end", False)
+                while tick < (t if end else t - 1):   # ticks sans ligne
+                    tick += 1
+                    yield tick, dt, [], []
+                if end:
+                    return
+                tick = t
+                dt = line["dt"]
+                yield (tick, dt,
+                       [_unpack(m) for m in line.get("m", [])],
+                       line.get("w", []))
+
+    return header, ticks()
@@ -20,6 +20,7 @@ MSG_ERROR          = "error"
 MSG_UPGRADE_RESULT = "upgrade_result"
 MSG_LOBBY_STATE    = "lobby_state"   # serveur -> clients : liste joueurs en attente
 MSG_START_GAME     = "start_game"    # serveur -> clients : début de partie
+MSG_PROJECTILES    = "projectiles"   # serveur -> clients : apparitions / disparitions de projectiles
 
 
 # ---- Serialisation ----
@@ -52,8 +53,19 @@ def make_input(player_id: int, tick: int, dx: float, dy: float,
     }
 
 
+# Champs d'etat d'un input (hors type / player_id / tick)
+INPUT_FIELDS = ("dx", "dy", "aim_angle", "shooting", "weapon_idx", "revive_held")
+
+
+def make_input_delta(player_id: int, tick: int, changes: dict) -> dict:
+    """Input partiel : seuls les champs de INPUT_FIELDS modifies depuis le
+    dernier envoi. Le serveur les fusionne dans le dernier input du joueur."""
+    msg = {"type": MSG_INPUT, "player_id": player_id, "tick": tick}
+    msg.update(changes)
+    return msg
+
+
 def make_game_state(tick: int, players_data: list, enemies_data: list,
-                    bullets_data: list, grenades_data: list,
                     pickups_data: list, wave_info: dict,
                     upgrade_levels: dict | None = None,
                     explosions_data: list | None = None) -> dict:
@@ -62,8 +74,6 @@ def make_game_state(tick: int, players_data: list, enemies_data: list,
         "tick":       tick,
         "players":    players_data,
         "enemies":    enemies_data,
-        "bullets":    bullets_data,
-        "grenades":   grenades_data,
         "pickups":    pickups_data,
         "explosions": explosions_data or [],
         "upgrade_levels": upgrade_levels or {},
@@ -72,6 +82,13 @@ def make_game_state(tick: int, players_data: list, enemies_data: list,
     return msg
 
 
+def make_projectiles(tick: int, events: list) -> dict:
+    """Événements de projectiles depuis le dernier envoi, dans l'ordre.
+    Les balles et grenades ne figurent plus dans les snapshots : le client
+    simule leur vol (trajectoire déterministe) à partir de l'apparition."""
+    return {"type": MSG_PROJECTILES, "tick": tick, "events": events}
+
+
 def make_lobby_state(players: list) -> dict:
     """players = [{"player_id": int, "player_name": str, "is_host": bool}, ...]"""
     return {"type": MSG_LOBBY_STATE, "players": players}
@@ -101,6 +118,7 @@ def serialize_player(p) -> dict:
         "state":          p.state,
         "down_timer":     round(p.down_timer, 1),
         "revive_progress": round(p.revive_progress, 2),
+        "input_tick":     getattr(p, "last_input_tick", 0),   # dernier input appliqué
     }
 
 
@@ -117,25 +135,27 @@ def serialize_enemy(e) -> dict:
     }
 
 
-def serialize_bullet(b) -> dict:
-    return {
-        "bullet_id": id(b),
-        "x":        round(b.pos.x, 1),
-        "y":        round(b.pos.y, 1),
-        "vel_x":    round(b.velocity.x, 1),
-        "vel_y":    round(b.velocity.y, 1),
-        "owner":    b.owner,
-        "weapon":   getattr(b, "weapon", "pistol"),
-    }
+# Événements compacts (listes) : [genre, id réseau, tick d'apparition, âge en s
+# à l'envoi, ...]. L'âge est rempli à l'envoi (snapshots plus rares que les ticks).
+def bullet_spawn(b, net_id: int, tick: int) -> list:
+    return ["b", net_id, tick, 0.0,
+            round(b.pos.x, 1), round(b.pos.y, 1),
+            round(b.velocity.x, 1), round(b.velocity.y, 1),
+            getattr(b, "weapon", "pistol"),
+            "p" if b.owner == "player" else "e",
+            round(b.max_range - b.traveled, 1)]
 
 
-def serialize_grenade(g) -> dict:
-    return {
-        "grenade_id":     id(g),
-        "x":              round(g.pos.x, 1),
-        "y":              round(g.pos.y, 1),
-        "fuse_remaining": round(g.fuse_timer, 2),
-    }
+def grenade_spawn(g, net_id: int, tick: int) -> list:
+    return ["g", net_id, tick, 0.0,
+            round(g.pos.x, 1), round(g.pos.y, 1),
+            round(g.velocity.x, 1), round(g.velocity.y, 1),
+            round(g.fuse_timer, 3)]
+
+
+def projectile_despawn(net_id: int, tick: int, pos) -> list:
+    """Impact ou fin de portée / détonation, à la position finale."""
+    return ["x", net_id, tick, 0.0, round(pos.x, 1), round(pos.y, 1)]
 
 
 def serialize_pickup(pk) -> dict:
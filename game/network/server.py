@@ -27,7 +27,9 @@ class GameServer:
     Le thread pygame appelle broadcast() et get_pending_inputs() librement.
     """
 
-    def __init__(self):
+    def __init__(self, port: int = NET_PORT, max_clients: int = NET_MAX_PLAYERS - 1):
+        self.port        = port
+        self.max_clients = max_clients   # hôte local exclu (ServerGame) / tous (dédié)
         self.clients: dict[int, object] = {}   # player_id -> websocket
         self.player_names: dict[int, str] = {}
         self.next_player_id = 2   # host = 1
@@ -60,7 +62,7 @@ class GameServer:
                 }))
                 return
 
-            if len(self.clients) >= NET_MAX_PLAYERS - 1:
+            if len(self.clients) >= self.max_clients:
                 await websocket.send(encode({
                     "type": MSG_ERROR, "reason": "server_full"
                 }))
@@ -153,7 +155,7 @@ class GameServer:
         broadcast_task = asyncio.create_task(self._broadcast_loop())
         try:
             # reuse_address=True : le port est réutilisable immédiatement après fermeture
-            async with ws_serve(self._handler, "0.0.0.0", NET_PORT, reuse_address=True):
+            async with ws_serve(self._handler, "0.0.0.0", self.port, reuse_address=True):
                 # Attendre le signal d'arrêt propre (vs create_future interrompu brutalement)
                 await self._stop_event.wait()
         finally:
@@ -205,3 +207,35 @@ class GameServer:
             except queue.Empty:
                 break
         return inputs
+
+
+class OfflineServer:
+    """
+    Remplaçant de GameServer sans réseau (rejeu, simulation accélérée).
+    Même interface que celle utilisée par ServerGame : les messages injectés
+    via push() sont rendus par get_pending_inputs(), broadcast() ne fait que
+    compter les octets qui auraient été envoyés.
+    """
+
+    def __init__(self):
+        self.clients: dict[int, object] = {}
+        self.player_names: dict[int, str] = {}
+        self.max_clients = NET_MAX_PLAYERS
+        self.bytes_broadcast = 0
+        self._pending: list[dict] = []
+
+    def start_in_thread(self, wait_ready: bool = True):
+        pass
+
+    def stop(self):
+        pass
+
+    def push(self, msgs: list[dict]) -> None:
+        self._pending.extend(msgs)
+
+    def broadcast(self, msg_str: str):
+        self.bytes_broadcast += len(msg_str)
+
+    def get_pending_inputs(self) -> list[dict]:
+        inputs, self._pending = self._pending, []
+        return inputs
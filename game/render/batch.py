@@ -0,0 +1,108 @@
+# batch.py - Culling par camera et soumission groupee des sprites
+#
+# Une frame de jeu dessinait chaque entite de la carte, visible ou non, avec
+# un appel blit/draw par entite. SpriteBatch ecarte d'abord tout ce qui sort
+# de la vue (Camera.offset + CULL_MARGIN), puis rend les survivants couche
+# par couche (LAYER_* de settings.py). Dans une couche :
+#   1. les sprites, en un seul Surface.fblits / blits ;
+#   2. les dessins immediats (barres de vie, joueurs, explosions...) ;
+#   3. les etiquettes (textes au-dessus des sprites), en un seul blits.
+# Avec scale < 1 (gouverneur de qualite), la cible est une surface en
+# resolution interne reduite : positions et sprites centres sont reduits.
+import pygame
+from settings import SCREEN_W, SCREEN_H, CULL_MARGIN, SCALED_CACHE_MAX_BYTES
+from game.render.surface_cache import SurfaceCache
+
+
+class SpriteBatch:
+    def __init__(self, margin: int = CULL_MARGIN):
+        self.margin = margin
+        self.drawn  = 0      # entites soumises a la derniere frame
+        self.culled = 0      # entites ecartees (hors vue) a la derniere frame
+        self._layers: dict[int, tuple[list, list, list]] = {}
+        self._x0 = self._y0 = 0.0
+        self._x1 = self._y1 = 0.0
+        self._ox = self._oy = 0.0
+        self.scale = 1.0
+        # {Surface: Surface reduite} pour scale < 1 (cle = surface source)
+        self._small = SurfaceCache("batch.scaled", SCALED_CACHE_MAX_BYTES)
+
+    def begin(self, camera, scale: float = 1.0) -> None:
+        """Nouvelle frame : vue courante de la camera, compteurs a zero."""
+        if scale != self.scale:
+            self.scale = scale
+            self._small.clear()
+        m = self.margin
+        self._ox, self._oy = camera.offset.x, camera.offset.y
+        self._x0, self._y0 = self._ox - m, self._oy - m
+        self._x1, self._y1 = self._ox + SCREEN_W + m, self._oy + SCREEN_H + m
+        self.drawn = self.culled = 0
+        for sprites, draws, labels in self._layers.values():
+            sprites.clear()
+            draws.clear()
+            labels.clear()
+
+    def visible(self, wx: float, wy: float, radius: float = 0.0) -> bool:
+        """Position monde (et rayon) dans la vue elargie ; compte drawn/culled."""
+        if (self._x0 - radius <= wx <= self._x1 + radius
+                and self._y0 - radius <= wy <= self._y1 + radius):
+            self.drawn += 1
+            return True
+        self.culled += 1
+        return False
+
+    def to_screen(self, wx: float, wy: float) -> tuple[int, int]:
+        if self.scale != 1.0:
+            return int((wx - self._ox) * self.scale), int((wy - self._oy) * self.scale)
+        return int(wx - self._ox), int(wy - self._oy)
+
+    def _layer(self, layer: int) -> tuple[list, list, list]:
+        lists = self._layers.get(layer)
+        if lists is None:
+            lists = self._layers[layer] = ([], [], [])
+        return lists
+
+    def add(self, layer: int, surf: pygame.Surface, dest) -> None:
+        """Sprite a blitter (dest : coin haut-gauche ou Rect ecran)."""
+        self._layer(layer)[0].append((surf, dest))
+
+    def add_centered(self, layer: int, surf: pygame.Surface,
+                     wx: float, wy: float) -> None:
+        """Sprite centre sur une position monde."""
+        if self.scale != 1.0:
+            surf = self._scaled(surf)
+            sx, sy = self.to_screen(wx, wy)
+        else:
+            sx, sy = int(wx - self._ox), int(wy - self._oy)
+        self._layer(layer)[0].append(
+            (surf, (sx - surf.get_width() // 2, sy - surf.get_height() // 2)))
+
+    def _scaled(self, surf: pygame.Surface) -> pygame.Surface:
+        small = self._small.get(surf)
+        if small is None:
+            w, h = surf.get_size()
+            small = self._small.put(surf, pygame.transform.scale(
+                surf, (max(1, int(w * self.scale)), max(1, int(h * self.scale)))))
+        return small
+
+    def add_draw(self, layer: int, fn, *args) -> None:
+        """Dessin immediat differe : fn(surface, *args) au rendu de la couche."""
+        self._layer(layer)[1].append((fn, args))
+
+    def add_label(self, layer: int, surf: pygame.Surface, dest) -> None:
+        """Texte dessine apres les sprites et dessins de la couche."""
+        self._layer(layer)[2].append((surf, dest))
+
+    def flush(self, surface: pygame.Surface) -> None:
+        """Rend toutes les couches dans l'ordre LAYER_* croissant."""
+        blits = getattr(surface, "fblits", None)
+        if blits is None:
+            blits = lambda seq: surface.blits(seq, doreturn=False)
+        for layer in sorted(self._layers):
+            sprites, draws, labels = self._layers[layer]
+            if sprites:
+                blits(sprites)
+            for fn, args in draws:
+                fn(surface, *args)
+            if labels:
+                blits(labels)
@@ -0,0 +1,27 @@
+# layer.py - Calques de rendu retenus
+#
+# Un calque est une surface SRCALPHA redessinee uniquement quand sa cle
+# (tuple des valeurs affichees) change ; le reste du temps, la frame se
+# contente de le blitter. Sert au HUD dont les valeurs (PV, munitions,
+# score, vague) ne bougent que quelques fois par seconde.
+import pygame
+
+
+class RetainedLayer:
+    def __init__(self, size: tuple[int, int], build):
+        """build(surface, *cle) dessine le calque sur une surface transparente."""
+        self.surface  = pygame.Surface(size, pygame.SRCALPHA)
+        self.rebuilds = 0
+        self._build   = build
+        self._key     = None
+
+    def get(self, key: tuple) -> pygame.Surface:
+        if key != self._key:
+            self._key = key
+            self.surface.fill((0, 0, 0, 0))
+            self._build(self.surface, *key)
+            self.rebuilds += 1
+        return self.surface
+
+    def invalidate(self) -> None:
+        self._key = None
@@ -0,0 +1,109 @@
+# quality.py - Gouverneur de qualite du rendu client
+#
+# Surveille le temps de travail des dernieres frames (hors attente de
+# clock.tick) et descend d'un niveau de qualite quand la moyenne depasse le
+# budget d'une frame, remonte quand il reste de la marge pendant plusieurs
+# fenetres. Hysteresis : chaque remontee mesure le surcout du niveau retrouve
+# (moyenne apres / moyenne avant) ; on ne remonte plus que si la moyenne
+# courante multipliee par ce surcout reste sous le seuil de descente, et une
+# remontee ratee (depassement avant QUALITY_UP_WINDOWS fenetres) double la
+# marge exigee pour ce niveau (jusqu'a QUALITY_UP_MAX_WINDOWS, apres quoi une
+# remontee est retentee quel que soit le surcout). Sans cela, un
+# niveau 4 qui rend les frames bon marche faisait osciller 4 -> 3 -> 4.
+# Les niveaux sont cumulatifs :
+#   0  complet
+#   1  sans barres de vie ni points d'etat IA
+#   2  explosions dessinees plafonnees (QUALITY_MAX_EXPLOSIONS par frame)
+#   3  sans popups de score ni etiquettes du monde
+#   4  monde rendu en resolution interne reduite (QUALITY_RENDER_SCALE) puis agrandi
+from collections import deque
+from settings import (
+    FPS, QUALITY_WINDOW, QUALITY_DOWN_RATIO, QUALITY_UP_RATIO,
+    QUALITY_UP_WINDOWS, QUALITY_UP_MAX_WINDOWS, QUALITY_MAX_EXPLOSIONS,
+    QUALITY_RENDER_SCALE,
+)
+
+QUALITY_NAMES = ("complet", "sans barres de vie", "explosions plafonnees",
+                 "sans popups", "rendu reduit")
+
+
+class QualityGovernor:
+    def __init__(self, budget_ms: float = 1000.0 / FPS, window: int = QUALITY_WINDOW):
+        self.budget_ms = budget_ms
+        self.level     = 0
+        self.changes   = 0      # changements de niveau depuis le lancement
+        self.avg_ms    = 0.0    # moyenne de la derniere fenetre complete
+        self._times: deque = deque(maxlen=window)
+        self._headroom = 0      # fenetres consecutives sous QUALITY_UP_RATIO
+        # Par niveau : fenetres de marge exigees pour y remonter, surcout mesure
+        self._hold = [QUALITY_UP_WINDOWS] * len(QUALITY_NAMES)
+        self._cost = [1.0] * len(QUALITY_NAMES)
+        self._probe: tuple[int, float] | None = None   # remontee a confirmer (niveau, moyenne avant)
+        self._settled = 0       # fenetres sans depassement depuis cette remontee
+
+    def record(self, frame_ms: float) -> None:
+        """Temps de travail d'une frame ; decide a chaque fenetre complete."""
+        times = self._times
+        times.append(frame_ms)
+        if len(times) < times.maxlen:
+            return
+        self.avg_ms = sum(times) / len(times)
+        times.clear()
+        down = self.budget_ms * QUALITY_DOWN_RATIO
+        if self.avg_ms > down:
+            self._headroom = 0
+            if self._probe is not None:   # remontee ratee : attendre plus longtemps
+                level, before = self._probe
+                self._probe = None
+                self._cost[level] = self.avg_ms / max(before, 0.01)
+                self._hold[level] = min(self._hold[level] * 2, QUALITY_UP_MAX_WINDOWS)
+            if self.level < len(QUALITY_NAMES) - 1:
+                self._set(self.level + 1)
+            return
+        if self._probe is not None:
+            self._settled += 1
+            if self._settled >= QUALITY_UP_WINDOWS:   # remontee tenue
+                level, before = self._probe
+                self._probe = None
+                self._cost[level] = self.avg_ms / max(before, 0.01)
+                self._hold[level] = QUALITY_UP_WINDOWS
+        if self.avg_ms < self.budget_ms * QUALITY_UP_RATIO and self.level > 0:
+            self._headroom += 1
+            target = self.level - 1
+            # Surcout connu trop eleve : reessayer quand meme apres la
+            # marge maximale (le surcout a pu venir d'une scene passagere)
+            if (self._headroom >= self._hold[target]
+                    and (self.avg_ms * self._cost[target] < down
+                         or self._headroom >= QUALITY_UP_MAX_WINDOWS)):
+                self._headroom = 0
+                self._probe, self._settled = (target, self.avg_ms), 0
+                self._set(target)
+        else:
+            self._headroom = 0
+
+    def _set(self, level: int) -> None:
+        print(f"[client] Qualité {self.level} -> {level} ({QUALITY_NAMES[level]}, "
+              f"{self.avg_ms:.1f} ms/frame)")
+        self.level = level
+        self.changes += 1
+
+    # ---- Reglages derives du niveau (lus par ClientGame._draw) ----------
+    @property
+    def health_bars(self) -> bool:
+        return self.level < 1
+
+    @property
+    def max_explosions(self) -> int | None:
+        return None if self.level < 2 else QUALITY_MAX_EXPLOSIONS
+
+    @property
+    def labels(self) -> bool:
+        return self.level < 3
+
+    @property
+    def render_scale(self) -> float:
+        return 1.0 if self.level < 4 else QUALITY_RENDER_SCALE
+
+    @property
+    def name(self) -> str:
+        return QUALITY_NAMES[self.level]
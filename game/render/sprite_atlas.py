@@ -0,0 +1,78 @@
+# sprite_atlas.py - Sprites pre-pivotes par paliers d'angle
+#
+# pygame.transform.rotate alloue et filtre une nouvelle surface a chaque
+# appel : fait pour chaque ennemi / joueur a chaque frame, c'est le poste le
+# plus cher du rendu en fin de vague. L'atlas arrondit l'angle au palier le
+# plus proche (SPRITE_ANGLE_BUCKETS par tour) et garde la surface pivotee
+# sous la cle (type de sprite, couleur, palier). Un palier est calcule au
+# premier usage (ou d'avance via prewarm) ; au-dela de SPRITE_ATLAS_MAX_BYTES
+# les paliers les moins recemment dessines sont liberes (SurfaceCache).
+import pygame
+from settings import SPRITE_ANGLE_BUCKETS, SPRITE_ATLAS_MAX_BYTES, SPRITE_BASE_MAX_BYTES
+from game.render.surface_cache import SurfaceCache
+
+
+class SpriteAtlas:
+    def __init__(self, buckets: int = SPRITE_ANGLE_BUCKETS,
+                 max_bytes: int = SPRITE_ATLAS_MAX_BYTES):
+        self.buckets  = buckets
+        self._step    = 360.0 / buckets
+        self._bases   = SurfaceCache("sprites.base", SPRITE_BASE_MAX_BYTES)   # {(kind, color)}
+        self._rotated = SurfaceCache("sprites.rotated", max_bytes)            # {(kind, color, palier)}
+
+    # Compteurs des sprites pivotes (les bases ont leurs propres stats)
+    @property
+    def bytes(self) -> int:
+        return self._rotated.bytes
+
+    @property
+    def hits(self) -> int:
+        return self._rotated.hits
+
+    @property
+    def misses(self) -> int:
+        return self._rotated.misses
+
+    @property
+    def evictions(self) -> int:
+        return self._rotated.evictions
+
+    def bucket(self, angle: float) -> int:
+        """Palier le plus proche de l'angle (degres, sens de transform.rotate)."""
+        return int(round(angle / self._step)) % self.buckets
+
+    def base(self, kind: str, color: tuple, make) -> pygame.Surface:
+        """Surface de base de (kind, color) ; make() au premier usage."""
+        return self._bases.get_or_make((kind, color), make)
+
+    def rotated(self, kind: str, color: tuple, angle: float,
+                make) -> pygame.Surface:
+        """Surface de base pivotee de angle degres (arrondi au palier).
+        make : fabrique de la surface de base, appelee au premier usage."""
+        b   = self.bucket(angle)
+        key = (kind, color, b)
+        surf = self._rotated.get(key)
+        if surf is None:
+            surf = self._store(key, self.base(kind, color, make), b)
+        return surf
+
+    def prewarm(self, kind: str, color: tuple, make) -> None:
+        """Calcule d'avance tous les paliers de (kind, color)."""
+        base = self.base(kind, color, make)
+        for b in range(self.buckets):
+            key = (kind, color, b)
+            if key not in self._rotated:
+                self._store(key, base, b)
+
+    def _store(self, key: tuple, base: pygame.Surface, b: int) -> pygame.Surface:
+        surf = pygame.transform.rotate(base, b * self._step)
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert_alpha()
+        return self._rotated.put(key, surf)
+
+    def clear(self) -> None:
+        self._rotated.clear()
+
+
+# Atlas partage par tout le rendu (solo, client, bench)
+SPRITES = SpriteAtlas()
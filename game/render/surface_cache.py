@@ -0,0 +1,113 @@
+# surface_cache.py - Cache LRU de surfaces borne en octets
+#
+# Socle commun de tous les caches de surfaces du rendu (atlas de sprites,
+# textes, explosions, chunks de la carte, icones, sprites reduits) : chaque
+# cache a son plafond en octets (largeur x hauteur x octets par pixel) et
+# libere les entrees les moins recemment utilisees au-dela. Les cles peuvent
+# dependre de valeurs variables en cours de partie (rayons, couleurs,
+# textes) : la memoire reste bornee sur une longue session.
+# Compteurs hits / misses / evictions par cache ; cache_stats() les
+# rassemble pour l'overlay de debug et le bench.
+from collections import OrderedDict
+import weakref
+import pygame
+
+
+_CACHES: "weakref.WeakSet[SurfaceCache]" = weakref.WeakSet()
+
+
+def surface_bytes(surf: pygame.Surface) -> int:
+    return surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+
+class SurfaceCache:
+    def __init__(self, name: str, max_bytes: int):
+        self.name      = name
+        self.max_bytes = max_bytes
+        self.bytes     = 0
+        self.hits      = 0
+        self.misses    = 0
+        self.evictions = 0
+        self._surfs: OrderedDict = OrderedDict()   # {cle: Surface}, LRU en tete
+        _CACHES.add(self)
+
+    def __len__(self) -> int:
+        return len(self._surfs)
+
+    def __contains__(self, key) -> bool:
+        return key in self._surfs
+
+    def get(self, key) -> pygame.Surface | None:
+        """Surface en cache (devient la plus recente) ou None ; compte hit/miss."""
+        surf = self._surfs.get(key)
+        if surf is None:
+            self.misses += 1
+            return None
+        self._surfs.move_to_end(key)
+        self.hits += 1
+        return surf
+
+    def put(self, key, surf: pygame.Surface) -> pygame.Surface:
+        """Ajoute (ou remplace) une entree puis evince jusqu'au plafond.
+        L'entree ajoutee n'est jamais evincee, meme plus grosse que le plafond."""
+        surfs = self._surfs
+        old = surfs.pop(key, None)
+        if old is not None:
+            self.bytes -= surface_bytes(old)
+        surfs[key] = surf
+        self.bytes += surface_bytes(surf)
+        while self.bytes > self.max_bytes and len(surfs) > 1:
+            _, old = surfs.popitem(last=False)
+            self.bytes -= surface_bytes(old)
+            self.evictions += 1
+        return surf
+
+    def get_or_make(self, key, make) -> pygame.Surface:
+        """Surface en cache, sinon make() stockee sous key."""
+        surf = self.get(key)
+        if surf is None:
+            surf = self.put(key, make())
+        return surf
+
+    def pop(self, key) -> None:
+        old = self._surfs.pop(key, None)
+        if old is not None:
+            self.bytes -= surface_bytes(old)
+
+    def keys(self) -> list:
+        return list(self._surfs)
+
+    def clear(self) -> None:
+        self._surfs.clear()
+        self.bytes = 0
+
+    def stats(self) -> dict:
+        return {"name": self.name, "entries": len(self._surfs), "bytes": self.bytes,
+                "max_bytes": self.max_bytes, "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions}
+
+
+def cache_stats() -> list[dict]:
+    """Statistiques de tous les caches vivants, regroupes par nom."""
+    merged: dict[str, dict] = {}
+    for cache in list(_CACHES):
+        st = cache.stats()
+        cur = merged.get(st["name"])
+        if cur is None:
+            merged[st["name"]] = st
+        else:
+            for k in ("entries", "bytes", "max_bytes", "hits", "misses", "evictions"):
+                cur[k] += st[k]
+    return sorted(merged.values(), key=lambda st: st["name"])
+
+
+def cache_summary() -> str:
+    """Ligne d'overlay : memoire totale, taux de hits, evictions."""
+    stats = cache_stats()
+    total = sum(st["bytes"] for st in stats)
+    hits  = sum(st["hits"] for st in stats)
+    looks = hits + sum(st["misses"] for st in stats)
+    evic  = sum(st["evictions"] for st in stats)
+    rate  = 100.0 * hits / looks if looks else 100.0
+    return (f"Caches : {total / (1 << 20):.1f} Mo, {rate:.0f} % hits, "
+            f"{evic} evictions")
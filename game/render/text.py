@@ -0,0 +1,49 @@
+# text.py - Polices partagees et cache LRU des textes rendus
+#
+# pygame.font.SysFont relit la police systeme a chaque appel et Font.render
+# rasterise le texte a chaque frame : HUD, menus, etiquettes et popups
+# redessinent pourtant les memes chaines la plupart du temps. get_font()
+# charge chaque police une seule fois ; render_text() renvoie la surface
+# deja rendue pour (police, texte, couleur, antialias) si elle est en cache.
+# Les surfaces renvoyees sont partagees : ne pas les modifier (set_alpha,
+# fill...), passer par .copy() pour un texte en fondu.
+import pygame
+from settings import TEXT_CACHE_MAX_BYTES
+from game.render.surface_cache import SurfaceCache
+
+
+_FONTS: dict[tuple, pygame.font.Font] = {}   # {(nom, taille, gras): Font}
+
+
+def get_font(size: int, bold: bool = False, name: str = "Arial") -> pygame.font.Font:
+    """Police du registre partage (chargee au premier appel)."""
+    key = (name, size, bold)
+    font = _FONTS.get(key)
+    if font is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        font = _FONTS[key] = pygame.font.SysFont(name, size, bold=bold)
+    return font
+
+
+class TextCache(SurfaceCache):
+    def __init__(self, max_bytes: int = TEXT_CACHE_MAX_BYTES):
+        super().__init__("text", max_bytes)
+
+    def render(self, font: pygame.font.Font, text: str, antialias: bool,
+               color: tuple) -> pygame.Surface:
+        key = (font, text, color, antialias)
+        surf = self.get(key)
+        if surf is None:
+            surf = self.put(key, font.render(text, antialias, color))
+        return surf
+
+
+# Cache partage par tout le rendu (HUD, menus, entites, boucles principales)
+TEXT = TextCache()
+
+
+def render_text(font: pygame.font.Font, text: str, antialias: bool,
+                color: tuple) -> pygame.Surface:
+    """font.render(text, antialias, color) via le cache partage."""
+    return TEXT.render(font, text, antialias, color)
@@ -0,0 +1,94 @@
+# warmup.py - Prechauffage des assets pendant le lobby
+#
+# Les sprites pivotes (joueurs, ennemis, balles), les images d'explosion,
+# les icones d'armes et certains textes sont crees au premier usage : la
+# premiere grenade ou le premier ennemi lourd de la vague 6 coutaient une
+# frame entiere. AssetWarmup les construit d'avance par petites etapes,
+# step() n'en traitant que pendant WARMUP_FRAME_MS par frame : l'ecran de
+# lobby reste fluide, et si la partie demarre avant la fin, le reste se
+# termine sans depasser le budget.
+import time
+from settings import (
+    PLAYER_COLORS, ENEMY_TYPES, WEAPONS, WEAPON_ORDER,
+    QUALITY_RENDER_SCALE, WARMUP_FRAME_MS,
+)
+from game.render.sprite_atlas import SPRITES
+from game.render.text import render_text
+
+
+class AssetWarmup:
+    def __init__(self, tag: str, texts=()):
+        """tag : prefixe du rapport ("client", "serveur").
+        texts : (police, texte, couleur) propres a l'appelant a rendre aussi."""
+        self.tag     = tag
+        self.done    = False
+        self.steps   = 0       # etapes effectuees
+        self.frames  = 0       # frames ayant travaille
+        self.work_ms = 0.0     # temps de travail cumule
+        self._start  = None
+        self._iter   = self._tasks(list(texts))
+
+    def step(self, budget_ms: float = WARMUP_FRAME_MS) -> bool:
+        """Avance le prechauffage pendant budget_ms au plus ; True si termine."""
+        if self.done:
+            return True
+        t0 = time.perf_counter()
+        if self._start is None:
+            self._start = t0
+        deadline = t0 + budget_ms / 1000.0
+        self.frames += 1
+        for _ in self._iter:
+            self.steps += 1
+            if time.perf_counter() >= deadline:
+                break
+        else:
+            self.done = True
+        now = time.perf_counter()
+        self.work_ms += (now - t0) * 1000.0
+        if self.done:
+            print(f"[{self.tag}] Assets préchauffés : {self.steps} étapes, "
+                  f"{self.work_ms:.0f} ms de travail sur {self.frames} frames "
+                  f"({now - self._start:.1f} s)")
+        return self.done
+
+    def _tasks(self, texts: list):
+        """Generateur : une unite de travail par yield."""
+        from game.entities.player import _make_player_surf
+        from game.entities.enemy import enemy_sprite
+        from game.entities.bullet import bullet_sprite
+        from game.entities.grenade import explosion_frame, _EXPL_FRAMES
+        from game.entities.pickup import pickup_surf, weapon_icon
+
+        step = 360.0 / SPRITES.buckets
+        # Sprites pivotes : un palier par etape
+        for color in PLAYER_COLORS:
+            for b in range(SPRITES.buckets):
+                SPRITES.rotated("player", color, b * step,
+                                lambda c=color: _make_player_surf(c, 40))
+                yield
+        for etype, data in ENEMY_TYPES.items():
+            for b in range(SPRITES.buckets):
+                enemy_sprite(etype, data["color"], b * step)
+                yield
+        bullet_kinds = [(w, "player") for w in WEAPON_ORDER if "blast_radius" not in WEAPONS[w]]
+        for weapon, owner in bullet_kinds + [("pistol", "enemy")]:
+            for b in range(SPRITES.buckets):
+                bullet_sprite(weapon, owner, b * step)
+            yield
+        # Explosions : rayon plein et rayon en resolution reduite (qualite)
+        for data in WEAPONS.values():
+            radius = data.get("blast_radius")
+            if radius is None:
+                continue
+            for r in {int(radius), int(int(radius) * QUALITY_RENDER_SCALE)}:
+                for i in range(_EXPL_FRAMES):
+                    explosion_frame(r, i)
+                    yield
+        # Pickups au sol et icones de l'inventaire (HUD)
+        for weapon in WEAPON_ORDER:
+            pickup_surf(weapon)
+            weapon_icon(weapon, 32)
+            yield
+        for font, text, color in texts:
+            render_text(font, text, True, color)
+            yield
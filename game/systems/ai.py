@@ -4,9 +4,10 @@ import math
 import random
 from settings import (
     TILE_SIZE, CHASE_RANGE, COVER_RANGE, PATROL_SPEED_MOD,
-    PATH_RECALC_TIME,
+    PATH_RECALC_TIME, SQUAD_THINK_TIME,
 )
 from game.systems.collision import has_line_of_sight
+from game.systems.cover import cover_index_for
 
 
 # ---- Etats ----
@@ -23,11 +24,15 @@ def _dist(a: pygame.Vector2, b: pygame.Vector2) -> float:
 
 
 class AIController:
-    def __init__(self, enemy, players, tilemap, pathfinder):
+    def __init__(self, enemy, players, tilemap, pathfinder, rng=None):
         self.enemy      = enemy
         self.players    = players
         self.tilemap    = tilemap
         self.pathfinder = pathfinder
+        self.rng        = rng if rng is not None else random   # flux de la partie
+        self.cover_index = cover_index_for(tilemap)
+        self.squad       = None   # affecte par SquadManager (squad.py)
+        self.percept     = None   # (cible, ligne de vue) depose par Perception
 
         self.state          = AI_PATROL
         self.alert_timer    = 0.0
@@ -43,6 +48,7 @@ class AIController:
         # Chemin courant
         self.current_path: list[pygame.Vector2] = []
         self.path_timer   = 0.0
+        self._squad_path_version = -1
 
     # ------------------------------------------------------------------
     def _get_nearest_alive_player(self):
@@ -57,7 +63,19 @@ class AIController:
     def update(self, dt: float):
         e = self.enemy
 
-        target = self._get_nearest_alive_player()
+        squad = self.squad
+        if squad is not None and (squad.target is None
+                                  or getattr(squad.target, "state", "alive") != "alive"):
+            squad = None
+
+        # Perception precalculee ce tick (perception.py), sinon partagee par
+        # l'escouade, sinon individuelle
+        percept, self.percept = self.percept, None
+        if percept is not None:
+            target, has_los = percept
+        else:
+            target = squad.target if squad else self._get_nearest_alive_player()
+            has_los = None
         if target is None:
             # Plus de joueurs vivants, patrouille
             self.state = AI_PATROL
@@ -69,7 +87,11 @@ class AIController:
         e_pos = e.pos
 
         dist_to_player = _dist(e_pos, p_pos)
-        has_los = has_line_of_sight(e_pos, p_pos, self.tilemap)
+        if has_los is None:
+            if squad:
+                has_los = squad.has_los(e, self.tilemap)
+            else:
+                has_los = has_line_of_sight(e_pos, p_pos, self.tilemap)
         shoot_range = e.shoot_range
 
         # ---- Transitions ----
@@ -117,6 +139,7 @@ class AIController:
                     if not has_line_of_sight(e_pos, p_pos, self.tilemap):
                         self.state = AI_SHOOT
                         self.cover_pos = None
+                        self.cover_index.release(e)
             else:
                 self.state = AI_CHASE
 
@@ -126,7 +149,10 @@ class AIController:
         elif self.state in (AI_ALERT,):
             pass
         elif self.state == AI_CHASE:
-            self._do_chase(dt, p_pos)
+            if squad:
+                self._do_squad_chase(dt, squad, p_pos)
+            else:
+                self._do_chase(dt, p_pos)
         elif self.state == AI_SHOOT:
             pass
         elif self.state == AI_COVER:
@@ -149,15 +175,53 @@ class AIController:
     def _do_chase(self, dt: float, target_pos: pygame.Vector2):
         self._do_move_to(dt, target_pos)
 
+    def _do_squad_chase(self, dt: float, squad, target_pos: pygame.Vector2):
+        """Chef : suit le chemin de l'escouade. Membre : rejoint son slot."""
+        e = self.enemy
+        if e is squad.leader:
+            if self._squad_path_version != squad.path_version:
+                self._squad_path_version = squad.path_version
+                self.current_path = list(squad.path)
+                # l'escouade recalcule le chemin : pas d'A* individuel entre-temps
+                self.path_timer   = PATH_RECALC_TIME + SQUAD_THINK_TIME
+            self._do_move_to(dt, target_pos)
+            return
+
+        slot = squad.slot(e)
+        if not squad.slot_reachable(e, slot, self.tilemap):
+            self._do_move_to(dt, squad.leader.pos)   # contourner l'obstacle (A*)
+            return
+        direction = slot - e.pos
+        d = direction.length()
+        if d < 2:
+            e.velocity = pygame.Vector2(0, 0)
+            return
+        # Ralentir a l'approche du slot (pas d'oscillation autour)
+        e.velocity = direction / d * e.speed * min(1.0, d / TILE_SIZE)
+
     def _do_move_to(self, dt: float, target_pos: pygame.Vector2,
                     speed_mod: float = 1.0):
         e = self.enemy
+        service = self.pathfinder.service
         self.path_timer -= dt
         if self.path_timer <= 0 or not self.current_path:
-            self.current_path = self.pathfinder.find_path(e.pos, target_pos)
-            self.path_timer = PATH_RECALC_TIME
+            if service is None:
+                self.current_path = self.pathfinder.find_path(e.pos, target_pos)
+                self.path_timer = PATH_RECALC_TIME
+            elif not service.pending(self):
+                service.request(self, e.pos, target_pos)
+                self.path_timer = PATH_RECALC_TIME
+        if service is not None:
+            path = service.take(self)
+            if path is not None:
+                self.current_path = path
 
         if not self.current_path:
+            if service is not None:
+                # Chemin en cours de calcul : droit vers la cible en attendant
+                direction = target_pos - e.pos
+                if direction.length() > 0:
+                    e.velocity = direction.normalize() * e.speed * speed_mod
             return
 
         wp = self.current_path[0]
@@ -179,8 +243,8 @@ class AIController:
         points = []
         attempts = 0
         while len(points) < count and attempts < 60:
-            angle = random.uniform(0, math.pi * 2)
-            dist  = random.uniform(radius * 0.3, radius)
+            angle = self.rng.uniform(0, math.pi * 2)
+            dist  = self.rng.uniform(radius * 0.3, radius)
             wx = origin.x + math.cos(angle) * dist
             wy = origin.y + math.sin(angle) * dist
             col = int(wx // TILE_SIZE)
@@ -192,22 +256,5 @@ class AIController:
 
     def _find_cover(self, enemy_pos: pygame.Vector2,
                     player_pos: pygame.Vector2) -> pygame.Vector2 | None:
-        best_pos   = None
-        best_score = -1.0
-        for col, row in self.tilemap.get_solid_tiles_in_radius(enemy_pos, COVER_RANGE):
-            for dc, dr in ((-1,0),(1,0),(0,-1),(0,1)):
-                nc, nr = col + dc, row + dr
-                if not self.tilemap.in_bounds(nc, nr):
-                    continue
-                if self.tilemap.is_solid(nc, nr):
-                    continue
-                cover_pos = self.tilemap.tile_center(nc, nr)
-                if has_line_of_sight(cover_pos, player_pos, self.tilemap):
-                    continue
-                d_enemy  = _dist(cover_pos, enemy_pos) + 0.1
-                d_player = _dist(cover_pos, player_pos)
-                score = d_player / d_enemy
-                if score > best_score:
-                    best_score = score
-                    best_pos   = cover_pos
-        return best_pos
+        """Point couvert le plus interessant (reserve pour cet ennemi)."""
+        return self.cover_index.find(enemy_pos, player_pos, owner=self.enemy)
@@ -0,0 +1,152 @@
+# bot_player.py - Joueur de substitution scripte (simulation hors ligne, equilibrage)
+#
+# Le bot lit directement le monde du serveur et produit le meme dict d'input
+# qu'un client reseau (make_input) : il passe donc par _apply_remote_input
+# exactement comme un vrai joueur.
+import math
+import pygame
+from settings import WEAPONS, WEAPON_ORDER, REVIVE_RANGE, TILE_SIZE, PATH_RECALC_TIME
+from game.network.messages import make_input
+from game.systems.collision import has_line_of_sight
+from game.world.map_data import PLAYER_START
+
+_KEEP_MIN  = 180.0   # px : recule si l'ennemi le plus proche est plus pres
+_KEEP_MAX  = 320.0   # px : avance si l'ennemi le plus proche est plus loin
+_HOME_R    = TILE_SIZE * 2   # px : zone de repos autour de PLAYER_START
+_DECIDE_S  = 0.25    # s : duree minimale d'une decision de deplacement en combat
+_IDX_RIFLE = WEAPON_ORDER.index("rifle")
+_IDX_SMG   = WEAPON_ORDER.index("smg")
+_IDX_PISTOL = WEAPON_ORDER.index("pistol")
+
+
+def _axis(v: float, length: float) -> float:
+    """Quantifie une composante comme un clavier (-1, 0, 1)."""
+    if length <= 0 or abs(v) < length * 0.38:
+        return 0.0
+    return 1.0 if v > 0 else -1.0
+
+
+class BotPlayer:
+    """Garde ses distances, vise l'ennemi le plus proche et tire s'il le voit,
+    releve les coequipiers a terre quand la voie est libre."""
+
+    def __init__(self, player_id: int, rng):
+        self.player_id = player_id
+        self.rng       = rng
+        self._tick     = 0
+        self._strafe   = 1.0
+        self._strafe_timer = 0.0
+        self._detour: pygame.Vector2 | None = None
+        self._detour_timer = 0.0
+        self._last_pos: pygame.Vector2 | None = None
+        self._path: list[pygame.Vector2] = []
+        self._path_timer = 0.0
+        self._wish = pygame.Vector2(0, 0)
+        self._wish_timer = 0.0
+
+    def think(self, game, dt: float) -> dict:
+        self._tick += 1
+        p = game.players.get(self.player_id)
+        if p is None or p.state != "alive":
+            return self._input(0.0, 0.0, 0.0, False, _IDX_RIFLE, False)
+
+        pos = p.pos
+        stuck = (self._last_pos is not None
+                 and (pos - self._last_pos).length_squared() < 0.25)
+        self._last_pos = pygame.Vector2(pos)
+        self._path_timer -= dt
+
+        nearest, nearest_d = None, float("inf")
+        for e in game.enemy_group:
+            d = (e.pos - pos).length()
+            if d < nearest_d:
+                nearest, nearest_d = e, d
+
+        # Relever un coequipier a terre si aucun ennemi n'est au contact
+        if nearest_d > _KEEP_MIN:
+            for other in game.players.values():
+                if other is p or other.state != "down":
+                    continue
+                to_mate = other.pos - pos
+                if to_mate.length() <= REVIVE_RANGE * 0.8:
+                    return self._input(0.0, 0.0, p.facing_angle, False, _IDX_RIFLE, True)
+                return self._move(self._route(game, pos, other.pos), p.facing_angle,
+                                  False, _IDX_RIFLE, stuck, dt)
+
+        if nearest is None:
+            home = pygame.Vector2(PLAYER_START)
+            if (home - pos).length() < _HOME_R:
+                home = pygame.Vector2(0, 0)
+            else:
+                home = self._route(game, pos, home)
+            return self._move(home, p.facing_angle, False, _IDX_RIFLE, stuck, dt)
+
+        to_enemy = nearest.pos - pos
+        aim = math.degrees(math.atan2(to_enemy.y, to_enemy.x))
+        weapon_idx = self._pick_weapon(p, nearest_d)
+        wrange = WEAPONS[WEAPON_ORDER[weapon_idx]]["bullet_range"]
+        shooting = nearest_d <= wrange and has_line_of_sight(pos, nearest.pos, game.tilemap)
+
+        # Decision tenue _DECIDE_S : evite d'osciller au coin d'un mur
+        # (recule -> perd la ligne de vue -> avance -> la retrouve ...)
+        self._wish_timer -= dt
+        self._strafe_timer -= dt
+        if self._wish_timer <= 0:
+            self._wish_timer = _DECIDE_S
+            if nearest_d > _KEEP_MAX or not shooting:
+                self._wish = self._route(game, pos, nearest.pos)
+            elif nearest_d < _KEEP_MIN:
+                self._wish = -to_enemy
+            else:
+                if self._strafe_timer <= 0:
+                    self._strafe = self.rng.choice((-1.0, 1.0))
+                    self._strafe_timer = self.rng.uniform(0.8, 2.0)
+                self._wish = pygame.Vector2(-to_enemy.y, to_enemy.x) * self._strafe
+        return self._move(self._wish, aim, shooting, weapon_idx, stuck, dt)
+
+    # ------------------------------------------------------------------
+    def _pick_weapon(self, p, dist: float) -> int:
+        """SMG au contact, fusil sinon ; jamais une arme vide non rechargee."""
+        if p.is_reloading:
+            return p.active_weapon_idx   # changer d'arme perdrait le rechargement
+        close = dist < WEAPONS["smg"]["bullet_range"] * 0.7
+        prefs = (_IDX_SMG, _IDX_RIFLE) if close else (_IDX_RIFLE, _IDX_SMG)
+        for idx in prefs + (_IDX_PISTOL,):
+            if p.ammo.get(WEAPON_ORDER[idx], 0) > 0:
+                return idx
+        return _IDX_PISTOL
+
+    def _route(self, game, pos: pygame.Vector2, target: pygame.Vector2) -> pygame.Vector2:
+        """Direction vers target : ligne droite si visible, sinon chemin A*."""
+        if has_line_of_sight(pos, target, game.tilemap):
+            self._path = []
+            return target - pos
+        if self._path_timer <= 0 or not self._path:
+            self._path = game.pathfinder.find_path(pos, target)
+            self._path_timer = PATH_RECALC_TIME
+        while self._path and (self._path[0] - pos).length() < TILE_SIZE * 0.5:
+            self._path.pop(0)
+        if not self._path:
+            return target - pos
+        return self._path[0] - pos
+
+    def _move(self, wish: pygame.Vector2, aim: float, shooting: bool,
+              weapon_idx: int, stuck: bool, dt: float) -> dict:
+        # Bloque contre un mur : direction aleatoire pendant un court instant
+        if stuck and wish.length_squared() > 0 and self._detour is None:
+            angle = self.rng.uniform(0, math.tau)
+            self._detour = pygame.Vector2(math.cos(angle), math.sin(angle))
+            self._detour_timer = self.rng.uniform(0.3, 0.7)
+        if self._detour is not None:
+            wish = self._detour
+            self._detour_timer -= dt
+            if self._detour_timer <= 0:
+                self._detour = None
+        length = wish.length()
+        return self._input(_axis(wish.x, length), _axis(wish.y, length),
+                           aim, shooting, weapon_idx, False)
+
+    def _input(self, dx: float, dy: float, aim: float, shooting: bool,
+               weapon_idx: int, revive: bool) -> dict:
+        return make_input(self.player_id, self._tick, dx, dy, aim,
+                          shooting, weapon_idx, revive)
@@ -48,11 +48,73 @@ def move_and_collide(entity, dx: float, dy: float, tilemap) -> None:
     rect.clamp_ip(pygame.Rect(0, 0, MAP_W, MAP_H))
 
 
-def bullet_hits_tile(bullet, tilemap) -> bool:
-    """Renvoie True si la balle touche une tuile solide."""
-    col = int(bullet.rect.centerx // TILE_SIZE)
-    row = int(bullet.rect.centery // TILE_SIZE)
-    return tilemap.is_solid(col, row)
+def sweep_tiles(p0: pygame.Vector2, p1: pygame.Vector2,
+                tilemap) -> tuple[float, str | None] | None:
+    """Premiere tuile solide traversee par le segment p0 -> p1 (parcours DDA
+    de toutes les tuiles traversees, independant de la longueur du pas).
+
+    Renvoie (t, axe) : t dans [0, 1] a l'entree dans la tuile, axe "x" ou "y"
+    selon la face franchie (None si p0 est deja dans un mur) ; None si libre."""
+    col = int(p0.x // TILE_SIZE)
+    row = int(p0.y // TILE_SIZE)
+    if tilemap.is_solid(col, row):
+        return 0.0, None
+    dx = p1.x - p0.x
+    dy = p1.y - p0.y
+    inf = float("inf")
+    if dx:
+        step_c = 1 if dx > 0 else -1
+        t_x = ((col + (dx > 0)) * TILE_SIZE - p0.x) / dx
+        dt_x = TILE_SIZE / abs(dx)
+    else:
+        step_c, t_x, dt_x = 0, inf, inf
+    if dy:
+        step_r = 1 if dy > 0 else -1
+        t_y = ((row + (dy > 0)) * TILE_SIZE - p0.y) / dy
+        dt_y = TILE_SIZE / abs(dy)
+    else:
+        step_r, t_y, dt_y = 0, inf, inf
+
+    while True:
+        if t_x < t_y:
+            if t_x > 1.0:
+                return None
+            col += step_c
+            t, axis = t_x, "x"
+            t_x += dt_x
+        else:
+            if t_y > 1.0:
+                return None
+            row += step_r
+            t, axis = t_y, "y"
+            t_y += dt_y
+        if tilemap.is_solid(col, row):
+            return t, axis
+
+
+def sweep_rect(p0: pygame.Vector2, p1: pygame.Vector2,
+               rect: pygame.Rect) -> float | None:
+    """Instant t dans [0, 1] ou le segment p0 -> p1 entre dans rect (0 si p0
+    y est deja), None s'il ne le touche pas. Pour un projectile de taille
+    (w, h), passer le rect cible gonfle de (w, h) (somme de Minkowski)."""
+    t0, t1 = 0.0, 1.0
+    for start, d, lo, hi in ((p0.x, p1.x - p0.x, rect.left, rect.right),
+                             (p0.y, p1.y - p0.y, rect.top, rect.bottom)):
+        if d == 0:
+            if start < lo or start > hi:
+                return None
+            continue
+        a = (lo - start) / d
+        b = (hi - start) / d
+        if a > b:
+            a, b = b, a
+        if a > t0:
+            t0 = a
+        if b < t1:
+            t1 = b
+        if t0 > t1:
+            return None
+    return t0
 
 
 def has_line_of_sight(start: pygame.Vector2, end: pygame.Vector2, tilemap) -> bool:
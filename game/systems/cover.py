@@ -0,0 +1,145 @@
+# cover.py - Index des points de couverture, construit une fois par carte
+#
+# Un point de couverture est une tuile praticable voisine (4-connexe) d'une
+# tuile solide. Pour chacune, on precalcule un masque de secteurs protegés :
+# le secteur s (COVER_SECTORS secteurs de 360/COVER_SECTORS degres) est
+# protege si un rayon court partant du centre de la tuile dans cette
+# direction rencontre un obstacle. Une requete ne garde que les points dont
+# le secteur tourne vers la menace est protege, les classe, et ne lance le
+# raycast exact (has_line_of_sight) que sur les COVER_TOP_K meilleurs.
+#
+# Les ennemis reservent leur point (find(..., owner=enemy)) pour ne pas
+# s'entasser sur la meme tuile ; une reservation tombe avec release(owner)
+# ou quand le proprietaire meurt (attribut alive a False).
+import math
+import weakref
+import pygame
+from settings import (
+    TILE_SIZE, COVER_RANGE, COVER_SECTORS, COVER_TOP_K, COVER_PROBE, LOS_STEP,
+)
+from game.systems.collision import has_line_of_sight
+
+_BUCKET = 4   # tuiles par cote d'une case de l'index spatial
+
+
+class CoverIndex:
+    def __init__(self, tilemap):
+        self.tilemap = tilemap
+        self.cells: list[tuple[int, int]] = []
+        self.centers: dict[tuple[int, int], pygame.Vector2] = {}
+        self.masks: dict[tuple[int, int], int] = {}    # bit s = secteur s protege
+        self._buckets: dict[tuple[int, int], list[tuple[int, int]]] = {}
+        self._claims: dict[tuple[int, int], object] = {}   # tuile -> proprietaire
+        self._owned: dict[int, tuple[int, int]] = {}       # id(proprietaire) -> tuile
+        self._build()
+
+    # ------------------------------------------------------------------
+    def _build(self):
+        tm = self.tilemap
+        step = TILE_SIZE * LOS_STEP
+        probes = []
+        for s in range(COVER_SECTORS):
+            a = (s + 0.5) * math.tau / COVER_SECTORS
+            n = max(1, int(COVER_PROBE / step))
+            probes.append([(math.cos(a) * step * i, math.sin(a) * step * i)
+                           for i in range(1, n + 1)])
+
+        for row in range(tm.rows):
+            for col in range(tm.cols):
+                if tm.is_solid(col, row):
+                    continue
+                if not any(tm.is_solid(col + dc, row + dr)
+                           for dc, dr in ((-1, 0), (1, 0), (0, -1), (0, 1))):
+                    continue
+                center = tm.tile_center(col, row)
+                mask = 0
+                for s, points in enumerate(probes):
+                    for ox, oy in points:
+                        if tm.is_solid(int((center.x + ox) // TILE_SIZE),
+                                       int((center.y + oy) // TILE_SIZE)):
+                            mask |= 1 << s
+                            break
+                if not mask:
+                    continue
+                cell = (col, row)
+                self.cells.append(cell)
+                self.centers[cell] = center
+                self.masks[cell] = mask
+                self._buckets.setdefault((col // _BUCKET, row // _BUCKET), []).append(cell)
+
+    # ------------------------------------------------------------------
+    def _sector(self, origin: pygame.Vector2, toward: pygame.Vector2) -> int:
+        a = math.atan2(toward.y - origin.y, toward.x - origin.x) % math.tau
+        return int(a / math.tau * COVER_SECTORS) % COVER_SECTORS
+
+    def _free_for(self, cell: tuple[int, int], owner) -> bool:
+        other = self._claims.get(cell)
+        if other is None or other is owner:
+            return True
+        if not getattr(other, "alive", True):   # proprietaire mort : liberer
+            self._claims.pop(cell, None)
+            self._owned.pop(id(other), None)
+            return True
+        return False
+
+    def candidates(self, pos: pygame.Vector2, radius: float):
+        """Points de couverture dont le centre est a moins de radius de pos."""
+        r2 = radius * radius
+        b = int(radius // (TILE_SIZE * _BUCKET)) + 1
+        bc, br = int(pos.x // TILE_SIZE) // _BUCKET, int(pos.y // TILE_SIZE) // _BUCKET
+        for by in range(br - b, br + b + 1):
+            for bx in range(bc - b, bc + b + 1):
+                for cell in self._buckets.get((bx, by), ()):
+                    if (self.centers[cell] - pos).length_squared() <= r2:
+                        yield cell
+
+    def find(self, enemy_pos: pygame.Vector2, threat_pos: pygame.Vector2,
+             owner=None, radius: float = COVER_RANGE + TILE_SIZE) -> pygame.Vector2 | None:
+        """Meilleur point couvert face a threat_pos (reserve pour owner s'il est donne)."""
+        scored = []
+        for cell in self.candidates(enemy_pos, radius):
+            center = self.centers[cell]
+            if not self.masks[cell] >> self._sector(center, threat_pos) & 1:
+                continue
+            if not self._free_for(cell, owner):
+                continue
+            d_enemy  = (center - enemy_pos).length() + 0.1
+            d_player = (center - threat_pos).length()
+            scored.append((d_player / d_enemy, cell))
+        if not scored:
+            return None
+
+        scored.sort(key=lambda sc: sc[0], reverse=True)
+        for _score, cell in scored[:COVER_TOP_K]:
+            center = self.centers[cell]
+            if has_line_of_sight(center, threat_pos, self.tilemap):
+                continue
+            if owner is not None:
+                self.reserve(cell, owner)
+            return center.copy()
+        return None
+
+    # ------------------------------------------------------------------
+    def reserve(self, cell: tuple[int, int], owner) -> None:
+        self.release(owner)
+        self._claims[cell] = owner
+        self._owned[id(owner)] = cell
+
+    def release(self, owner) -> None:
+        cell = self._owned.pop(id(owner), None)
+        if cell is not None and self._claims.get(cell) is owner:
+            del self._claims[cell]
+
+    def reserved_by(self, cell: tuple[int, int]):
+        return self._claims.get(cell)
+
+
+_indexes: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def cover_index_for(tilemap) -> CoverIndex:
+    """Index de la carte (construit au premier appel, partage ensuite)."""
+    index = _indexes.get(tilemap)
+    if index is None:
+        index = _indexes[tilemap] = CoverIndex(tilemap)
+    return index
@@ -0,0 +1,67 @@
+# determinism.py - Empreinte de l'etat du monde pour le mode deterministe
+#
+# Avec une graine fixe (ServerGame(seed=...)) et un dt fixe, le meme journal
+# d'inputs doit produire exactement le meme monde. state_hash() resume l'etat
+# simule a un tick donne : comparer deux executions tick par tick (ancienne et
+# nouvelle implementation d'un systeme) revient a comparer leurs empreintes.
+import hashlib
+
+
+def _f(value: float) -> str:
+    # repr() d'un float est exact (aller-retour garanti)
+    return repr(float(value))
+
+
+def state_lines(game) -> list[str]:
+    """Etat simule sous forme de lignes texte stables (utile pour diff)."""
+    lines = []
+    for pid in sorted(game.players):
+        p = game.players[pid]
+        lines.append(
+            f"P {pid} {_f(p.pos.x)} {_f(p.pos.y)} {p.hp} {p.state} "
+            f"{_f(p.facing_angle)} {p.active_weapon_idx} {p.score} "
+            f"{sorted(p.ammo.items())} {p.is_reloading} {_f(p.reload_timer)} "
+            f"{_f(p.fire_timer)} {_f(p.down_timer)} {_f(p.revive_progress)}")
+    # Ordre d'iteration des groupes = ordre d'insertion (deterministe).
+    # enemy_id vient d'un compteur global au processus : exclu de l'empreinte.
+    for e in game.enemy_group:
+        lines.append(
+            f"E {e.enemy_type} {_f(e.pos.x)} {_f(e.pos.y)} {e.hp} "
+            f"{_f(e.facing_angle)} {_f(e.fire_timer)} {e.ai.state}")
+    for b in game.bullet_group:
+        lines.append(
+            f"B {b.owner} {b.owner_id} {_f(b.pos.x)} {_f(b.pos.y)} "
+            f"{_f(b.velocity.x)} {_f(b.velocity.y)} {_f(b.traveled)}")
+    for g in game.grenade_group:
+        lines.append(
+            f"G {_f(g.pos.x)} {_f(g.pos.y)} {_f(g.velocity.x)} "
+            f"{_f(g.velocity.y)} {_f(g.fuse_timer)}")
+    for ex in game.explosion_group:
+        lines.append(f"X {_f(ex.pos.x)} {_f(ex.pos.y)} {_f(ex.timer)}")
+    for pk in game.pickup_group:
+        lines.append(f"K {pk.weapon_name} {_f(pk.pos.x)} {_f(pk.pos.y)}")
+    wm = game.wave_manager
+    lines.append(
+        f"W {wm.wave_number} {wm.state} {_f(wm.cooldown_timer)} "
+        f"{_f(wm.spawn_timer)} {len(wm.enemies_queue)} {game.state}")
+    return lines
+
+
+def state_hash(game) -> str:
+    """Empreinte hexadecimale (16 caracteres) de l'etat simule."""
+    h = hashlib.blake2b(digest_size=8)
+    for line in state_lines(game):
+        h.update(line.encode())
+        h.update(b"\n")
+    return h.hexdigest()
+
+
+def first_divergence(hashes_a: list[str], hashes_b: list[str]) -> int | None:
+    """Indice du premier tick ou deux suites d'empreintes different
+    (None si identiques sur la longueur commune et de meme longueur)."""
+    for i, (a, b) in enumerate(zip(hashes_a, hashes_b)):
+        if a != b:
+            return i
+    if len(hashes_a) != len(hashes_b):
+        return min(len(hashes_a), len(hashes_b))
+    return None
@@ -0,0 +1,214 @@
+# path_service.py - Pathfinding etale : A* resolu hors du tick ou sous budget
+#
+# workers=0 (defaut) : les demandes (request) sont resolues dans le processus,
+# au plus PATH_SOLVES_PER_TICK par tick. Sous ce budget le chemin est calcule
+# et livre tout de suite (aucun delai) ; au-dela il attend dans une file FIFO
+# videe en debut des ticks suivants (tick). Un afflux de demandes (apparition
+# d'une vague) s'etale ainsi sur plusieurs ticks au lieu d'en allonger un
+# seul ; l'ennemi en attente continue sur son ancien chemin, ou fonce droit
+# vers la cible. Budget en nombre de chemins (pas en temps) : la partie
+# reste deterministe (mode seed / rejeu, wave_balance.py).
+#
+# workers>0 : les demandes partent dans un pool de processus qui partage une
+# grille de praticabilite en lecture seule ; le resultat est livre au plus
+# tot PATH_ASYNC_TICKS ticks plus tard. Un job pas encore fini a son tick de
+# livraison est reporte au tick suivant (compte dans waits), jamais attendu
+# ni recalcule : l'ordre de livraison depend alors de la charge, ce mode
+# n'est pas deterministe. Une erreur du worker renvoie la demande dans la
+# file locale ; un pool casse (BrokenProcessPool) ou muet (aucun resultat
+# _JOB_TIMEOUT_TICKS apres l'echeance et _JOB_TIMEOUT_S apres l'envoi :
+# les deux, pour tolerer le demarrage des workers en simulation acceleree ; ex. script lance sans garde __main__ avec spawn :
+# les workers meurent au demarrage) est abandonne et le service passe en
+# workers=0.
+import atexit
+import multiprocessing
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pygame
+from settings import TILE_SIZE, PATH_WORKERS, PATH_ASYNC_TICKS, PATH_SOLVES_PER_TICK
+from game.systems.pathfinding import Pathfinder
+
+_READY_TTL_TICKS   = 120   # chemin livre non recupere : oublie apres ce delai
+_JOB_TIMEOUT_TICKS = 60  # job du pool en retard d'autant de ticks ...
+_JOB_TIMEOUT_S     = 1.0 # ... et sans resultat depuis autant de secondes : pool abandonne
+
+
+class _Grid:
+    """Carte en lecture seule (praticabilite seule) pour Pathfinder dans un worker."""
+
+    def __init__(self, solid: bytes, cols: int, rows: int):
+        self.solid = solid
+        self.cols  = cols
+        self.rows  = rows
+
+    def in_bounds(self, col: int, row: int) -> bool:
+        return 0 <= col < self.cols and 0 <= row < self.rows
+
+    def is_solid(self, col: int, row: int) -> bool:
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            return self.solid[row * self.cols + col] != 0
+        return True   # hors limites = mur (comme TileMap.get_tile)
+
+    def tile_center(self, col: int, row: int) -> pygame.Vector2:
+        return pygame.Vector2(col * TILE_SIZE + TILE_SIZE // 2,
+                              row * TILE_SIZE + TILE_SIZE // 2)
+
+
+def _solidity(tilemap) -> bytes:
+    return bytes(1 if tilemap.is_solid(c, r) else 0
+                 for r in range(tilemap.rows) for c in range(tilemap.cols))
+
+
+# ---------------------------------------------------------------- worker
+
+_worker_pathfinder: Pathfinder | None = None
+
+
+def _worker_init(solid: bytes, cols: int, rows: int) -> None:
+    global _worker_pathfinder
+    signal.signal(signal.SIGINT, signal.SIG_IGN)   # l'arret vient du processus parent
+    _worker_pathfinder = Pathfinder(_Grid(solid, cols, rows))
+
+
+def _solve(sx: float, sy: float, ex: float, ey: float) -> list[tuple[float, float]]:
+    path = _worker_pathfinder.find_path(pygame.Vector2(sx, sy), pygame.Vector2(ex, ey))
+    return [(p.x, p.y) for p in path]
+
+
+# Un pool par (carte, taille) : reutilise d'une partie a l'autre
+_pools: dict[tuple, ProcessPoolExecutor] = {}
+
+
+def _pool_for(solid: bytes, cols: int, rows: int, workers: int) -> ProcessPoolExecutor:
+    key = (solid, cols, rows, workers)
+    pool = _pools.get(key)
+    if pool is None:
+        # spawn : pas de fork d'un processus qui porte deja les threads reseau
+        pool = ProcessPoolExecutor(max_workers=workers,
+                                   mp_context=multiprocessing.get_context("spawn"),
+                                   initializer=_worker_init, initargs=(solid, cols, rows))
+        pool.submit(int)   # demarrer les processus maintenant (lobby), pas au 1er A*
+        _pools[key] = pool
+    return pool
+
+
+def _drop_pool(pool: ProcessPoolExecutor) -> None:
+    """Retire un pool casse : la prochaine partie en recree un neuf."""
+    for key in [k for k, p in _pools.items() if p is pool]:
+        del _pools[key]
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_pools() -> None:
+    for pool in _pools.values():
+        pool.shutdown(wait=False, cancel_futures=True)
+    _pools.clear()
+
+
+atexit.register(shutdown_pools)
+
+
+# ---------------------------------------------------------------- service
+
+class PathService:
+    def __init__(self, tilemap, pathfinder, workers: int = PATH_WORKERS,
+                 delay_ticks: int = PATH_ASYNC_TICKS,
+                 solves_per_tick: int = PATH_SOLVES_PER_TICK):
+        self.pathfinder = pathfinder
+        self.delay      = max(1, delay_ticks)
+        self.per_tick   = max(1, solves_per_tick)
+        self._pool      = (_pool_for(_solidity(tilemap), tilemap.cols, tilemap.rows, workers)
+                           if workers > 0 else None)
+        self._tick   = 0
+        self._budget = self.per_tick   # calculs locaux restants pour ce tick
+        self._queue:   dict = {}   # demandeur -> (depart, arrivee), ordre d'arrivee
+        self._pending: dict = {}   # demandeur -> (tick de livraison, future, depart, arrivee, envoi)
+        self._ready:   dict = {}   # demandeur -> (tick de livraison, chemin)
+
+        self.requests = 0   # demandes depuis la creation
+        self.queued   = 0   # demandes reportees a un tick suivant (budget epuise)
+        self.waits    = 0   # jobs du pool pas finis a leur tick, reportes d'un tick
+        self.inline   = 0   # chemins calcules dans le processus (hors pool)
+
+    def tick(self) -> None:
+        """Debut de tick : livre les chemins du pool finis a echeance, puis
+        vide la file locale dans la limite du budget."""
+        self._tick += 1
+        self._budget = self.per_tick
+        # Livraisons jamais recuperees (demandeur mort ou sorti de poursuite)
+        stale = self._tick - _READY_TTL_TICKS
+        for owner in [o for o, (t, _) in self._ready.items() if t < stale]:
+            del self._ready[owner]
+        due = [owner for owner, (t, *_) in self._pending.items() if t <= self._tick]
+        for owner in due:
+            due_tick, job, start, end, sent = self._pending[owner]
+            if not job.done():
+                if (self._tick - due_tick > _JOB_TIMEOUT_TICKS
+                        and time.monotonic() - sent > _JOB_TIMEOUT_S):
+                    self._disable_pool()  # la file locale reprend tout
+                    break
+                self.waits += 1          # reporte : jamais d'attente dans le tick
+                continue
+            del self._pending[owner]
+            try:
+                path = [pygame.Vector2(x, y) for x, y in job.result()]
+            except BrokenProcessPool:
+                self._queue[owner] = (start, end)
+                self._disable_pool()
+                break
+            except Exception:
+                self._queue[owner] = (start, end)   # erreur du worker : calcul local
+                continue
+            self._ready[owner] = (self._tick, path)
+        while self._queue and self._budget > 0:
+            owner = next(iter(self._queue))
+            self._solve(owner, *self._queue.pop(owner))
+
+    def _solve(self, owner, start: pygame.Vector2, end: pygame.Vector2) -> None:
+        self._budget -= 1
+        self.inline += 1
+        self._ready[owner] = (self._tick, self.pathfinder.find_path(start, end))
+
+    def _disable_pool(self) -> None:
+        """Pool casse : ses jobs en cours repartent dans la file locale."""
+        if self._pool is None:
+            return
+        print("[path] Pool A* hors service : calcul dans le tick (workers=0)")
+        _drop_pool(self._pool)
+        self._pool = None
+        for owner, (_, _, start, end, _) in self._pending.items():
+            self._queue[owner] = (start, end)
+        self._pending.clear()
+
+    def request(self, owner, start: pygame.Vector2, end: pygame.Vector2) -> None:
+        """Demande un chemin (remplace la demande en cours du meme demandeur)."""
+        self.requests += 1
+        self._queue.pop(owner, None)
+        self._pending.pop(owner, None)
+        # Copies : start est souvent enemy.pos, modifie d'ici le calcul
+        start, end = pygame.Vector2(start), pygame.Vector2(end)
+        if self._pool is not None:
+            try:
+                job = self._pool.submit(_solve, start.x, start.y, end.x, end.y)
+            except BrokenProcessPool:
+                self._disable_pool()
+            else:
+                self._pending[owner] = (self._tick + self.delay, job, start, end,
+                                        time.monotonic())
+                return
+        if not self._queue and self._budget > 0:
+            self._solve(owner, start, end)   # budget libre : livre tout de suite
+        else:
+            self.queued += 1
+            self._queue[owner] = (start, end)
+
+    def pending(self, owner) -> bool:
+        return owner in self._pending or owner in self._queue
+
+    def take(self, owner) -> list[pygame.Vector2] | None:
+        """Chemin livre pour owner (une seule fois), sinon None."""
+        delivered = self._ready.pop(owner, None)
+        return delivered[1] if delivered else None
@@ -1,13 +1,37 @@
-# pathfinding.py - Algorithme A* sur la grille de tuiles
+# pathfinding.py - Recherche de chemin sur la grille de tuiles
+#
+# Deux modes (PATH_MODE) :
+#   "astar" : A* 8-connexe puis lissage (_smooth, lignes de vue a rebours
+#             depuis la fin du chemin pour chaque ancre : quadratique).
+#   "theta" : lazy Theta* : chaque noeud herite du parent de son predecesseur
+#             (segment a angle quelconque), la ligne de vue n'est verifiee
+#             qu'a l'expansion du noeud (une par noeud developpe), sur la
+#             grille de solidite. Le chemin sort deja lisse. Heuristique
+#             euclidienne (admissible pour des segments libres : chemin le
+#             plus court) ; lignes de vue memorisees d'une requete a l'autre
+#             (carte statique, cache borne a PATH_LOS_CACHE paires).
+#             Plus court que "astar" mais plus de lignes de vue demandees
+#             (bench theta_path_* / find_path_*, compteur los) : "astar"
+#             reste le mode par defaut.
+# Meme contrat dans les deux cas : liste de positions monde, la derniere
+# etant end_world.
 import heapq
 import math
 import pygame
-from settings import TILE_SIZE, MAX_ASTAR_NODES
+from settings import TILE_SIZE, MAX_ASTAR_NODES, PATH_MODE, PATH_LOS_CACHE
 
 
 class Pathfinder:
-    def __init__(self, tilemap):
+    def __init__(self, tilemap, mode: str | None = None):
         self.tilemap = tilemap
+        self.mode    = mode or PATH_MODE
+        self.service = None   # PathService (path_service.py) : A* hors du tick
+        self.los_checks = 0   # lignes de vue demandees depuis la creation (bench)
+        self.los_rays   = 0   # ... dont reellement lancees (hors cache de visibilite)
+        self._adj = None      # mode theta : voisins par tuile (_build_grid)
+        self._vis: dict[tuple, bool] = {}   # mode theta : (tuile, tuile) -> visible
+        if self.mode == "theta":
+            self._build_grid()   # a la creation du monde, pas au 1er chemin
 
     def find_path(self, start_world: pygame.Vector2,
                   end_world: pygame.Vector2) -> list[pygame.Vector2]:
@@ -26,6 +50,9 @@ class Pathfinder:
             if ec is None:
                 return []
 
+        if self.mode == "theta":
+            return self._theta(sc, ec, end_world)
+
         came_from: dict[tuple, tuple | None] = {sc: None}
         g_score: dict[tuple, float] = {sc: 0.0}
         open_set: list[tuple[float, tuple]] = []
@@ -55,9 +82,153 @@ class Pathfinder:
         best = min(came_from.keys(), key=lambda n: self._h(n, ec))
         return self._reconstruct(came_from, best, end_world)
 
+    def _theta(self, sc: tuple, ec: tuple,
+               end_world: pygame.Vector2) -> list[pygame.Vector2]:
+        """Lazy Theta* : parent suppose visible, verifie a l'expansion."""
+        adj, edges, los, h = self._adj, self._edges, self._visible, self._h_euclid
+        if los(sc, ec):   # ligne droite : chemin optimal sans recherche
+            return [self.tilemap.tile_center(*sc), end_world.copy()]
+
+        parent: dict[tuple, tuple] = {sc: sc}
+        g_score: dict[tuple, float] = {sc: 0.0}
+        closed: set[tuple] = set()
+        seen: set[tuple] = {sc}   # parent deja connu visible : pas de rayon
+        # (f, h, noeud) : a f egal, le plus proche de la cible d'abord
+        open_set: list[tuple[float, float, tuple]] = [(h(sc, ec), 0.0, sc)]
+        expansions = 0
+
+        while open_set:
+            _, _, current = heapq.heappop(open_set)
+            if current in closed:
+                continue   # entree perimee (noeud deja ameliore puis developpe)
+            # Parent non voisin et non visible : meilleur voisin deja developpe
+            # (il en existe toujours un : celui qui a ouvert ce noeud)
+            p = parent[current]
+            if current not in seen and not los(p, current):
+                best_g = float("inf")
+                for nc, cost in adj.get(current, ()):
+                    if nc in closed and g_score[nc] + cost < best_g:
+                        best_g, parent[current] = g_score[nc] + cost, nc
+                g_score[current] = best_g
+            closed.add(current)
+            if current == ec:
+                return self._reconstruct_theta(parent, ec, end_world)
+            expansions += 1
+            if expansions > MAX_ASTAR_NODES:
+                break
+
+            p = parent[current]
+            gp = g_score[p]
+            px, py = p
+            cx, cy = current
+            # Direction parent -> noeud si c'est une droite ou une diagonale exacte
+            ddx, ddy = cx - px, cy - py
+            if ddx and ddy and abs(ddx) != abs(ddy):
+                straight = None
+            else:
+                straight = ((ddx > 0) - (ddx < 0), (ddy > 0) - (ddy < 0))
+            for nc, cost in adj.get(current, ()):
+                if nc in closed:
+                    continue
+                ndx, ndy = nc[0] - px, nc[1] - py
+                if -1 <= ndx <= 1 and -1 <= ndy <= 1:
+                    if (p, nc) in edges:   # voisin direct du parent : visible
+                        tg, parent_nc, sure = gp + math.hypot(ndx, ndy), p, True
+                    else:                  # coin coupe : passer par current
+                        tg, parent_nc, sure = g_score[current] + cost, current, True
+                else:
+                    tg, parent_nc = gp + math.hypot(ndx, ndy), p
+                    # Prolongement exact d'une droite deja verifiee : l'arete
+                    # current -> nc suffit, pas de rayon a l'expansion
+                    sure = straight == (nc[0] - cx, nc[1] - cy)
+                if tg < g_score.get(nc, float("inf")):
+                    parent[nc] = parent_nc
+                    g_score[nc] = tg
+                    if sure:
+                        seen.add(nc)
+                    else:
+                        seen.discard(nc)
+                    hn = h(nc, ec)
+                    heapq.heappush(open_set, (tg + hn, hn, nc))
+
+        # Pas de chemin trouve : noeud developpe le plus proche de la cible
+        best = min(closed, key=lambda n: h(n, ec))
+        return self._reconstruct_theta(parent, best, end_world)
+
+    def _reconstruct_theta(self, parent: dict, end: tuple,
+                           end_world: pygame.Vector2) -> list[pygame.Vector2]:
+        path = [end_world.copy()]
+        cur = end
+        while parent[cur] != cur:
+            cur = parent[cur]
+            path.append(self.tilemap.tile_center(cur[0], cur[1]))
+        path.reverse()
+        return path
+
+    def _build_grid(self):
+        """Grille de solidite + voisins de chaque tuile praticable (carte
+        statique : calcule une fois par Pathfinder)."""
+        tm = self.tilemap
+        cols, rows = tm.cols, tm.rows
+        self._solid = bytes(1 if tm.is_solid(c, r) else 0
+                            for r in range(rows) for c in range(cols))
+        self._adj = {}
+        for r in range(rows):
+            for c in range(cols):
+                if not self._solid[r * cols + c]:
+                    self._adj[(c, r)] = tuple(
+                        (nc, 1.0 if nc[0] == c or nc[1] == r else math.sqrt(2))
+                        for nc in self._neighbors((c, r)))
+        self._edges = {(a, nc) for a, ns in self._adj.items() for nc, _ in ns}
+
+    def _visible(self, a: tuple, b: tuple) -> bool:
+        """_grid_los memorisee (symetrique : une entree par paire)."""
+        self.los_checks += 1
+        key = (a, b) if a <= b else (b, a)
+        vis = self._vis.get(key)
+        if vis is None:
+            if len(self._vis) >= PATH_LOS_CACHE:
+                self._vis.clear()
+            vis = self._vis[key] = self._grid_los(a, b)
+        return vis
+
+    def _grid_los(self, a: tuple, b: tuple) -> bool:
+        """Ligne de vue centre a centre entre deux tuiles : parcourt toutes les
+        tuiles traversees ; au passage exact d'un coin, les deux tuiles
+        adjacentes doivent etre libres (comme _neighbors). Arithmetique entiere."""
+        self.los_rays += 1
+        solid, cols = self._solid, self.tilemap.cols
+        x, y = a
+        x1, y1 = b
+        ax, ay = abs(x1 - x), abs(y1 - y)
+        sx = 1 if x1 > x else -1
+        sy = 1 if y1 > y else -1
+        # Instants (x 2*ax*ay) du prochain franchissement de bord vertical / horizontal
+        tx, ty = ay, ax
+        while x != x1 or y != y1:
+            if tx < ty:
+                x += sx
+                tx += 2 * ay
+            elif tx > ty:
+                y += sy
+                ty += 2 * ax
+            else:
+                if solid[y * cols + x + sx] or solid[(y + sy) * cols + x]:
+                    return False
+                x += sx
+                y += sy
+                tx += 2 * ay
+                ty += 2 * ax
+            if solid[y * cols + x]:
+                return False
+        return True
+
     def _h(self, a: tuple, b: tuple) -> float:
         return abs(a[0] - b[0]) + abs(a[1] - b[1])
 
+    def _h_euclid(self, a: tuple, b: tuple) -> float:
+        return math.hypot(a[0] - b[0], a[1] - b[1])
+
     def _neighbors(self, node: tuple) -> list[tuple]:
         col, row = node
         tm = self.tilemap
@@ -98,6 +269,8 @@ class Pathfinder:
         while i < len(path) - 1:
             j = len(path) - 1
             while j > i + 1:
+                self.los_checks += 1
+                self.los_rays += 1
                 if has_line_of_sight(path[i], path[j], self.tilemap):
                     break
                 j -= 1
@@ -0,0 +1,119 @@
+# perception.py - Perception de tous les ennemis en une passe par tick
+#
+# Avant la mise a jour des ennemis, Perception.update() calcule pour chacun
+# sa cible (joueur vivant le plus proche, ou la cible de son escouade) et sa
+# ligne de vue vers elle, puis depose le resultat dans enemy.ai.percept que
+# AIController.update consomme. Avec NumPy : matrice des distances
+# ennemis x joueurs, argmin par ligne, masque de portee de detection et
+# raycast de tous les rayons a la fois sur une grille de solidite. Sans
+# NumPy, ou sous PERCEPTION_NUMPY_MIN ennemis (le surcout fixe de NumPy y
+# domine) : meme calcul, un ennemi a la fois.
+#
+# Les deux chemins reproduisent exactement has_line_of_sight (memes pas
+# d'echantillonnage, memes arrondis) : le resultat, et donc la partie, est
+# identique avec ou sans NumPy.
+import pygame
+from settings import TILE_SIZE, PERCEPTION_NUMPY_MIN
+from game.systems.collision import has_line_of_sight
+from game.systems.ai import AI_PATROL
+
+try:
+    import numpy as np
+except ImportError:   # NumPy optionnel : repli scalaire
+    np = None
+
+_LOS_STEP_PX = TILE_SIZE * 0.4   # pas de has_line_of_sight
+
+
+def _alive(p) -> bool:
+    return getattr(p, "state", "alive") == "alive"
+
+
+def _squad_target(enemy):
+    squad = enemy.ai.squad
+    if squad is not None and squad.target is not None and _alive(squad.target):
+        return squad.target
+    return None
+
+
+class Perception:
+    def __init__(self, tilemap, use_numpy: bool | None = None):
+        self.tilemap   = tilemap
+        self.use_numpy = np is not None if use_numpy is None else (use_numpy and np is not None)
+        if self.use_numpy:
+            self._solid = np.array(
+                [[tilemap.is_solid(c, r) for c in range(tilemap.cols)]
+                 for r in range(tilemap.rows)], dtype=bool)
+        self.numpy_min = PERCEPTION_NUMPY_MIN
+        self.rays = 0   # rayons lances au dernier tick (hors portee : pas de rayon)
+
+    # ------------------------------------------------------------------
+    def update(self, enemies, players):
+        enemies = [e for e in enemies if e.alive]
+        alive = [p for p in players if _alive(p)]
+        if not enemies:
+            self.rays = 0
+            return
+        if not alive:
+            for e in enemies:
+                e.ai.percept = None
+            self.rays = 0
+            return
+        if self.use_numpy and len(enemies) >= self.numpy_min:
+            self._update_numpy(enemies, alive)
+        else:
+            self._update_scalar(enemies, alive)
+
+    def _update_scalar(self, enemies, alive):
+        tm = self.tilemap
+        rays = 0
+        for e in enemies:
+            target = _squad_target(e) or min(alive, key=lambda p: (p.pos - e.pos).length())
+            p_pos = pygame.Vector2(target.rect.center)
+            # En patrouille, la ligne de vue ne sert qu'a detecter une cible a portee
+            if e.ai.state == AI_PATROL and (p_pos - e.pos).length() > e.detect_range:
+                los = False
+            else:
+                los = has_line_of_sight(e.pos, p_pos, tm)
+                rays += 1
+            e.ai.percept = (target, los)
+        self.rays = rays
+
+    def _update_numpy(self, enemies, alive):
+        E = np.array([(e.pos.x, e.pos.y) for e in enemies])
+        P = np.array([(p.pos.x, p.pos.y) for p in alive])
+
+        # Cible : joueur le plus proche (1er en cas d'egalite, comme min())
+        diff = P[None, :, :] - E[:, None, :]
+        nearest = np.sqrt(diff[..., 0] * diff[..., 0]
+                          + diff[..., 1] * diff[..., 1]).argmin(axis=1)
+        targets = [_squad_target(e) or alive[j] for e, j in zip(enemies, nearest.tolist())]
+        T = np.array([t.rect.center for t in targets], dtype=float)
+
+        dx = T[:, 0] - E[:, 0]
+        dy = T[:, 1] - E[:, 1]
+        detect = np.array([e.detect_range for e in enemies], dtype=float)
+        patrol = np.array([e.ai.state == AI_PATROL for e in enemies])
+        need = ~(patrol & (np.sqrt(dx * dx + dy * dy) > detect))
+
+        los = np.zeros(len(enemies), dtype=bool)
+        dist = np.maximum(np.abs(dx), np.abs(dy))
+        los[need & (dist == 0)] = True
+        rows = np.nonzero(need & (dist > 0))[0]
+        if len(rows):
+            steps = (dist[rows] / _LOS_STEP_PX).astype(np.int64) + 1
+            t = np.arange(steps.max() + 1)[None, :] / steps[:, None]
+            wx = E[rows, 0][:, None] + dx[rows][:, None] * t
+            wy = E[rows, 1][:, None] + dy[rows][:, None] * t
+            col = np.floor_divide(wx, TILE_SIZE).astype(np.int64)
+            row = np.floor_divide(wy, TILE_SIZE).astype(np.int64)
+            grid = self._solid
+            inside = (col >= 0) & (col < grid.shape[1]) & (row >= 0) & (row < grid.shape[0])
+            solid = ~inside | grid[np.clip(row, 0, grid.shape[0] - 1),
+                                   np.clip(col, 0, grid.shape[1] - 1)]
+            sampled = np.arange(t.shape[1])[None, :] <= steps[:, None]
+            los[rows] = ~(solid & sampled).any(axis=1)
+        self.rays = len(rows)
+
+        for e, target, seen in zip(enemies, targets, los.tolist()):
+            e.ai.percept = (target, seen)
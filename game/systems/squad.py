@@ -0,0 +1,160 @@
+# squad.py - Coordination des ennemis par escouade
+#
+# Les ennemis proches (SQUAD_RADIUS autour d'un chef, SQUAD_MAX membres) sont
+# regroupes en escouades. Toutes les SQUAD_THINK_TIME secondes, chaque
+# escouade :
+#   - choisit UNE cible (joueur vivant le plus proche du chef) ;
+#   - partage la ligne de vue : chaque membre la calcule au plus une fois par
+#     intervalle (cache vide a chaque reflexion) ;
+#   - calcule UN chemin A* (celui du chef, tous les PATH_RECALC_TIME) ;
+#   - place les autres membres en formation en coin derriere le chef.
+# La machine d'etats de ai.py reste maitre des reactions locales (tir,
+# suppression, couverture) ; les points de couverture sont distribues sans
+# collision par les reservations de l'index (cover.py).
+import pygame
+from settings import (
+    TILE_SIZE, PATH_RECALC_TIME,
+    SQUAD_RADIUS, SQUAD_MAX, SQUAD_THINK_TIME, SQUAD_SPACING,
+)
+from game.systems.collision import has_line_of_sight
+from game.systems.ai import AI_CHASE
+
+
+class Squad:
+    def __init__(self, leader):
+        self.leader  = leader
+        self.members = [leader]
+        self.target  = None
+        self.target_pos: pygame.Vector2 | None = None
+        self.path: list[pygame.Vector2] = []
+        self.path_version = 0
+        self.path_timer   = 0.0
+        self._heading = pygame.Vector2(1, 0)
+        self._los:   dict = {}   # membre -> ligne de vue vers la cible
+        self._clear: dict = {}   # membre -> trajet direct vers son slot
+
+    # ------------------------------------------------------------------
+    def think(self, players, tilemap, pathfinder, dt: float):
+        leader = self.leader
+        alive = [p for p in players if getattr(p, "state", "alive") == "alive"]
+        self.target = min(alive, key=lambda p: (p.pos - leader.pos).length()) if alive else None
+        self.target_pos = pygame.Vector2(self.target.rect.center) if self.target else None
+        self._los.clear()
+        self._clear.clear()
+        if self.target_pos is None:
+            self.path = []
+            return
+
+        to_target = self.target_pos - leader.pos
+        if to_target.length_squared() > 0:
+            self._heading = to_target.normalize()
+
+        # Un seul A* par escouade, pour le chef, s'il poursuit
+        self.path_timer -= dt
+        if leader.ai.state == AI_CHASE and (self.path_timer <= 0 or not self.path):
+            service = pathfinder.service
+            if service is None:
+                self.set_path(pathfinder.find_path(leader.pos, self.target_pos))
+                self.path_timer = PATH_RECALC_TIME
+            elif not service.pending(self):
+                service.request(self, leader.pos, self.target_pos)
+                self.path_timer = PATH_RECALC_TIME
+
+    def set_path(self, path: list[pygame.Vector2]):
+        self.path = path
+        self.path_version += 1
+
+    def has_los(self, enemy, tilemap) -> bool:
+        """Ligne de vue du membre vers la cible commune (cachee par intervalle)."""
+        los = self._los.get(enemy)
+        if los is None:
+            los = self._los[enemy] = has_line_of_sight(enemy.pos, self.target_pos, tilemap)
+        return los
+
+    def slot(self, enemy) -> pygame.Vector2:
+        """Position en formation (coin derriere le chef, oriente vers la cible)."""
+        i = self.members.index(enemy)
+        if i == 0:
+            return self.leader.pos
+        rank = (i + 1) // 2
+        side = 1 if i % 2 else -1
+        h = self._heading
+        return (self.leader.pos - h * (rank * SQUAD_SPACING)
+                + pygame.Vector2(-h.y, h.x) * (side * rank * SQUAD_SPACING))
+
+    def slot_reachable(self, enemy, slot: pygame.Vector2, tilemap) -> bool:
+        """Trajet direct vers le slot sans mur (cache par intervalle)."""
+        clear = self._clear.get(enemy)
+        if clear is None:
+            col, row = int(slot.x // TILE_SIZE), int(slot.y // TILE_SIZE)
+            clear = (not tilemap.is_solid(col, row)
+                     and has_line_of_sight(enemy.pos, slot, tilemap))
+            self._clear[enemy] = clear
+        return clear
+
+
+class SquadManager:
+    """Regroupe les ennemis et fait reflechir les escouades (une fois par tick)."""
+
+    def __init__(self, tilemap, pathfinder):
+        self.tilemap    = tilemap
+        self.pathfinder = pathfinder
+        self.squads: list[Squad] = []
+        self._timer = 0.0
+
+    def update(self, dt: float, enemies, players):
+        service = self.pathfinder.service
+        if service is not None:   # chemins de chef livres ce tick
+            for squad in self.squads:
+                path = service.take(squad)
+                if path is not None:
+                    squad.set_path(path)
+        self._timer -= dt
+        if self._timer > 0:
+            return
+        elapsed = SQUAD_THINK_TIME - self._timer
+        self._timer = SQUAD_THINK_TIME
+        self._regroup(enemies)
+        for squad in self.squads:
+            squad.think(players, self.tilemap, self.pathfinder, elapsed)
+
+    # ------------------------------------------------------------------
+    def _regroup(self, enemies):
+        r2 = SQUAD_RADIUS * SQUAD_RADIUS
+        drift2 = r2 * 2.25   # un membre decroche au-dela de 1.5 x SQUAD_RADIUS
+        assigned = set()
+        kept = []
+        for squad in self.squads:
+            members = [e for e in squad.members if e.alive]
+            if not members:
+                continue
+            if members[0] is not squad.leader:   # chef mort : le suivant prend la tete
+                squad.leader = members[0]
+                squad.path = []
+            lpos = squad.leader.pos
+            squad.members = [squad.leader] + [
+                e for e in members[1:] if (e.pos - lpos).length_squared() <= drift2]
+            assigned.update(squad.members)
+            kept.append(squad)
+
+        for e in enemies:
+            if not e.alive or e in assigned:
+                continue
+            best, best_d = None, r2
+            for squad in kept:
+                if len(squad.members) >= SQUAD_MAX:
+                    continue
+                d = (squad.leader.pos - e.pos).length_squared()
+                if d <= best_d:
+                    best, best_d = squad, d
+            if best is None:
+                best = Squad(e)
+                kept.append(best)
+            else:
+                best.members.append(e)
+            assigned.add(e)
+
+        for squad in kept:
+            for e in squad.members:
+                e.ai.squad = squad
+        self.squads = kept
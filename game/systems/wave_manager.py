@@ -18,13 +18,20 @@ class WaveManager:
     STATE_CLEAR     = "clear"
 
     def __init__(self, tilemap, pathfinder, players,
-                 enemy_group, pickup_group, all_groups):
+                 enemy_group, pickup_group, all_groups, rng=None):
         self.tilemap      = tilemap
         self.pathfinder   = pathfinder
         self.players      = players
         self.enemy_group  = enemy_group
         self.pickup_group = pickup_group
         self.all_groups   = all_groups
+        self.rng          = rng if rng is not None else random   # flux de la partie
+
+        # Parametres d'equilibrage (surchargeables par instance : wave_balance.py)
+        self.base_enemies   = BASE_ENEMIES
+        self.wave_scale     = WAVE_SCALE
+        self.spawn_interval = SPAWN_INTERVAL
+        self.wave_cooldown  = WAVE_COOLDOWN
 
         self.wave_number     = 0
         self.state           = self.STATE_WAITING
@@ -46,14 +53,14 @@ class WaveManager:
             self.spawn_timer -= dt
             if self.spawn_timer <= 0 and self.enemies_queue:
                 self._spawn_enemy(self.enemies_queue.pop(0))
-                self.spawn_timer = SPAWN_INTERVAL
+                self.spawn_timer = self.spawn_interval
             if not self.enemies_queue:
                 self.state = self.STATE_ACTIVE
 
         elif self.state == self.STATE_ACTIVE:
             if len(self.enemy_group) == 0:
                 self.state = self.STATE_CLEAR
-                self.cooldown_timer = WAVE_COOLDOWN
+                self.cooldown_timer = self.wave_cooldown
                 self._drop_pickups()
                 self._respawn_dead_players()
 
@@ -65,7 +72,7 @@ class WaveManager:
     # ------------------------------------------------------------------
     def _start_wave(self):
         self.wave_number += 1
-        count = int(BASE_ENEMIES * (WAVE_SCALE ** (self.wave_number - 1)))
+        count = int(self.base_enemies * (self.wave_scale ** (self.wave_number - 1)))
         self.total_this_wave  = count
         self.killed_this_wave = 0
         self.enemies_queue = self._build_composition(count)
@@ -75,7 +82,7 @@ class WaveManager:
     def _build_composition(self, count: int) -> list[str]:
         types = []
         for _ in range(count):
-            r = random.random()
+            r = self.rng.random()
             if self.wave_number >= 6 and r < 0.20:
                 types.append("heavy")
             elif self.wave_number >= 3 and r < 0.35:
@@ -116,7 +123,7 @@ class WaveManager:
         if not valid:
             return
 
-        pos = random.choice(valid)
+        pos = self.rng.choice(valid)
         cls_map = {
             "soldier": SoldierEnemy,
             "officer": OfficerEnemy,
@@ -125,17 +132,17 @@ class WaveManager:
         cls = cls_map.get(enemy_type, SoldierEnemy)
         cls(pos.x, pos.y,
             self.pathfinder, self.players, self.tilemap,
-            groups=self.all_groups + (self.enemy_group,))
+            groups=self.all_groups + (self.enemy_group,), rng=self.rng)
 
     def _drop_pickups(self):
         from game.entities.pickup import WeaponPickup
         count = min(3, 1 + self.wave_number // 2)
         placed = set()
         for _ in range(count):
-            wn = random.choice(_WAVE_PICKUPS)
+            wn = self.rng.choice(_WAVE_PICKUPS)
             for _attempt in range(40):
-                col = random.randint(2, self.tilemap.cols - 3)
-                row = random.randint(2, self.tilemap.rows - 3)
+                col = self.rng.randint(2, self.tilemap.cols - 3)
+                row = self.rng.randint(2, self.tilemap.rows - 3)
                 if not self.tilemap.is_solid(col, row) and (col, row) not in placed:
                     placed.add((col, row))
                     wx = col * TILE_SIZE + TILE_SIZE // 2
@@ -0,0 +1,29 @@
+# debug_overlay.py - Overlay de debug (touche KEYBINDS["debug"], F3 par defaut)
+import pygame
+from game.render.text import get_font, render_text
+
+
+class DebugOverlay:
+    """Bloc de lignes "cle : valeur" en haut a gauche, par-dessus le HUD.
+    Chaque boucle principale fournit ses propres lignes (compteurs de rendu,
+    qualite, latence...) ; rien n'est calcule quand l'overlay est masque."""
+
+    def __init__(self):
+        self.visible = False
+        self._font   = get_font(13)
+
+    def toggle(self) -> None:
+        self.visible = not self.visible
+
+    def draw(self, surface: pygame.Surface, lines: list[str]) -> None:
+        if not self.visible or not lines:
+            return
+        line_h = self._font.get_linesize()
+        surfs  = [render_text(self._font, line, True, (200, 255, 200)) for line in lines]
+        w = max(s.get_width() for s in surfs) + 12
+        h = line_h * len(surfs) + 8
+        bg = pygame.Surface((w, h), pygame.SRCALPHA)
+        bg.fill((0, 0, 0, 170))
+        surface.blit(bg, (8, 104))
+        for i, s in enumerate(surfs):
+            surface.blit(s, (14, 108 + i * line_h))
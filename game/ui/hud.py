@@ -1,19 +1,33 @@
 # hud.py - Interface utilisateur en jeu
 import pygame
-from game.entities.pickup import _make_weapon_icon
+from game.entities.pickup import weapon_icon
 from settings import (
     SCREEN_W, SCREEN_H, WEAPON_ORDER, WEAPONS,
     COL_HUD_BG, COL_HP_BAR, COL_HP_LOW, COL_WHITE, COL_BLACK,
     COL_YELLOW, COL_GREY, COL_DARK_GREY, COL_RED, COL_DARK_GREEN,
     COL_POINTS_POPUP, REVIVE_TIME, DOWN_TIMEOUT, PLAYER_COLORS,
 )
+from game.render.text import get_font, render_text
+from game.render.layer import RetainedLayer
 
 
 class HUD:
+    SLOT     = 64    # cote d'un slot d'inventaire
+    SLOT_GAP = 8
+    ALLY_W   = 180   # mini-panneau d'un allie
+    ALLY_H   = 52
+
     def __init__(self):
-        self._font_big   = pygame.font.SysFont("Arial", 24, bold=True)
-        self._font_med   = pygame.font.SysFont("Arial", 18, bold=True)
-        self._font_small = pygame.font.SysFont("Arial", 14)
+        self._font_big   = get_font(24, bold=True)
+        self._font_med   = get_font(18, bold=True)
+        self._font_small = get_font(14)
+
+        # Calques retenus (voir _draw_player_panel)
+        inv_w = len(WEAPON_ORDER) * (self.SLOT + self.SLOT_GAP) - self.SLOT_GAP
+        self._panel_layer = RetainedLayer((220, 68), self._build_player_panel)
+        self._wave_layer  = RetainedLayer((420, 60), self._build_wave_info)
+        self._inv_layer   = RetainedLayer((inv_w, self.SLOT), self._build_inventory)
+        self._ally_layers: list[RetainedLayer] = []
 
     def draw(self, surface: pygame.Surface, player, wave_manager):
         self._draw_player_panel(surface, player)
@@ -35,45 +49,49 @@ class HUD:
             alpha = int(min(255, popup["timer"] / 0.4 * 255))
             # Couleur selon contenu (négatif = rouge, positif = jaune)
             col = (220, 80, 60) if popup["text"].startswith("-") else COL_POINTS_POPUP
-            surf = self._font_med.render(popup["text"], True, col)
+            surf = render_text(self._font_med, popup["text"], True, col).copy()
             surf.set_alpha(alpha)
             surface.blit(surf, (int(sx) - surf.get_width() // 2, int(sy)))
 
     # ------------------------------------------------------------------
+    # Les blocs du HUD sont des calques retenus (RetainedLayer) : chacun
+    # n'est redessine que si les valeurs affichees changent (PV, score,
+    # munitions, vague...), chaque frame ne fait que les blitter.
     def _draw_player_panel(self, surface: pygame.Surface, player):
         """Panneau haut-gauche : nom, score, barre HP."""
-        panel_x = 12
-        panel_y = 30
-        panel_w = 220
-        panel_h = 68
+        pid = getattr(player, "player_id", 1)
+        self._blit_player_panel(surface, pid,
+                                str(getattr(player, "player_name", "Host")),
+                                getattr(player, "score", 0),
+                                player.hp, player.max_hp, SCREEN_W)
+
+    def _blit_player_panel(self, surface: pygame.Surface, pid: int, pname: str,
+                           score: int, hp: int, max_hp: int, screen_w: int):
+        layer = self._panel_layer.get((pid, pname, score, hp, max_hp))
+        surface.blit(layer, (12, 30))
+
+        # Score centré en haut
+        score_big = render_text(self._font_big, f"SCORE  {score:,}", True, COL_WHITE)
+        surface.blit(score_big, (screen_w // 2 - score_big.get_width() // 2, 10))
+
+    def _build_player_panel(self, surf: pygame.Surface, pid: int, pname: str,
+                            score: int, hp: int, max_hp: int):
+        panel_w, panel_h = surf.get_size()
 
         # Fond semi-transparent
-        bg = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
-        bg.fill((*COL_HUD_BG, 160))
-        surface.blit(bg, (panel_x, panel_y))
-        pid   = getattr(player, "player_id", 1)
+        surf.fill((*COL_HUD_BG, 160))
         color = PLAYER_COLORS[(pid - 1) % len(PLAYER_COLORS)]
-        pygame.draw.rect(surface, color,
-                         (panel_x, panel_y, panel_w, panel_h), 2, border_radius=3)
+        pygame.draw.rect(surf, color, (0, 0, panel_w, panel_h), 2, border_radius=3)
 
         # Nom + score
-        pname      = getattr(player, "player_name", "Host")
-        score      = getattr(player, "score", 0)
-        name_surf  = self._font_small.render(pname, True, color)
-        score_surf = self._font_small.render(f"{score:,} pts", True, COL_YELLOW)
-        surface.blit(name_surf,  (panel_x + 6, panel_y + 5))
-        surface.blit(score_surf, (panel_x + panel_w - score_surf.get_width() - 6,
-                                  panel_y + 5))
+        name_surf  = render_text(self._font_small, pname, True, color)
+        score_surf = render_text(self._font_small, f"{score:,} pts", True, COL_YELLOW)
+        surf.blit(name_surf,  (6, 5))
+        surf.blit(score_surf, (panel_w - score_surf.get_width() - 6, 5))
 
         # Barre HP
-        bar_w, bar_h = panel_w - 12, 16
-        self._draw_hp_bar(surface, panel_x + 6, panel_y + 26,
-                          bar_w, bar_h, player.hp, player.max_hp,
-                          f"HP  {player.hp}/{player.max_hp}")
-
-        # Score centré en haut
-        score_big = self._font_big.render(f"SCORE  {score:,}", True, COL_WHITE)
-        surface.blit(score_big, (SCREEN_W // 2 - score_big.get_width() // 2, 10))
+        self._draw_hp_bar(surf, 6, 26, panel_w - 12, 16, hp, max_hp,
+                          f"HP  {hp}/{max_hp}")
 
     def _draw_hp_bar(self, surface: pygame.Surface,
                      bx: int, by: int, bar_w: int, bar_h: int,
@@ -86,73 +104,85 @@ class HUD:
                          (bx, by, int(bar_w * ratio), bar_h), border_radius=3)
         pygame.draw.rect(surface, COL_WHITE, (bx, by, bar_w, bar_h), 1, border_radius=3)
         if label:
-            txt = self._font_small.render(label, True, COL_WHITE)
+            txt = render_text(self._font_small, label, True, COL_WHITE)
             surface.blit(txt, (bx + bar_w // 2 - txt.get_width() // 2, by + 1))
 
     def _draw_wave_info(self, surface: pygame.Surface, wave_manager):
-        # Vague actuelle
-        wave_txt = self._font_big.render(
-            f"VAGUE  {wave_manager.wave_number}", True, COL_YELLOW)
-        surface.blit(wave_txt, (SCREEN_W - wave_txt.get_width() - 20, 20))
-
-        # Ennemis restants
         if wave_manager.state == wave_manager.STATE_ACTIVE or \
            wave_manager.state == wave_manager.STATE_SPAWNING:
-            enemy_txt = self._font_med.render(
-                f"Ennemis: {wave_manager.enemies_remaining}", True, COL_GREY)
-            surface.blit(enemy_txt, (SCREEN_W - enemy_txt.get_width() - 20, 52))
-
-        # Compte a rebours entre vagues
-        if wave_manager.state in (wave_manager.STATE_CLEAR, wave_manager.STATE_WAITING):
-            cd = int(wave_manager.clear_countdown) + 1
-            cd_txt = self._font_med.render(
-                f"Prochaine vague: {cd}s", True, (100, 220, 100))
-            surface.blit(cd_txt, (SCREEN_W - cd_txt.get_width() - 20, 52))
+            line = ("enemies", wave_manager.enemies_remaining)
+        elif wave_manager.state in (wave_manager.STATE_CLEAR, wave_manager.STATE_WAITING):
+            line = ("countdown", int(wave_manager.clear_countdown) + 1)
+        else:
+            line = (None, 0)
+        layer = self._wave_layer.get((wave_manager.wave_number, *line))
+        surface.blit(layer, (SCREEN_W - 20 - layer.get_width(), 20))
+
+    def _build_wave_info(self, surf: pygame.Surface, wave_number: int,
+                         kind: str | None, value: int):
+        """Calque aligne a droite : vague, puis ennemis restants ou compte a rebours."""
+        w = surf.get_width()
+        wave_txt = render_text(self._font_big, f"VAGUE  {wave_number}", True, COL_YELLOW)
+        surf.blit(wave_txt, (w - wave_txt.get_width(), 0))
+        if kind == "enemies":
+            txt = render_text(self._font_med, f"Ennemis: {value}", True, COL_GREY)
+        elif kind == "countdown":
+            txt = render_text(self._font_med,
+                              f"Prochaine vague: {value}s", True, (100, 220, 100))
+        else:
+            return
+        surf.blit(txt, (w - txt.get_width(), 32))
 
     def _draw_inventory(self, surface: pygame.Surface, player):
-        slot_w, slot_h = 64, 64
-        gap = 8
-        total_w = len(WEAPON_ORDER) * (slot_w + gap) - gap
-        start_x = SCREEN_W // 2 - total_w // 2
-        start_y = SCREEN_H - slot_h - 20
-
+        idx = player.active_weapon_idx
+        progress = None
+        if player.is_reloading:
+            reload_time = WEAPONS[WEAPON_ORDER[idx]].get("reload_time", 1.5)
+            progress = 1.0 - player.reload_timer / max(0.01, reload_time)
+        self._blit_inventory(surface, SCREEN_W, SCREEN_H - self.SLOT - 20,
+                             idx, player.ammo, progress)
+
+    def _blit_inventory(self, surface: pygame.Surface, screen_w: int, y: int,
+                        active_idx: int, ammo: dict, reload_progress: float | None):
+        """Slots d'armes centres ; la jauge de rechargement (qui bouge a chaque
+        frame) est dessinee par-dessus le calque."""
+        layer = self._inv_layer.get(
+            (active_idx, tuple(ammo.get(w, 0) for w in WEAPON_ORDER)))
+        x = screen_w // 2 - layer.get_width() // 2
+        surface.blit(layer, (x, y))
+        if reload_progress is not None:
+            sx = x + active_idx * (self.SLOT + self.SLOT_GAP)
+            pygame.draw.rect(surface, (80, 80, 220),
+                             (sx, y + self.SLOT - 4, int(self.SLOT * reload_progress), 4))
+
+    def _build_inventory(self, surf: pygame.Surface, active_idx: int, ammo: tuple):
+        slot_w = slot_h = self.SLOT
         for i, wname in enumerate(WEAPON_ORDER):
-            sx = start_x + i * (slot_w + gap)
-            sy = start_y
-            is_active = (i == player.active_weapon_idx)
+            sx = i * (slot_w + self.SLOT_GAP)
+            is_active = (i == active_idx)
 
             # Fond du slot
             bg_col = (60, 55, 40) if is_active else (30, 28, 22)
             border_col = COL_YELLOW if is_active else COL_DARK_GREY
-            pygame.draw.rect(surface, bg_col, (sx, sy, slot_w, slot_h), border_radius=4)
-            pygame.draw.rect(surface, border_col, (sx, sy, slot_w, slot_h),
+            pygame.draw.rect(surf, bg_col, (sx, 0, slot_w, slot_h), border_radius=4)
+            pygame.draw.rect(surf, border_col, (sx, 0, slot_w, slot_h),
                              2 if is_active else 1, border_radius=4)
 
             # Numero de slot (1-4) en haut a gauche
-            slot_num = self._font_small.render(str(i + 1), True,
-                                               COL_YELLOW if is_active else COL_GREY)
-            surface.blit(slot_num, (sx + 4, sy + 3))
+            slot_num = render_text(self._font_small, str(i + 1), True,
+                                   COL_YELLOW if is_active else COL_GREY)
+            surf.blit(slot_num, (sx + 4, 3))
 
             # Icone de l'arme centree dans le slot
-            icon = _make_weapon_icon(wname, 32)
-            icon_x = sx + slot_w // 2 - 16
-            icon_y = sy + slot_h // 2 - 16 - 4
-            surface.blit(icon, (icon_x, icon_y))
+            icon = weapon_icon(wname, 32)
+            surf.blit(icon, (sx + slot_w // 2 - 16, slot_h // 2 - 16 - 4))
 
             # Munitions en bas
-            ammo = player.ammo.get(wname, 0)
             max_ammo = WEAPONS[wname].get("max_ammo", 0)
-            ammo_col = COL_WHITE if ammo > max_ammo * 0.3 else COL_RED
-            ammo_txt = self._font_small.render(f"{ammo}/{max_ammo}", True, ammo_col)
-            surface.blit(ammo_txt, (sx + slot_w // 2 - ammo_txt.get_width() // 2,
-                                    sy + slot_h - 18))
-
-            # Indicateur rechargement
-            if is_active and player.is_reloading:
-                prog_w = int(slot_w * (1.0 - player.reload_timer /
-                                       max(0.01, WEAPONS[wname].get("reload_time", 1.5))))
-                pygame.draw.rect(surface, (80, 80, 220),
-                                 (sx, sy + slot_h - 4, prog_w, 4))
+            ammo_col = COL_WHITE if ammo[i] > max_ammo * 0.3 else COL_RED
+            ammo_txt = render_text(self._font_small, f"{ammo[i]}/{max_ammo}", True, ammo_col)
+            surf.blit(ammo_txt, (sx + slot_w // 2 - ammo_txt.get_width() // 2,
+                                 slot_h - 18))
 
     def _draw_crosshair(self, surface: pygame.Surface):
         self.draw_crosshair(surface)
@@ -171,7 +201,7 @@ class HUD:
         pygame.draw.line(surface, col, (mx, my + gap), (mx, my + size), 2)
 
     def _draw_reload_text(self, surface: pygame.Surface):
-        txt = self._font_big.render("RECHARGEMENT...", True, (80, 160, 255))
+        txt = render_text(self._font_big, "RECHARGEMENT...", True, (80, 160, 255))
         surface.blit(txt, (SCREEN_W // 2 - txt.get_width() // 2,
                            SCREEN_H // 2 + 60))
 
@@ -182,63 +212,65 @@ class HUD:
         if not others:
             return
 
-        panel_w = 180
-        panel_h = 52
-        gap     = 8
-        start_x = SCREEN_W - panel_w - 12
+        start_x = SCREEN_W - self.ALLY_W - 12
         start_y = 60
 
         for i, pdata in enumerate(p for p in others
                                   if p.get("player_id") != my_player_id):
-            y = start_y + i * (panel_h + gap)
-
             state = pdata.get("state", "alive")
             pid   = pdata.get("player_id", 0)
-            color = PLAYER_COLORS[(pid - 1) % len(PLAYER_COLORS)]
-
-            # Fond semi-transparent
-            bg = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
-            if state == "down":
-                bg.fill((120, 30, 30, 180))
-            elif state == "dead":
-                bg.fill((50, 50, 50, 180))
-            else:
-                bg.fill((*COL_HUD_BG, 160))
-            surface.blit(bg, (start_x, y))
-
-            pygame.draw.rect(surface, color,
-                             (start_x, y, panel_w, panel_h), 2, border_radius=3)
-
-            name = str(pdata.get("player_name", f"Joueur {pid}"))[:14]
-            name_surf = self._font_small.render(name, True, color)
-            surface.blit(name_surf, (start_x + 6, y + 4))
-
+            name  = str(pdata.get("player_name", f"Joueur {pid}"))[:14]
             if state == "alive":
-                hp     = int(pdata.get("hp", 0))
-                max_hp = int(pdata.get("max_hp", 100))
-                self._draw_hp_bar(surface, start_x + 6, y + 24,
-                                  panel_w - 12, 12, hp, max_hp,
-                                  f"{hp}/{max_hp}")
-
+                detail = (int(pdata.get("hp", 0)), int(pdata.get("max_hp", 100)))
             elif state == "down":
-                down_timer   = float(pdata.get("down_timer", 0.0))
-                rev_progress = float(pdata.get("revive_progress", 0.0))
-                status_txt = self._font_small.render(
-                    f"A TERRE  {int(down_timer)+1}s", True, COL_RED)
-                surface.blit(status_txt, (start_x + 6, y + 22))
-                if rev_progress > 0:
-                    bar_w = panel_w - 12
-                    bar_x = start_x + 6
-                    bar_y = y + 38
-                    pygame.draw.rect(surface, COL_DARK_GREY,
-                                     (bar_x, bar_y, bar_w, 8), border_radius=2)
-                    pygame.draw.rect(surface, (80, 200, 120),
-                                     (bar_x, bar_y, int(bar_w * min(1.0, rev_progress)), 8),
-                                     border_radius=2)
-
-            elif state == "dead":
-                dead_txt = self._font_small.render("MORT (prochaine vague)", True, COL_GREY)
-                surface.blit(dead_txt, (start_x + 6, y + 22))
+                # Jauge de relève en pixels : rebâtie seulement si elle avance d'un pixel
+                rev = min(1.0, float(pdata.get("revive_progress", 0.0)))
+                detail = (int(float(pdata.get("down_timer", 0.0))) + 1,
+                          int((self.ALLY_W - 12) * rev))
+            else:
+                detail = ()
+            if i == len(self._ally_layers):
+                self._ally_layers.append(
+                    RetainedLayer((self.ALLY_W, self.ALLY_H), self._build_ally_panel))
+            layer = self._ally_layers[i].get((pid, name, state, detail))
+            surface.blit(layer, (start_x, start_y + i * (self.ALLY_H + 8)))
+
+    def _build_ally_panel(self, surf: pygame.Surface, pid: int, name: str,
+                          state: str, detail: tuple):
+        panel_w, panel_h = surf.get_size()
+        color = PLAYER_COLORS[(pid - 1) % len(PLAYER_COLORS)]
+
+        # Fond semi-transparent
+        if state == "down":
+            surf.fill((120, 30, 30, 180))
+        elif state == "dead":
+            surf.fill((50, 50, 50, 180))
+        else:
+            surf.fill((*COL_HUD_BG, 160))
+        pygame.draw.rect(surf, color, (0, 0, panel_w, panel_h), 2, border_radius=3)
+
+        name_surf = render_text(self._font_small, name, True, color)
+        surf.blit(name_surf, (6, 4))
+
+        if state == "alive":
+            hp, max_hp = detail
+            self._draw_hp_bar(surf, 6, 24, panel_w - 12, 12, hp, max_hp,
+                              f"{hp}/{max_hp}")
+
+        elif state == "down":
+            down_s, rev_px = detail
+            status_txt = render_text(self._font_small,
+                                     f"A TERRE  {down_s}s", True, COL_RED)
+            surf.blit(status_txt, (6, 22))
+            if rev_px > 0:
+                pygame.draw.rect(surf, COL_DARK_GREY,
+                                 (6, 38, panel_w - 12, 8), border_radius=2)
+                pygame.draw.rect(surf, (80, 200, 120),
+                                 (6, 38, rev_px, 8), border_radius=2)
+
+        elif state == "dead":
+            dead_txt = render_text(self._font_small, "MORT (prochaine vague)", True, COL_GREY)
+            surf.blit(dead_txt, (6, 22))
 
     def draw_from_state(self, surface: pygame.Surface, local_state: dict,
                         wave_info: dict, local_weapon_idx: int,
@@ -247,50 +279,21 @@ class HUD:
         p = local_state
 
         # ── Panneau joueur local en haut à gauche ──────────────────────
-        panel_x = 12
-        panel_y = 30
-        panel_w = 220
-        panel_h = 68
-
-        bg = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
-        bg.fill((*COL_HUD_BG, 160))
-        surface.blit(bg, (panel_x, panel_y))
-        pid   = int(p.get("player_id", 1))
-        color = PLAYER_COLORS[(pid - 1) % len(PLAYER_COLORS)]
-        pygame.draw.rect(surface, color,
-                         (panel_x, panel_y, panel_w, panel_h), 2, border_radius=3)
-
-        pname      = str(p.get("player_name", f"P{pid}"))
-        score      = int(p.get("score", 0))
-        name_surf  = self._font_small.render(pname, True, color)
-        score_surf = self._font_small.render(f"{score:,} pts", True, COL_YELLOW)
-        surface.blit(name_surf,  (panel_x + 6, panel_y + 5))
-        surface.blit(score_surf, (panel_x + panel_w - score_surf.get_width() - 6, panel_y + 5))
-
-        hp    = int(p.get("hp", 100))
-        maxhp = int(p.get("max_hp", 100))
-        self._draw_hp_bar(surface, panel_x + 6, panel_y + 26,
-                          panel_w - 12, 16, hp, maxhp,
-                          f"HP  {hp}/{maxhp}")
-
-        # Score centré en haut
-        score_big = self._font_big.render(f"SCORE  {score:,}", True, COL_WHITE)
-        surface.blit(score_big, (screen_w // 2 - score_big.get_width() // 2, 10))
+        pid = int(p.get("player_id", 1))
+        self._blit_player_panel(surface, pid, str(p.get("player_name", f"P{pid}")),
+                                int(p.get("score", 0)), int(p.get("hp", 100)),
+                                int(p.get("max_hp", 100)), screen_w)
 
         # ── Vague en haut à droite ─────────────────────────────────────
-        wn   = wave_info.get("wave_number", 0)
-        wrem = wave_info.get("enemies_remaining", 0)
-        wst  = wave_info.get("wave_state", "")
-        wcd  = float(wave_info.get("wave_countdown", 0))
-        wave_surf = self._font_big.render(f"VAGUE  {wn}", True, COL_YELLOW)
-        surface.blit(wave_surf, (screen_w - wave_surf.get_width() - 20, 10))
+        wst = wave_info.get("wave_state", "")
         if wst in ("active", "spawning"):
-            rem_txt = self._font_med.render(f"Ennemis: {wrem}", True, COL_GREY)
-            surface.blit(rem_txt, (screen_w - rem_txt.get_width() - 20, 42))
+            line = ("enemies", wave_info.get("enemies_remaining", 0))
         elif wst in ("clear", "waiting"):
-            cd_txt = self._font_med.render(
-                f"Prochaine vague: {int(wcd)+1}s", True, (100, 220, 100))
-            surface.blit(cd_txt, (screen_w - cd_txt.get_width() - 20, 42))
+            line = ("countdown", int(float(wave_info.get("wave_countdown", 0))) + 1)
+        else:
+            line = (None, 0)
+        layer = self._wave_layer.get((wave_info.get("wave_number", 0), *line))
+        surface.blit(layer, (screen_w - 20 - layer.get_width(), 10))
 
         # ── Alliés à droite ──────────────────────────────────────────────
         allies = p.get("all_players", [])
@@ -298,41 +301,15 @@ class HUD:
         self.draw_other_players_hud(surface, allies, my_id)
 
         # ── Inventaire en bas au centre ────────────────────────────────
-        ammo         = p.get("ammo", {})
         is_reloading = p.get("is_reloading", False)
         reload_prog  = float(p.get("reload_progress", 0.0))
-        slot_w, slot_h = 64, 64
-        gap     = 8
-        total_w = len(WEAPON_ORDER) * (slot_w + gap) - gap
-        sx0 = screen_w // 2 - total_w // 2
-        sy0 = screen_h - slot_h - 12
-
-        for i, wn2 in enumerate(WEAPON_ORDER):
-            sx = sx0 + i * (slot_w + gap)
-            is_active = (i == local_weapon_idx)
-            bg2    = (60, 55, 40) if is_active else (30, 28, 22)
-            border = COL_YELLOW  if is_active else COL_DARK_GREY
-            pygame.draw.rect(surface, bg2, (sx, sy0, slot_w, slot_h), border_radius=4)
-            pygame.draw.rect(surface, border, (sx, sy0, slot_w, slot_h),
-                             2 if is_active else 1, border_radius=4)
-            slot_num = self._font_small.render(str(i + 1), True,
-                                               COL_YELLOW if is_active else COL_GREY)
-            surface.blit(slot_num, (sx + 4, sy0 + 3))
-            icon = _make_weapon_icon(wn2, 32)
-            surface.blit(icon, (sx + slot_w // 2 - 16, sy0 + slot_h // 2 - 16 - 4))
-            cur = ammo.get(wn2, 0)
-            mx2 = WEAPONS[wn2].get("max_ammo", 0)
-            col2 = COL_WHITE if cur > mx2 * 0.3 else COL_RED
-            a_surf = self._font_small.render(f"{cur}/{mx2}", True, col2)
-            surface.blit(a_surf, (sx + slot_w // 2 - a_surf.get_width() // 2,
-                                  sy0 + slot_h - 18))
-            if is_active and is_reloading:
-                pygame.draw.rect(surface, (80, 80, 220),
-                                 (sx, sy0 + slot_h - 4, int(slot_w * reload_prog), 4))
+        self._blit_inventory(surface, screen_w, screen_h - self.SLOT - 12,
+                             local_weapon_idx, p.get("ammo", {}),
+                             reload_prog if is_reloading else None)
 
         # ── Texte rechargement ──────────────────────────────────────────
         if is_reloading:
-            rld = self._font_big.render("RECHARGEMENT...", True, (80, 160, 255))
+            rld = render_text(self._font_big, "RECHARGEMENT...", True, (80, 160, 255))
             surface.blit(rld, (screen_w // 2 - rld.get_width() // 2, screen_h // 2 + 60))
             bar_w2 = 200
             bx3 = screen_w // 2 - bar_w2 // 2
@@ -345,7 +322,7 @@ class HUD:
         pstate = p.get("state", "alive")
         if pstate == "down":
             dt3 = float(p.get("down_timer", 0))
-            down_txt = self._font_big.render(
-                f"A TERRE - {int(dt3)}s avant elimination", True, (220, 80, 30))
+            down_txt = render_text(self._font_big,
+                                   f"A TERRE - {int(dt3)}s avant elimination", True, (220, 80, 30))
             surface.blit(down_txt, (screen_w // 2 - down_txt.get_width() // 2,
                                     screen_h // 2 - 30))
@@ -5,6 +5,7 @@ from settings import (
     COL_BLACK, COL_WHITE, COL_YELLOW, COL_RED, COL_GREY, COL_DARK_GREEN,
     KEYBINDS, KEYBINDS_DEFAULT, STATE_SETTINGS, PLAYER_COLORS, NET_MAX_PLAYERS,
 )
+from game.render.text import get_font, render_text
 
 # Résultats possibles du menu réseau
 NET_MENU_HOST  = "host"
@@ -14,10 +15,10 @@ NET_MENU_LOCAL = "local"
 
 def _center_text(surface, font, text, color, y, shadow=True):
     if shadow:
-        shadow_surf = font.render(text, True, (0, 0, 0))
+        shadow_surf = render_text(font, text, True, (0, 0, 0))
         surface.blit(shadow_surf, (SCREEN_W // 2 - shadow_surf.get_width() // 2 + 2,
                                    y + 2))
-    txt_surf = font.render(text, True, color)
+    txt_surf = render_text(font, text, True, color)
     surface.blit(txt_surf, (SCREEN_W // 2 - txt_surf.get_width() // 2, y))
     return txt_surf.get_height()
 
@@ -41,10 +42,10 @@ class Menus:
     ]
 
     def __init__(self):
-        self._font_title  = pygame.font.SysFont("Arial", 64, bold=True)
-        self._font_sub    = pygame.font.SysFont("Arial", 28, bold=True)
-        self._font_normal = pygame.font.SysFont("Arial", 22)
-        self._font_small  = pygame.font.SysFont("Arial", 16)
+        self._font_title  = get_font(64, bold=True)
+        self._font_sub    = get_font(28, bold=True)
+        self._font_normal = get_font(22)
+        self._font_small  = get_font(16)
         self._blink_timer = 0.0
         self._blink_state = True
 
@@ -212,14 +213,14 @@ class Menus:
                              border_radius=6)
 
             # Label
-            lbl_surf = self._font_sub.render(label, True,
-                                             COL_WHITE if is_sel else COL_GREY)
+            lbl_surf = render_text(self._font_sub, label, True,
+                                   COL_WHITE if is_sel else COL_GREY)
             surface.blit(lbl_surf, (btn_x + btn_w // 2 - lbl_surf.get_width() // 2,
                                     by + 6))
 
             # Description (petite police, sous le label)
-            desc_surf = self._font_small.render(desc, True,
-                                                COL_WHITE if is_sel else (90, 88, 80))
+            desc_surf = render_text(self._font_small, desc, True,
+                                    COL_WHITE if is_sel else (90, 88, 80))
             surface.blit(desc_surf, (btn_x + btn_w // 2 - desc_surf.get_width() // 2,
                                      by + 32))
 
@@ -235,12 +236,12 @@ class Menus:
         pygame.draw.rect(surface, ip_bg, ip_rect, border_radius=4)
         pygame.draw.rect(surface, COL_YELLOW if self._net_ip_active else COL_GREY,
                          ip_rect, 2, border_radius=4)
-        ip_txt = self._font_normal.render(
+        ip_txt = render_text(self._font_normal,
             self._net_ip_input + ("|" if self._net_ip_active and self._blink_state else ""),
             True, COL_WHITE)
         surface.blit(ip_txt, (ip_rect.x + 8, ip_rect.y + 7))
         if not self._net_ip_input:
-            hint = self._font_small.render("ex: 192.168.1.X", True, (80, 80, 70))
+            hint = render_text(self._font_small, "ex: 192.168.1.X", True, (80, 80, 70))
             surface.blit(hint, (ip_rect.x + 8, ip_rect.y + 10))
 
         field_y += 42
@@ -253,12 +254,12 @@ class Menus:
         pygame.draw.rect(surface, name_bg, name_rect, border_radius=4)
         pygame.draw.rect(surface, COL_YELLOW if self._net_name_active else COL_GREY,
                          name_rect, 2, border_radius=4)
-        name_txt = self._font_normal.render(
+        name_txt = render_text(self._font_normal,
             self._net_name_input + ("|" if self._net_name_active and self._blink_state else ""),
             True, COL_WHITE)
         surface.blit(name_txt, (name_rect.x + 8, name_rect.y + 7))
         if not self._net_name_input:
-            hint2 = self._font_small.render("ex: Joueur1", True, (80, 80, 70))
+            hint2 = render_text(self._font_small, "ex: Joueur1", True, (80, 80, 70))
             surface.blit(hint2, (name_rect.x + 8, name_rect.y + 10))
 
         field_y += 50
@@ -271,7 +272,7 @@ class Menus:
             "CLIC  :  cliquer sur un bouton / champ",
         ]
         for line in help_lines:
-            hs = self._font_small.render(line, True, (70, 68, 60))
+            hs = render_text(self._font_small, line, True, (70, 68, 60))
             surface.blit(hs, (SCREEN_W // 2 - hs.get_width() // 2, field_y))
             field_y += 20
 
@@ -351,7 +352,7 @@ class Menus:
                              tuple(min(255, c + 20) for c in col),
                              rect, 2, border_radius=8)
 
-            lbl = self._font_sub.render(label, True, COL_WHITE)
+            lbl = render_text(self._font_sub, label, True, COL_WHITE)
             surface.blit(lbl, (bx + BTN_W // 2 - lbl.get_width() // 2,
                                by + BTN_H // 2 - lbl.get_height() // 2))
 
@@ -368,7 +369,7 @@ class Menus:
         ]
         ry = sep_y + 10
         for line in lines:
-            s = self._font_small.render(line, True, (90, 88, 78))
+            s = render_text(self._font_small, line, True, (90, 88, 78))
             surface.blit(s, (SCREEN_W // 2 - s.get_width() // 2, ry))
             ry += 20
 
@@ -455,8 +456,8 @@ class Menus:
         mx, my  = pygame.mouse.get_pos()
 
         # En-têtes colonnes
-        hdr_a = self._font_small.render("ACTION", True, (80, 78, 65))
-        hdr_k = self._font_small.render("TOUCHE", True, (80, 78, 65))
+        hdr_a = render_text(self._font_small, "ACTION", True, (80, 78, 65))
+        hdr_k = render_text(self._font_small, "TOUCHE", True, (80, 78, 65))
         surface.blit(hdr_a, (TABLE_X + 8, START_Y))
         surface.blit(hdr_k, (KEY_X + 8,   START_Y))
         START_Y += 18   # START_Y est maintenant 100, cohérent avec handle_settings_event
@@ -488,7 +489,7 @@ class Menus:
 
             # Libellé action
             l_col  = COL_WHITE if is_sel else COL_GREY
-            l_surf = self._font_small.render(label, True, l_col)
+            l_surf = render_text(self._font_small, label, True, l_col)
             cy = row_y + (ROW_H - 2 - l_surf.get_height()) // 2
             surface.blit(l_surf, (TABLE_X + 8, cy))
 
@@ -499,7 +500,7 @@ class Menus:
             else:
                 key_str = pygame.key.name(KEYBINDS.get(action, 0)).upper()
                 key_col = COL_YELLOW if is_sel else (160, 150, 110)
-            k_surf = self._font_small.render(key_str, True, key_col)
+            k_surf = render_text(self._font_small, key_str, True, key_col)
             surface.blit(k_surf,
                          (KEY_X + 8,
                           row_y + (ROW_H - 2 - k_surf.get_height()) // 2))
@@ -515,7 +516,7 @@ class Menus:
         else:
             hint = "Cliquez sur une ligne, puis recliquez pour changer la touche   ( ÉCHAP = retour )"
             hint_col = (80, 78, 65)
-        hs = self._font_small.render(hint, True, hint_col)
+        hs = render_text(self._font_small, hint, True, hint_col)
         surface.blit(hs, (SCREEN_W // 2 - hs.get_width() // 2, hint_y))
 
         # Boutons bas
@@ -530,7 +531,7 @@ class Menus:
             bg_s.fill((*col, 210 if is_h else 150))
             surface.blit(bg_s, rect.topleft)
             pygame.draw.rect(surface, col, rect, 2, border_radius=6)
-            ls = self._font_normal.render(lbl, True, COL_WHITE)
+            ls = render_text(self._font_normal, lbl, True, COL_WHITE)
             surface.blit(ls, (rect.centerx - ls.get_width() // 2,
                               rect.centery - ls.get_height() // 2))
 
@@ -583,7 +584,7 @@ class Menus:
         surface.blit(bg_settings, (bx, by_settings))
         pygame.draw.rect(surface, (90, 140, 185),
                          (bx, by_settings, btn_w, btn_h), 2, border_radius=6)
-        ps = self._font_normal.render("PARAMÈTRES", True, COL_WHITE)
+        ps = render_text(self._font_normal, "PARAMÈTRES", True, COL_WHITE)
         surface.blit(ps, (bx + btn_w // 2 - ps.get_width() // 2,
                           by_settings + btn_h // 2 - ps.get_height() // 2))
 
@@ -595,7 +596,7 @@ class Menus:
         surface.blit(bg_quit, (bx, by_quit))
         pygame.draw.rect(surface, (185, 70, 70),
                          (bx, by_quit, btn_w, btn_h), 2, border_radius=6)
-        qs = self._font_normal.render("QUITTER", True, COL_WHITE)
+        qs = render_text(self._font_normal, "QUITTER", True, COL_WHITE)
         surface.blit(qs, (bx + btn_w // 2 - qs.get_width() // 2,
                           by_quit + btn_h // 2 - qs.get_height() // 2))
 
@@ -677,7 +678,7 @@ class Menus:
         bg_btn.fill((*btn_col, 220))
         surface.blit(bg_btn, (btn_x, btn_y))
         pygame.draw.rect(surface, (220, 70, 70), btn_rect, 2, border_radius=7)
-        btn_lbl = self._font_sub.render("RETOUR AU MENU", True, COL_WHITE)
+        btn_lbl = render_text(self._font_sub, "RETOUR AU MENU", True, COL_WHITE)
         surface.blit(btn_lbl, (btn_x + btn_w // 2 - btn_lbl.get_width() // 2,
                                btn_y + btn_h // 2 - btn_lbl.get_height() // 2))
 
@@ -764,7 +765,7 @@ class Menus:
 
             # Nom
             name_col = COL_WHITE if is_local else COL_GREY
-            n_surf = self._font_sub.render(pname, True, name_col)
+            n_surf = render_text(self._font_sub, pname, True, name_col)
             surface.blit(n_surf, (card_x + 52, card_y + card_h // 2 - n_surf.get_height() // 2))
 
             # Badge HOST / VOUS
@@ -775,7 +776,7 @@ class Menus:
                 badge_parts.append(("VOUS", (100, 200, 100)))
             bx = card_x + card_w - 10
             for label, bcol in reversed(badge_parts):
-                bs = self._font_small.render(label, True, bcol)
+                bs = render_text(self._font_small, label, True, bcol)
                 bx -= bs.get_width() + 6
                 surface.blit(bs, (bx, card_y + card_h // 2 - bs.get_height() // 2))
 
@@ -789,15 +790,15 @@ class Menus:
             pygame.draw.rect(surface, (50, 50, 50),
                              (card_x, card_y, card_w, card_h), 1,
                              border_radius=6, )
-            empty_s = self._font_small.render("— En attente d'un joueur... —",
-                                              True, (70, 70, 70))
+            empty_s = render_text(self._font_small, "— En attente d'un joueur... —",
+                                  True, (70, 70, 70))
             surface.blit(empty_s, (card_x + card_w // 2 - empty_s.get_width() // 2,
                                    card_y + card_h // 2 - empty_s.get_height() // 2))
             card_y += card_h + 8
 
         # IP affichée pour que les autres puissent rejoindre
         if server_ip:
-            ip_surf = self._font_normal.render(
+            ip_surf = render_text(self._font_normal,
                 f"IP : {server_ip}  — donnez cette adresse aux autres joueurs",
                 True, (100, 180, 100))
             surface.blit(ip_surf, (SCREEN_W // 2 - ip_surf.get_width() // 2,
@@ -816,10 +817,10 @@ class Menus:
             surface.blit(bg_btn, (btn_x, btn_y))
             pygame.draw.rect(surface, (80, 200, 80),
                              (btn_x, btn_y, btn_w, btn_h), 2, border_radius=8)
-            lbl = self._font_sub.render("▶  LANCER LA PARTIE", True, COL_WHITE)
+            lbl = render_text(self._font_sub, "▶  LANCER LA PARTIE", True, COL_WHITE)
             surface.blit(lbl, (btn_x + btn_w // 2 - lbl.get_width() // 2,
                                 btn_y + btn_h // 2 - lbl.get_height() // 2))
-            hint = self._font_small.render("ou appuyez sur ENTRÉE", True, COL_GREY)
+            hint = render_text(self._font_small, "ou appuyez sur ENTRÉE", True, COL_GREY)
             surface.blit(hint, (SCREEN_W // 2 - hint.get_width() // 2,
                                 btn_y + btn_h + 6))
         else:
@@ -2,10 +2,11 @@
 import pygame
 from settings import (
     TILE_SIZE, MAP_COLS, MAP_ROWS, MAP_W, MAP_H,
-    SOLID_TILES,
+    SOLID_TILES, TILEMAP_CHUNK, CHUNK_CACHE_MAX_BYTES,
     COL_GROUND_A, COL_GROUND_B, COL_WALL, COL_SANDBAG, COL_BUNKER,
     TILE_GROUND, TILE_WALL, TILE_SANDBAG, TILE_BUNKER, TILE_DIRT,
 )
+from game.render.surface_cache import SurfaceCache
 
 
 def _make_tile_surface(tile_id: int) -> pygame.Surface:
@@ -55,7 +56,7 @@ def _make_tile_surface(tile_id: int) -> pygame.Surface:
 
 class TileMap:
     def __init__(self, data: list[list[int]]):
-        self.data = data
+        self.data = [list(row) for row in data]   # copie : set_tile ne touche pas MAP_DATA
         self.rows = len(data)
         self.cols = len(data[0]) if self.rows > 0 else 0
 
@@ -68,6 +69,12 @@ class TileMap:
         for tid in tile_ids:
             self._tile_surfs[tid] = _make_tile_surface(tid)
 
+        # Fond pre-compose par chunks de TILEMAP_CHUNK x TILEMAP_CHUNK tuiles,
+        # construits au premier affichage (jamais cote serveur dedie), et les
+        # memes reduits pour un rendu en resolution interne < 1.
+        # Cle (echelle, cx, cy) ; un chunk evince est reconstruit au besoin.
+        self._chunks = SurfaceCache("tilemap.chunks", CHUNK_CACHE_MAX_BYTES)
+
     def get_tile(self, col: int, row: int) -> int:
         if 0 <= col < self.cols and 0 <= row < self.rows:
             return self.data[row][col]
@@ -79,6 +86,20 @@ class TileMap:
     def in_bounds(self, col: int, row: int) -> bool:
         return 0 <= col < self.cols and 0 <= row < self.rows
 
+    def set_tile(self, col: int, row: int, tile_id: int):
+        """Change une tuile et invalide le chunk de rendu qui la contient.
+        Les index de navigation (Pathfinder, CoverIndex) supposent une carte
+        statique : a reconstruire par l'appelant si la solidite change."""
+        if not self.in_bounds(col, row):
+            return
+        self.data[row][col] = tile_id
+        if tile_id not in self._tile_surfs:
+            self._tile_surfs[tile_id] = _make_tile_surface(tile_id)
+        cell = (col // TILEMAP_CHUNK, row // TILEMAP_CHUNK)
+        for key in self._chunks.keys():
+            if key[1:] == cell:
+                self._chunks.pop(key)
+
     def get_rect(self, col: int, row: int) -> pygame.Rect:
         return pygame.Rect(col * TILE_SIZE, row * TILE_SIZE, TILE_SIZE, TILE_SIZE)
 
@@ -110,21 +131,48 @@ class TileMap:
                 if self.in_bounds(nc, nr):
                     yield nc, nr
 
-    def draw(self, surface: pygame.Surface, camera_offset: pygame.Vector2):
-        """Ne dessine que les tuiles visibles dans le viewport."""
-        ox, oy = int(camera_offset.x), int(camera_offset.y)
-        screen_w = surface.get_width()
-        screen_h = surface.get_height()
-
-        col_start = max(0, ox // TILE_SIZE)
-        col_end   = min(self.cols, (ox + screen_w) // TILE_SIZE + 2)
-        row_start = max(0, oy // TILE_SIZE)
-        row_end   = min(self.rows, (oy + screen_h) // TILE_SIZE + 2)
-
-        for row in range(row_start, row_end):
-            for col in range(col_start, col_end):
-                tid = self.data[row][col]
-                surf = self._tile_surfs.get(tid, self._tile_surfs[TILE_GROUND])
-                sx = col * TILE_SIZE - ox
-                sy = row * TILE_SIZE - oy
-                surface.blit(surf, (sx, sy))
+    def _build_chunk(self, cx: int, cy: int) -> pygame.Surface:
+        col0, row0 = cx * TILEMAP_CHUNK, cy * TILEMAP_CHUNK
+        cols = min(TILEMAP_CHUNK, self.cols - col0)
+        rows = min(TILEMAP_CHUNK, self.rows - row0)
+        chunk = pygame.Surface((cols * TILE_SIZE, rows * TILE_SIZE))
+        ground = self._tile_surfs.get(TILE_GROUND)
+        chunk.blits([(self._tile_surfs.get(self.data[row0 + r][col0 + c], ground),
+                      (c * TILE_SIZE, r * TILE_SIZE))
+                     for r in range(rows) for c in range(cols)], doreturn=False)
+        # Format de l'ecran : blit sans conversion de pixels a chaque frame
+        if pygame.display.get_surface() is not None:
+            chunk = chunk.convert()
+        return chunk
+
+    def _chunk(self, cx: int, cy: int, scale: float) -> pygame.Surface:
+        chunks = self._chunks
+        chunk = chunks.get((scale, cx, cy))
+        if chunk is not None:
+            return chunk
+        if scale == 1.0:
+            return chunks.put((1.0, cx, cy), self._build_chunk(cx, cy))
+        full = self._chunk(cx, cy, 1.0)
+        w, h = full.get_size()
+        return chunks.put((scale, cx, cy), pygame.transform.scale(
+            full, (int(w * scale), int(h * scale))))
+
+    def draw(self, surface: pygame.Surface, camera_offset: pygame.Vector2,
+             scale: float = 1.0):
+        """Blitte les chunks pre-rendus qui recouvrent le viewport (une
+        poignee de blits au lieu d'un par tuile visible). scale < 1 : surface
+        en resolution interne reduite (chunks reduits une fois, en cache)."""
+        ox, oy = int(camera_offset.x * scale), int(camera_offset.y * scale)
+        span = int(TILEMAP_CHUNK * TILE_SIZE * scale)
+        n_cx = -(-self.cols // TILEMAP_CHUNK)
+        n_cy = -(-self.rows // TILEMAP_CHUNK)
+
+        cx_start = max(0, ox // span)
+        cx_end   = min(n_cx, (ox + surface.get_width()) // span + 1)
+        cy_start = max(0, oy // span)
+        cy_end   = min(n_cy, (oy + surface.get_height()) // span + 1)
+
+        for cy in range(cy_start, cy_end):
+            for cx in range(cx_start, cx_end):
+                surface.blit(self._chunk(cx, cy, scale),
+                             (cx * span - ox, cy * span - oy))
@@ -14,10 +14,13 @@ from game.world.camera    import Camera
 from game.world.map_data  import MAP_DATA, PLAYER_START
 from game.entities.player import Player
 from game.systems.pathfinding import Pathfinder
+from game.systems.squad import SquadManager
+from game.systems.perception import Perception
 from game.systems.wave_manager import WaveManager
 from game.ui.hud   import HUD
 from game.ui.menus import Menus
 from game.entities.upgrade_machine import UpgradeMachine
+from game.render.text import get_font, render_text
 # Imports différés pour éviter la circularité — chargés au moment du lancement
 # from main_server import ServerGame
 # from main_client import ClientGame
@@ -47,6 +50,8 @@ class Game:
         self.tilemap    = TileMap(MAP_DATA)
         self.camera     = Camera()
         self.pathfinder = Pathfinder(self.tilemap)
+        self.squads     = SquadManager(self.tilemap, self.pathfinder)
+        self.perception = Perception(self.tilemap)
 
         # Groupes de sprites
         self.all_sprites    = pygame.sprite.Group()
@@ -181,6 +186,8 @@ class Game:
                 return
 
             # Ennemis
+            self.squads.update(dt, self.enemy_group, [self.player])
+            self.perception.update(self.enemy_group, [self.player])
             dead_enemies = []
             for enemy in list(self.enemy_group):
                 enemy.update(dt, self.tilemap, [self.player],
@@ -252,8 +259,8 @@ class Game:
             self.menus.draw_network_menu(self.screen)
             # Affiche l'erreur de connexion s'il y en a une
             if self._net_error:
-                font_err = pygame.font.SysFont("Arial", 18, bold=True)
-                err_surf = font_err.render(self._net_error, True, (220, 60, 60))
+                font_err = get_font(18, bold=True)
+                err_surf = render_text(font_err, self._net_error, True, (220, 60, 60))
                 self.screen.blit(err_surf,
                                  (SCREEN_W // 2 - err_surf.get_width() // 2,
                                   SCREEN_H - 52))
@@ -283,7 +290,7 @@ class Game:
         self.tilemap.draw(self.screen, self.camera.offset)
 
         # Ramassages
-        font_small = pygame.font.SysFont("Arial", 12)
+        font_small = get_font(12)
         for pickup in self.pickup_group:
             pickup.draw(self.screen, self.camera, font_small)
 
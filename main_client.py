@@ -2,42 +2,55 @@
 import pygame
 import sys
 import math
+import time
+from collections import deque
 
 from settings import (
     SCREEN_W, SCREEN_H, FPS, TITLE,
     WEAPON_ORDER, WEAPONS, PLAYER_COLORS, ENEMY_TYPES,
-    COL_BULLET_P, COL_BULLET_E, COL_YELLOW, COL_WHITE, COL_GREY, COL_RED,
-    COL_BLACK,
+    COL_YELLOW, COL_WHITE, COL_GREY, COL_RED,
     UPGRADE_MACHINE_TILE, KEYBINDS, NET_PORT,
+    NET_INPUT_RATE, NET_KEEPALIVE, NET_AIM_EPSILON,
     STATE_MENU, STATE_SETTINGS, STATE_NETWORK_MENU, STATE_PLAYING,
     STATE_PAUSED, STATE_GAMEOVER, STATE_LOBBY,
+    LAYER_PICKUPS, LAYER_ENTITIES, LAYER_BULLETS, LAYER_FX,
 )
 from game.entities.upgrade_machine import UpgradeMachine
 from game.entities.player import _make_player_surf
-from game.entities.enemy   import _make_enemy_surf, draw_enemy_at
-from game.entities.grenade import draw_explosion_at
+from game.entities.enemy   import enemy_sprite, draw_enemy_overlay
+from game.entities.grenade import Grenade, draw_explosion_at
+from game.entities.bullet  import Bullet
+from game.entities.pickup  import pickup_surf
+from game.render.sprite_atlas import SPRITES
+from game.render.text import get_font, render_text
+from game.render.batch import SpriteBatch
+from game.render.quality import QualityGovernor
+from game.render.warmup import AssetWarmup
+from game.render.surface_cache import cache_summary
 from game.world.tilemap   import TileMap
 from game.world.camera    import Camera
 from game.world.map_data  import MAP_DATA
 from game.ui.hud   import HUD
 from game.ui.menus import Menus
+from game.ui.debug_overlay import DebugOverlay
 from game.network.client   import GameClient
 from game.network.messages import (
-    MSG_GAME_STATE, MSG_LOBBY_STATE, MSG_START_GAME,
-    MSG_GAME_OVER, MSG_UPGRADE_RESULT, MSG_ERROR,
-    make_input,
+    MSG_LOBBY_STATE, MSG_START_GAME,
+    MSG_GAME_OVER, MSG_UPGRADE_RESULT, MSG_ERROR, MSG_PROJECTILES,
+    make_input, make_input_delta, INPUT_FIELDS,
 )
 
 
 class ClientGame:
     """
-    Client pur : pas de simulation locale.
-    Recoit MSG_GAME_STATE du serveur et affiche.
+    Client pur : pas de simulation locale, sauf le vol des projectiles.
+    Recoit MSG_GAME_STATE du serveur et affiche ; balles et grenades sont
+    rejouees localement depuis MSG_PROJECTILES (apparition / disparition).
     Envoie MSG_INPUT a 60Hz.
     """
 
     def __init__(self, server_ip: str, player_name: str = "Joueur",
-                 screen: pygame.Surface | None = None):
+                 screen: pygame.Surface | None = None, net_client=None):
         if not pygame.get_init():
             pygame.init()
         pygame.display.set_caption(f"{TITLE}  [CLIENT: {player_name}]")
@@ -52,7 +65,8 @@ class ClientGame:
         self._local_weapon_idx = 0
 
         # Connexion — attendre le MSG_WELCOME avec timeout
-        self.net = GameClient(server_ip, player_name)
+        # (net_client : remplaçant hors ligne, ex. OfflineClient)
+        self.net = net_client if net_client is not None else GameClient(server_ip, player_name)
         self.net.start_in_thread()
         print(f"Connexion a {server_ip}:{NET_PORT}...")
         connected = self.net.wait_connected(timeout=10.0)
@@ -88,18 +102,33 @@ class ClientGame:
         # Donnees recues du serveur
         self.remote_players:  dict[int, dict] = {}
         self.remote_enemies:  list[dict] = []
-        self.remote_bullets:  list[dict] = []
-        self.remote_grenades: list[dict] = []
         self.remote_pickups:  list[dict] = []
+        # Projectiles simules localement depuis les evenements MSG_PROJECTILES
+        self.proj_bullets  = pygame.sprite.Group()
+        self.proj_grenades = pygame.sprite.Group()
+        self._projectiles: dict[int, pygame.sprite.Sprite] = {}   # id reseau -> sprite
         self.wave_info: dict = {}
         self.local_state: dict = {}   # etat du joueur local
 
         self.state = STATE_LOBBY
         self._settings_return_state = STATE_PLAYING
         self._quit_requested = False
-        self._reload_pressed = False
         self._heartbeat_timer = 0.0
 
+        # Inputs echantillonnes a NET_INPUT_RATE, independamment du FPS :
+        # seuls les champs modifies partent, un input complet au moins
+        # toutes les NET_KEEPALIVE secondes.
+        self._input_tick    = 0       # numero d'echantillon (renvoye en input_tick)
+        self._input_accum   = 0.0
+        self._frame_t0      = 0.0     # perf_counter du pompage d'evenements de la frame
+        self._sampled_at    = 0.0     # _frame_t0 de l'echantillon precedent
+        self._last_input: dict = {}   # dernier etat envoye (champs INPUT_FIELDS)
+        self._last_full_at  = 0.0     # perf_counter du dernier input complet
+        self._shoot_latch   = False   # clic survenu entre deux echantillons
+        self._reload_latch  = False   # touche recharge pressee entre deux echantillons
+        self._input_window: dict[int, float] = {}    # tick -> debut de sa fenetre d'echantillonnage
+        self._input_latency = deque(maxlen=30)        # ms input -> etat serveur recu (pire cas)
+
         # Lobby : liste des joueurs en attente
         self._lobby_players: list[dict] = [
             {"player_id": self.player_id, "player_name": player_name, "is_host": False}
@@ -111,26 +140,18 @@ class ClientGame:
 
         self.hud   = HUD()
         self.menus = Menus()
-        self._font_small = pygame.font.SysFont("Arial", 12)
-        self._font_med   = pygame.font.SysFont("Arial", 18, bold=True)
-
-        # Surfaces pré-calculées pour les pickups (même rendu que le serveur)
-        from game.entities.pickup import _make_weapon_icon
-        self._pickup_surfs: dict[str, pygame.Surface] = {}
-        for _wname in WEAPON_ORDER:
-            _icon = _make_weapon_icon(_wname, 28)
-            _size = 36
-            _base = pygame.Surface((_size, _size), pygame.SRCALPHA)
-            pygame.draw.circle(_base, (*COL_YELLOW, 180), (_size // 2, _size // 2), _size // 2)
-            pygame.draw.circle(_base, (*COL_BLACK,  120), (_size // 2, _size // 2), _size // 2, 2)
-            _base.blit(_icon, (4, 4))
-            self._pickup_surfs[_wname] = _base
-
-        # Surface pré-calculée pour les grenades (même rendu que Grenade.draw serveur)
-        _gr = 7   # Grenade.RADIUS
-        self._grenade_surf = pygame.Surface((_gr * 2, _gr * 2), pygame.SRCALPHA)
-        pygame.draw.circle(self._grenade_surf, (60, 60, 60),    (_gr, _gr), _gr)
-        pygame.draw.circle(self._grenade_surf, (100, 100, 100), (_gr, _gr), _gr, 2)
+        self.debug = DebugOverlay()
+        self._batch = SpriteBatch()   # culling + rendu groupe du monde (_draw)
+        self.quality = QualityGovernor()   # niveau de detail selon le temps de frame
+        self._world_surf = None            # monde en resolution reduite (niveau 4)
+        self._font_small = get_font(12)
+        self._font_med   = get_font(18, bold=True)
+        # Prechauffage des assets (lobby) : sprites, explosions, etiquettes
+        fuse = WEAPONS["grenade"].get("fuse_time", 2.5)
+        self._warmup = AssetWarmup("client", texts=(
+            [(self._font_small, w.upper(), COL_YELLOW) for w in WEAPON_ORDER]
+            + [(self._font_small, f"{t / 10:.1f}", (255, 160, 30))
+               for t in range(int(fuse * 10) + 1)]))
 
         # Données distantes : explosions (absentes avant ce correctif)
         self.remote_explosions: list[dict] = []
@@ -138,11 +159,6 @@ class ClientGame:
         # Score popups locaux (générés quand le score augmente entre deux snapshots)
         self._score_popups: list[dict] = []
 
-        # Cache de surfaces par couleur pour les joueurs (evite de recalculer chaque frame)
-        self._player_surf_cache: dict[tuple, pygame.Surface] = {}
-        # Cache de surfaces par (type, couleur) pour les ennemis
-        self._enemy_surf_cache: dict[tuple, pygame.Surface] = {}
-
     # ------------------------------------------------------------------
     def run(self, owns_pygame: bool = False):
         """Boucle principale.
@@ -153,6 +169,10 @@ class ClientGame:
             dt = self.clock.tick(FPS) / 1000.0
             dt = min(dt, 0.05)
             self._tick += 1
+            t0 = time.perf_counter()
+            self._frame_t0 = t0
+            if not self._warmup.done:
+                self._warmup.step()
 
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -175,10 +195,25 @@ class ClientGame:
                 else:
                     pygame.mouse.set_visible(True)
                     return
+            self._update_projectiles(dt)
             self._update_camera()
-            # N'envoyer les inputs que pendant le jeu actif
+            # N'envoyer les inputs que pendant le jeu actif.
+            # L'echantillonnage reste cadence par cette boucle : pygame ne
+            # rafraichit clavier et souris qu'au pompage d'evenements, sur le
+            # thread principal ; un echantillon pris ailleurs ou plusieurs fois
+            # par frame relirait le meme etat. Au plus un echantillon par
+            # frame donc : sous NET_INPUT_RATE FPS le debit suit le FPS. Une
+            # periode manquee n'est pas jetee : l'echantillon suivant part des
+            # la frame d'apres (un seul rattrapage, pas de rafale). La latence
+            # de l'overlay compte ce delai (voir _send_input).
             if self.state not in (STATE_PAUSED, STATE_SETTINGS, STATE_LOBBY):
-                self._send_input()
+                self._input_accum += dt
+                step = 1.0 / NET_INPUT_RATE
+                if self._input_accum >= step:
+                    self._input_accum = min(self._input_accum - step, step)
+                    self._send_input()
+            else:
+                self._sampled_at = 0.0   # pas de fenetre ouverte pendant la pause
             self.upgrade_machine.update(dt)
             # Décompte des score popups locaux
             for _pp in self._score_popups:
@@ -191,9 +226,14 @@ class ClientGame:
                 self.net.send_input({"type": "ping"})
             self._draw()
             pygame.display.flip()
+            self.quality.record((time.perf_counter() - t0) * 1000.0)
 
     # ------------------------------------------------------------------
     def _handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == KEYBINDS["debug"]:
+            self.debug.toggle()
+            return
+
         if self.state == STATE_LOBBY:
             am_host = any(
                 p.get("is_host") and p.get("player_id") == self.player_id
@@ -226,6 +266,11 @@ class ClientGame:
             self.menus.handle_pause_event(event)
             return
 
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            self._shoot_latch = True
+        elif event.type == pygame.KEYDOWN and event.key == KEYBINDS["reload"]:
+            self._reload_latch = True
+
         if event.type == pygame.MOUSEWHEEL:
             self._local_weapon_idx = (self._local_weapon_idx - event.y) % len(WEAPON_ORDER)
         elif event.type == pygame.KEYDOWN:
@@ -247,8 +292,9 @@ class ClientGame:
             elif t == MSG_START_GAME:
                 self.state = STATE_PLAYING
                 pygame.mouse.set_visible(False)
-            elif t == MSG_GAME_STATE:
-                self._apply_state(msg)
+                self._clear_projectiles()
+            elif t == MSG_PROJECTILES:
+                self._apply_projectiles(msg.get("events", []))
             elif t == MSG_GAME_OVER:
                 self.state = STATE_GAMEOVER
                 self._gameover_wave = msg.get("wave_reached", 0)
@@ -266,27 +312,38 @@ class ClientGame:
                 if reason == "disconnected_by_server":
                     # Retourner au menu proprement
                     self._quit_requested = True
+        # Snapshots : seul le plus recent compte (les autres sont depasses)
+        snap = self.net.get_snapshot()
+        if snap is not None:
+            self._apply_state(snap)
+
+    def _ack_input(self, acked: int) -> None:
+        """Latence input -> etat : le serveur renvoie le dernier tick applique."""
+        since = self._input_window.pop(acked, None)
+        if since is None:
+            return
+        self._input_latency.append((time.perf_counter() - since) * 1000.0)
+        for t in [t for t in self._input_window if t < acked]:
+            del self._input_window[t]
 
     def _apply_state(self, state: dict):
         # Score avant mise à jour → pour détecter les kills
         old_score = self.local_state.get("score", 0)
 
-        self.remote_players    = {p["player_id"]: p for p in state.get("players", [])}
+        # players_by_id / wave_info : prepares sur le thread reseau
+        self.remote_players    = state["players_by_id"]
         self.remote_enemies    = state.get("enemies", [])
-        self.remote_bullets    = state.get("bullets", [])
-        self.remote_grenades   = state.get("grenades", [])
         self.remote_pickups    = state.get("pickups", [])
         self.remote_explosions = state.get("explosions", [])
-        self.wave_info         = {k: state[k] for k in
-            ("wave_number", "wave_state", "wave_countdown", "enemies_remaining")
-            if k in state}
+        self.wave_info         = state["wave_info"]
         # Sync upgrade levels depuis serveur
         srv_levels = state.get("upgrade_levels", {})
         if srv_levels:
             self.upgrade_machine.upgrade_levels.update(srv_levels)
         if self.player_id in self.remote_players:
             self.local_state = dict(self.remote_players[self.player_id])
-            self.local_state["all_players"] = list(self.remote_players.values())
+            self.local_state["all_players"] = state.get("players", [])
+            self._ack_input(int(self.local_state.get("input_tick", 0)))
             # Score popup local quand le score augmente (kill ennemi)
             new_score = self.local_state.get("score", 0)
             if new_score > old_score:
@@ -301,6 +358,44 @@ class ClientGame:
             # le retour serveur confirme l'arme mais l'affichage reste instantané
             # (voir _draw_client_hud qui utilise self._local_weapon_idx directement)
 
+    def _apply_projectiles(self, events: list):
+        """Apparitions : projectile cree puis avance de son age (temps ecoule
+        cote serveur avant l'envoi). Disparitions : retire (impact, detonation)."""
+        for ev in events:
+            kind, net_id, _tick, age = ev[:4]
+            if kind == "b":
+                x, y, vx, vy, weapon, owner, bullet_range = ev[4:]
+                proj = Bullet(x, y, vx, vy, 0, "player" if owner == "p" else "enemy",
+                              bullet_range, weapon=weapon, groups=(self.proj_bullets,))
+                if age > 0:
+                    proj.update(age, self.tilemap)
+            elif kind == "g":
+                x, y, vx, vy, fuse = ev[4:]
+                proj = Grenade(x, y, vx, vy, fuse, 0, 0, groups=(self.proj_grenades,))
+                if age > 0:
+                    proj.step(age, self.tilemap)
+                    proj.fuse_timer -= age
+            else:
+                proj = self._projectiles.pop(net_id, None)
+                if proj is not None:
+                    proj.kill()
+                continue
+            self._projectiles[net_id] = proj
+
+    def _update_projectiles(self, dt: float):
+        # Balles : meme balayage que le serveur, sans cibles (l'impact sur une
+        # entite arrive par l'evenement de disparition)
+        for b in list(self.proj_bullets):
+            b.update(dt, self.tilemap)
+        for g in self.proj_grenades:
+            g.step(dt, self.tilemap)
+            g.fuse_timer = max(0.0, g.fuse_timer - dt)
+
+    def _clear_projectiles(self):
+        self.proj_bullets.empty()
+        self.proj_grenades.empty()
+        self._projectiles.clear()
+
     def _update_camera(self):
         px = float(self.local_state.get("x", SCREEN_W / 2))
         py = float(self.local_state.get("y", SCREEN_H / 2))
@@ -308,6 +403,13 @@ class ClientGame:
         self.camera.update(fake_rect)
 
     def _send_input(self):
+        """Un echantillon d'input (appele a NET_INPUT_RATE par run).
+
+        La latence mesuree part du pompage d'evenements de l'echantillon
+        precedent : une touche pressee juste apres lui attend la periode
+        d'echantillonnage et la duree des frames avant de partir."""
+        since = self._sampled_at or self._frame_t0
+        self._sampled_at = self._frame_t0
         keys  = pygame.key.get_pressed()
         mbtns = pygame.mouse.get_pressed()
         mpos  = pygame.mouse.get_pos()
@@ -326,25 +428,46 @@ class ClientGame:
         dy = (1 if keys[KEYBINDS["move_down"]]  else 0) - \
              (1 if keys[KEYBINDS["move_up"]]    else 0)
 
-        # Recharge : n'envoyer qu'une seule fois par pression (edge detection)
-        if keys[KEYBINDS["reload"]]:
-            if not self._reload_pressed:
-                self.net.send_input({"type": "reload_req", "player_id": self.player_id})
-                self._reload_pressed = True
-        else:
-            self._reload_pressed = False
+        # Recharge : une seule requete par pression (edge, meme entre deux echantillons)
+        if self._reload_latch:
+            self._reload_latch = False
+            self.net.send_input({"type": "reload_req", "player_id": self.player_id})
 
-        inp = make_input(
+        tick = self._input_tick + 1
+        full = make_input(
             player_id  = self.player_id,
-            tick       = self._tick,
+            tick       = tick,
             dx         = float(dx),
             dy         = float(dy),
             aim_angle  = aim_angle,
-            shooting   = bool(mbtns[0]),
+            # Un clic bref entre deux echantillons tire quand meme une fois
+            shooting   = bool(mbtns[0]) or self._shoot_latch,
             weapon_idx = self._local_weapon_idx,
             revive_held= bool(keys[KEYBINDS["revive"]]),
         )
-        self.net.send_input(inp)
+        self._shoot_latch = False
+
+        last = self._last_input
+        changes = {k: full[k] for k in INPUT_FIELDS if last.get(k) != full[k]}
+        if "aim_angle" in changes and "aim_angle" in last:
+            delta = (full["aim_angle"] - last["aim_angle"] + 180.0) % 360.0 - 180.0
+            if abs(delta) < NET_AIM_EPSILON:
+                del changes["aim_angle"]
+
+        now = time.perf_counter()
+        if now - self._last_full_at >= NET_KEEPALIVE:
+            msg = full                      # keepalive : etat complet
+            self._last_full_at = now
+        elif changes:
+            msg = make_input_delta(self.player_id, tick, changes)
+        else:
+            return                          # rien de neuf : aucun envoi
+        self._input_tick = tick
+        last.update((k, msg[k]) for k in INPUT_FIELDS if k in msg)
+        self._input_window[tick] = since
+        if len(self._input_window) > 4 * NET_INPUT_RATE:    # jamais appliques (joueur a terre)
+            del self._input_window[min(self._input_window)]
+        self.net.send_input(msg)
 
     # ------------------------------------------------------------------
     def _near_upgrade_machine(self) -> bool:
@@ -401,85 +524,98 @@ class ClientGame:
                 self._quit_requested = True
             return
 
-        self.screen.fill((80, 72, 55))
-        self.tilemap.draw(self.screen, self.camera.offset)
+        # Monde : entites hors vue ecartees, le reste rendu couche par couche.
+        # Niveau de qualite bas : resolution interne reduite (world), agrandie
+        # a la fin ; les dessins a la camera (machine, joueurs) se font alors
+        # apres l'agrandissement, a pleine resolution.
+        q      = self.quality
+        scale  = q.render_scale
+        world  = self.screen if scale == 1.0 else self._world_surface(scale)
+        batch  = self._batch
+        late: list[tuple] = []   # (couche, fn, args) hors resolution interne
+        world.fill((80, 72, 55))
+        self.tilemap.draw(world, self.camera.offset, scale)
+        batch.begin(self.camera, scale)
 
         # Pickups (rendu identique au serveur : icône + effet bob sinusoïdal)
         _t = pygame.time.get_ticks() / 1000.0
         for pk in self.remote_pickups:
-            sx, sy = self.camera.apply_pos(pk["x"], pk["y"])
+            if not batch.visible(pk["x"], pk["y"], 24):
+                continue
             wname = pk.get("weapon_name", "pistol")
-            surf  = self._pickup_surfs.get(wname)
+            surf  = pickup_surf(wname) if wname in WEAPONS else None
+            phase = (pk["x"] + pk["y"]) * 0.01   # phase unique par position
+            bob_y = math.sin((_t + phase) * 2.5 * math.pi * 2) * 3.0 if surf else 0.0
+            sx, sy = batch.to_screen(pk["x"], pk["y"] + bob_y)
             if surf:
-                phase = (pk["x"] + pk["y"]) * 0.01   # phase unique par position
-                bob_y = math.sin((_t + phase) * 2.5 * math.pi * 2) * 3.0
-                r = surf.get_rect(center=(int(sx), int(sy + bob_y)))
-                self.screen.blit(surf, r)
-                label = self._font_small.render(wname.upper(), True, COL_YELLOW)
-                self.screen.blit(label, (r.centerx - label.get_width() // 2, r.top - 14))
+                batch.add_centered(LAYER_PICKUPS, surf, pk["x"], pk["y"] + bob_y)
+                top = sy - surf.get_height() // 2 - 14
             else:
-                pygame.draw.circle(self.screen, COL_YELLOW, (int(sx), int(sy)), 8)
-                label = self._font_small.render(wname.upper(), True, COL_YELLOW)
-                self.screen.blit(label, (int(sx) - label.get_width()//2, int(sy) - 18))
+                batch.add_draw(LAYER_PICKUPS, pygame.draw.circle, COL_YELLOW, (sx, sy), 8)
+                top = sy - 18
+            if q.labels:
+                label = render_text(self._font_small, wname.upper(), True, COL_YELLOW)
+                batch.add_label(LAYER_PICKUPS, label, (sx - label.get_width() // 2, top))
 
         # Machine d'amélioration
-        self.upgrade_machine.draw(self.screen, self.camera)
+        late.append((LAYER_PICKUPS, self.upgrade_machine.draw, (self.camera,)))
 
         # Joueurs
         for pid, p in self.remote_players.items():
-            self._draw_remote_player(p, is_local=(pid == self.player_id))
+            if batch.visible(p["x"], p["y"], 32):
+                late.append((LAYER_ENTITIES, self._draw_remote_player,
+                             (p, pid == self.player_id)))
 
-        # Ennemis
+        # Ennemis : sprite groupe + barre de vie / etat IA par-dessus
         for e in self.remote_enemies:
-            self._draw_remote_enemy(e)
-
-        # Grenades (surface pré-rendue identique à Grenade.draw serveur)
-        for g in self.remote_grenades:
-            sx, sy = self.camera.apply_pos(g["x"], g["y"])
-            r = self._grenade_surf.get_rect(center=(int(sx), int(sy)))
-            self.screen.blit(self._grenade_surf, r)
-            fuse = g.get("fuse_remaining", 0)
-            if fuse > 0:
-                fuse_surf = self._font_small.render(f"{fuse:.1f}", True, (255, 160, 30))
-                self.screen.blit(fuse_surf, (int(sx) - fuse_surf.get_width()//2, int(sy) - 16))
-
-        # Explosions (reçues du serveur)
-        for expl in self.remote_explosions:
-            esx, esy = self.camera.apply_pos(expl["x"], expl["y"])
-            er       = int(expl.get("blast_radius", 110))
+            if batch.visible(e["x"], e["y"], 32):
+                self._draw_remote_enemy(batch, e, q.health_bars)
+
+        # Grenades (simulees localement, meme rendu que Grenade.draw serveur)
+        for g in self.proj_grenades:
+            if not batch.visible(g.pos.x, g.pos.y, 16):
+                continue
+            batch.add_centered(LAYER_ENTITIES, g.image, g.pos.x, g.pos.y)
+            if g.fuse_timer > 0 and q.labels:
+                sx, sy = batch.to_screen(g.pos.x, g.pos.y)
+                fuse_surf = render_text(self._font_small, f"{g.fuse_timer:.1f}", True, (255, 160, 30))
+                batch.add_label(LAYER_ENTITIES, fuse_surf,
+                                (sx - fuse_surf.get_width()//2, sy - 16))
+
+        # Explosions (reçues du serveur) ; plafonnees aux plus recentes
+        explosions = self.remote_explosions
+        if q.max_explosions is not None:
+            explosions = explosions[-q.max_explosions:]
+        for expl in explosions:
+            er = int(expl.get("blast_radius", 110))
+            if not batch.visible(expl["x"], expl["y"], er):
+                continue
+            esx, esy = batch.to_screen(expl["x"], expl["y"])
             progress = min(1.0, expl.get("timer", 0.0) / max(0.001, expl.get("duration", 0.5)))
-            draw_explosion_at(self.screen, int(esx), int(esy), er, progress)
-
-        # Balles (couleur et forme selon l'arme)
-        for b in self.remote_bullets:
-            sx, sy = self.camera.apply_pos(b["x"], b["y"])
-            if b.get("owner") == "player":
-                weapon = b.get("weapon", "pistol")
-                if weapon == "pistol":
-                    pygame.draw.circle(self.screen, (255, 230, 60), (int(sx), int(sy)), 2)
-                elif weapon == "rifle":
-                    vx = b.get("vel_x", 1.0)
-                    vy = b.get("vel_y", 0.0)
-                    angle = math.degrees(math.atan2(-vy, vx))
-                    _bsurf = pygame.Surface((9, 2), pygame.SRCALPHA)
-                    pygame.draw.rect(_bsurf, (220, 235, 255), (0, 0, 9, 2), border_radius=1)
-                    _brot = pygame.transform.rotate(_bsurf, angle)
-                    _br = _brot.get_rect(center=(int(sx), int(sy)))
-                    self.screen.blit(_brot, _br)
-                elif weapon == "smg":
-                    pygame.draw.circle(self.screen, (255, 145, 30), (int(sx), int(sy)), 2)
-                else:
-                    pygame.draw.circle(self.screen, COL_BULLET_P, (int(sx), int(sy)), 3)
-            else:
-                pygame.draw.circle(self.screen, COL_BULLET_E, (int(sx), int(sy)), 3)
+            batch.add_draw(LAYER_FX, draw_explosion_at, esx, esy, int(er * scale), progress)
+
+        # Balles (simulees localement, couleur et forme selon l'arme comme le serveur)
+        for b in self.proj_bullets:
+            if batch.visible(b.pos.x, b.pos.y):
+                batch.add_centered(LAYER_BULLETS, b.image, b.pos.x, b.pos.y)
+
+        if scale == 1.0:
+            for layer, fn, args in late:
+                batch.add_draw(layer, fn, *args)
+            batch.flush(self.screen)
+        else:
+            batch.flush(world)
+            pygame.transform.scale(world, (SCREEN_W, SCREEN_H), self.screen)
+            for _layer, fn, args in late:
+                fn(self.screen, *args)
 
         # Score popups flottants (même logique que hud.draw_score_popups serveur)
-        for _pp in self._score_popups:
+        for _pp in (self._score_popups if q.labels else ()):
             _psx, _psy = self.camera.apply_pos(_pp["x"], _pp["y"])
             _elapsed   = 1.0 - _pp["timer"]
             _psy      -= _elapsed * 50           # monte au fil du temps
             _palpha    = int(min(255, _pp["timer"] / 0.4 * 255))
-            _pp_surf   = self._font_med.render(_pp["text"], True, COL_YELLOW)
+            _pp_surf   = render_text(self._font_med, _pp["text"], True, COL_YELLOW).copy()
             _pp_surf.set_alpha(_palpha)
             self.screen.blit(_pp_surf, (int(_psx) - _pp_surf.get_width() // 2, int(_psy)))
 
@@ -494,9 +630,13 @@ class ClientGame:
         self.upgrade_machine.draw_result_message(self.screen, SCREEN_W, SCREEN_H)
 
         # Indicateur connexion (en bas)
-        net_txt = self._font_small.render("CLIENT connecte", True, (180, 220, 180))
+        net_txt = render_text(self._font_small, "CLIENT connecte", True, (180, 220, 180))
         self.screen.blit(net_txt, (10, SCREEN_H - 20))
 
+        # Overlay de debug (F3)
+        if self.debug.visible:
+            self.debug.draw(self.screen, self._debug_lines())
+
         # Menu pause en overlay
         if self.state == STATE_PAUSED:
             pause_result = self.menus.draw_pause(self.screen)
@@ -511,23 +651,25 @@ class ClientGame:
         HUD.draw_crosshair(self.screen)
 
     # ------------------------------------------------------------------
-    def _get_player_surf(self, color: tuple) -> pygame.Surface:
-        """Retourne la surface joueur pour la couleur donnee, avec cache."""
-        if color not in self._player_surf_cache:
-            self._player_surf_cache[color] = _make_player_surf(color, 40)
-        return self._player_surf_cache[color]
-
-    def _get_enemy_surf(self, etype: str, color: tuple) -> pygame.Surface:
-        """Retourne la surface ennemi pour le (type, couleur) donne, avec cache."""
-        key = (etype, color)
-        if key not in self._enemy_surf_cache:
-            _size_map = {"soldier": 32, "officer": 26, "heavy": 40}
-            size = _size_map.get(etype, 32)
-            self._enemy_surf_cache[key] = _make_enemy_surf(color, size, etype)
-        return self._enemy_surf_cache[key]
+    def _debug_lines(self) -> list[str]:
+        """Lignes de l'overlay de debug (F3)."""
+        batch = self._batch
+        lat   = (sum(self._input_latency) / len(self._input_latency)
+                 if self._input_latency else 0.0)
+        return [
+            f"FPS {self.clock.get_fps():.0f}",
+            f"Sprites : {batch.drawn} dessines / {batch.culled} hors vue",
+            f"Qualite : {self.quality.level} ({self.quality.name})  "
+            f"{self.quality.avg_ms:.1f} ms/frame",
+            f"Input -> etat : <= {lat:.0f} ms  ({NET_INPUT_RATE}/s, 1 par frame)",
+            f"Snapshots : {self.net.snapshots_received} recus / "
+            f"{self.net.snapshots_dropped} ecrases",
+            f"Prechauffage : {'fini' if self._warmup.done else 'en cours'}  "
+            f"{self._warmup.work_ms:.0f} ms / {self._warmup.frames} frames",
+            cache_summary(),
+        ]
 
-    # ------------------------------------------------------------------
-    def _draw_remote_player(self, p: dict, is_local: bool):
+    def _draw_remote_player(self, surface: pygame.Surface, p: dict, is_local: bool):
         sx, sy = self.camera.apply_pos(p["x"], p["y"])
         pid    = p["player_id"]
         color  = PLAYER_COLORS[(pid - 1) % len(PLAYER_COLORS)]
@@ -538,53 +680,62 @@ class ClientGame:
 
         if state == "down":
             col = (220, 60, 30) if (pygame.time.get_ticks() // 400) % 2 == 0 else (120, 30, 10)
-            pygame.draw.circle(self.screen, col, (int(sx), int(sy)), 14)
-            pygame.draw.circle(self.screen, COL_WHITE, (int(sx), int(sy)), 14, 2)
+            pygame.draw.circle(surface, col, (int(sx), int(sy)), 14)
+            pygame.draw.circle(surface, COL_WHITE, (int(sx), int(sy)), 14, 2)
             down_t = p.get("down_timer", 0)
-            txt = self._font_med.render(f"{int(down_t)}s", True, (255, 200, 50))
-            self.screen.blit(txt, (int(sx) - txt.get_width()//2, int(sy) - 32))
+            txt = render_text(self._font_med, f"{int(down_t)}s", True, (255, 200, 50))
+            surface.blit(txt, (int(sx) - txt.get_width()//2, int(sy) - 32))
             # Barre revive
             rp = p.get("revive_progress", 0)
             if rp > 0:
                 bw = 40
                 bx = int(sx) - bw//2
                 by = int(sy) + 18
-                pygame.draw.rect(self.screen, (60, 60, 60), (bx, by, bw, 5))
-                pygame.draw.rect(self.screen, (50, 220, 50), (bx, by, int(bw * rp), 5))
+                pygame.draw.rect(surface, (60, 60, 60), (bx, by, bw, 5))
+                pygame.draw.rect(surface, (50, 220, 50), (bx, by, int(bw * rp), 5))
             return
 
-        # Rendu joueur distant : meme surface que player.py, avec rotation identique au serveur
-        surf    = self._get_player_surf(color)
-        rotated = pygame.transform.rotate(surf, -p.get("facing_angle", 0))
+        # Rendu joueur distant : meme sprite pivote que player.py (atlas partage)
+        rotated = SPRITES.rotated("player", color, -p.get("facing_angle", 0),
+                                  lambda: _make_player_surf(color, 40))
         r       = rotated.get_rect(center=(int(sx), int(sy)))
-        self.screen.blit(rotated, r)
+        surface.blit(rotated, r)
 
         # Nom du joueur
-        name_surf = self._font_small.render(p.get("player_name", f"P{pid}"), True,
-                                            (220, 220, 220))
-        self.screen.blit(name_surf, (int(sx) - name_surf.get_width()//2, int(sy) - 30))
+        name_surf = render_text(self._font_small, p.get("player_name", f"P{pid}"),
+                                True, (220, 220, 220))
+        surface.blit(name_surf, (int(sx) - name_surf.get_width()//2, int(sy) - 30))
 
         # Barre HP
         hp    = p.get("hp", 100)
         maxhp = p.get("max_hp", 100)
-        if hp < maxhp:
+        if hp < maxhp and self.quality.health_bars:
             bw = 36
             bx = int(sx) - bw//2
             by = int(sy) - 24
-            pygame.draw.rect(self.screen, (180, 30, 30), (bx, by, bw, 4))
+            pygame.draw.rect(surface, (180, 30, 30), (bx, by, bw, 4))
             ratio  = hp / max(1, maxhp)
             hp_col = (50, 200, 50) if ratio > 0.4 else (220, 80, 30)
-            pygame.draw.rect(self.screen, hp_col, (bx, by, int(bw * ratio), 4))
+            pygame.draw.rect(surface, hp_col, (bx, by, int(bw * ratio), 4))
 
-    def _draw_remote_enemy(self, e: dict):
-        sx, sy = self.camera.apply_pos(e["x"], e["y"])
+    def _draw_remote_enemy(self, batch, e: dict, health_bars: bool = True):
         etype  = e.get("enemy_type", "soldier")
         color  = ENEMY_TYPES.get(etype, ENEMY_TYPES["soldier"])["color"]
-        surf   = self._get_enemy_surf(etype, color)
-        draw_enemy_at(self.screen, int(sx), int(sy),
-                      surf, e.get("facing_angle", 0),
-                      e.get("hp", 60), e.get("max_hp", 60),
-                      e.get("ai_state", "patrol"))
+        batch.add_centered(LAYER_ENTITIES,
+                           enemy_sprite(etype, color, e.get("facing_angle", 0)),
+                           e["x"], e["y"])
+        if health_bars:
+            batch.add_draw(LAYER_ENTITIES, draw_enemy_overlay,
+                           *batch.to_screen(e["x"], e["y"]),
+                           e.get("hp", 60), e.get("max_hp", 60),
+                           e.get("ai_state", "patrol"))
+
+    def _world_surface(self, scale: float) -> pygame.Surface:
+        """Surface du monde en resolution interne reduite (creee au besoin)."""
+        size = (int(SCREEN_W * scale), int(SCREEN_H * scale))
+        if self._world_surf is None or self._world_surf.get_size() != size:
+            self._world_surf = pygame.Surface(size).convert(self.screen)
+        return self._world_surf
 
     def _draw_client_hud(self):
         """HUD reconstruit depuis le dict d'etat serveur."""
@@ -662,8 +813,8 @@ def _pre_menu() -> tuple[str, str, pygame.Surface]:
         elif state == STATE_NETWORK_MENU:
             menus.draw_network_menu(screen)
             if error_msg:
-                font_err = pygame.font.SysFont("Arial", 18, bold=True)
-                err_s = font_err.render(error_msg, True, (220, 60, 60))
+                font_err = get_font(18, bold=True)
+                err_s = render_text(font_err, error_msg, True, (220, 60, 60))
                 screen.blit(err_s, (SCREEN_W // 2 - err_s.get_width() // 2,
                                     SCREEN_H - 52))
 
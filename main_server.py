@@ -10,9 +10,10 @@ from settings import (
     STATE_PLAYING, STATE_PAUSED, STATE_GAMEOVER, STATE_MENU, STATE_SETTINGS,
     STATE_NETWORK_MENU, STATE_LOBBY,
     PLAYER_SPEED, WEAPON_ORDER, PLAYER_COLORS,
-    NET_PORT, NET_BROADCAST_RATE,
+    NET_PORT, NET_BROADCAST_RATE, PATH_WORKERS,
     REVIVE_RANGE, REVIVE_TIME,
     UPGRADE_MACHINE_TILE, KEYBINDS,
+    LAYER_PICKUPS, LAYER_ENTITIES, LAYER_BULLETS, LAYER_FX,
 )
 from game.entities.upgrade_machine import UpgradeMachine
 from game.world.tilemap    import TileMap
@@ -20,40 +21,52 @@ from game.world.camera     import Camera
 from game.world.map_data   import MAP_DATA, PLAYER_START
 from game.entities.player  import Player
 from game.entities.bullet  import Bullet
+from game.entities.enemy   import enemy_sprite, draw_enemy_overlay
 from game.systems.pathfinding  import Pathfinder
+from game.systems.path_service import PathService
+from game.systems.squad        import SquadManager
+from game.systems.perception   import Perception
 from game.systems.wave_manager import WaveManager
 from game.systems.collision    import move_and_collide
+from game.render.text       import get_font, render_text
+from game.render.batch      import SpriteBatch
+from game.render.warmup     import AssetWarmup
+from game.render.surface_cache import cache_summary
 from game.ui.hud   import HUD
 from game.ui.menus import Menus
+from game.ui.debug_overlay import DebugOverlay
 from game.network.server   import GameServer
 from game.network.messages import (
     MSG_INPUT, MSG_GAME_STATE, MSG_START_GAME,
     MSG_PLAYER_JOINED, MSG_PLAYER_LEFT,
     MSG_PLAYER_DEAD, MSG_PLAYER_REVIVED, MSG_GAME_OVER, MSG_UPGRADE_RESULT,
     encode, make_game_state, make_lobby_state,
-    serialize_player, serialize_enemy, serialize_bullet,
-    serialize_grenade, serialize_pickup, serialize_explosion,
+    serialize_player, serialize_enemy, serialize_pickup, serialize_explosion,
+    make_projectiles, bullet_spawn, grenade_spawn, projectile_despawn,
 )
 
 
 class ServerGame:
     """Boucle de jeu autorité. Simule tout, broadcaste l'état."""
 
-    def __init__(self, host_name: str = "Host", screen: pygame.Surface | None = None):
+    path_workers = PATH_WORKERS   # processus A* (0 : A* dans le tick sous budget, ex. wave_balance.py)
+
+    def __init__(self, host_name: str = "Host", screen: pygame.Surface | None = None,
+                 port: int = NET_PORT, seed: int | None = None, net_server=None):
         if not pygame.get_init():
             pygame.init()
-        pygame.display.set_caption(f"{TITLE}  [HOST: {self._get_local_ip()}:{NET_PORT}]")
+        pygame.display.set_caption(f"{TITLE}  [HOST: {self._get_local_ip()}:{port}]")
         self.screen = screen if screen is not None else pygame.display.set_mode((SCREEN_W, SCREEN_H))
         self.clock  = pygame.time.Clock()
         pygame.mouse.set_visible(False)
 
-        # Serveur reseau
-        self.server = GameServer()
+        # Serveur reseau (net_server : remplaçant hors ligne, ex. OfflineServer)
+        self.server = net_server if net_server is not None else GameServer(port=port)
         self.server.start_in_thread()
         local_ip = self._get_local_ip()
         print(f"\n=== SERVEUR DEMARRE ===")
         print(f"IP locale : {local_ip}")
-        print(f"Port      : {NET_PORT}")
+        print(f"Port      : {port}")
         print(f"Commande client : python main_client.py {local_ip} <Nom>")
         print(f"========================\n")
 
@@ -65,11 +78,17 @@ class ServerGame:
         # Inputs en attente des clients (player_id -> dernier input)
         self.pending_inputs: dict[int, dict] = {}
 
+        # Graine fixe (mode déterministe) ; None = nouvelle graine à chaque partie
+        self.seed = seed
+        # Enregistrement des inputs réseau (game/network/match_log.py)
+        self.recorder = None
+
         # Broadcast timer
         self._broadcast_timer   = 0.0
         self._broadcast_interval = 1.0 / NET_BROADCAST_RATE
 
         self._tick = 0
+        self._proj_next_id = 0   # ids réseau des projectiles (jamais réutilisés)
         self.state = STATE_LOBBY
         self._settings_return_state = STATE_PLAYING   # d'où on vient quand on ouvre les paramètres
 
@@ -80,6 +99,9 @@ class ServerGame:
         self._init_world()
         self.hud   = HUD()
         self.menus = Menus()
+        self.debug = DebugOverlay()
+        self._batch = SpriteBatch()   # culling + rendu groupe du monde (_draw)
+        self._warmup = AssetWarmup("serveur")   # assets construits pendant le lobby
 
         # Données conservées pour l'écran game over
         self._gameover_scores: list[dict] = []
@@ -104,9 +126,19 @@ class ServerGame:
         self.players[player_id] = p
 
     def _init_world(self):
+        # Flux aléatoire propre à la partie : même graine + mêmes inputs = même monde
+        self.match_seed = self._next_match_seed()
+        self.rng        = random.Random(self.match_seed)
+        if self.recorder:
+            self.recorder.world(self.match_seed)
+
         self.tilemap    = TileMap(MAP_DATA)
         self.camera     = Camera()
         self.pathfinder = Pathfinder(self.tilemap)
+        self.pathfinder.service = PathService(self.tilemap, self.pathfinder,
+                                              workers=self.path_workers)
+        self.squads     = SquadManager(self.tilemap, self.pathfinder)
+        self.perception = Perception(self.tilemap)
 
         self.all_sprites     = pygame.sprite.Group()
         self.enemy_group     = pygame.sprite.Group()
@@ -114,6 +146,10 @@ class ServerGame:
         self.grenade_group   = pygame.sprite.Group()
         self.explosion_group = pygame.sprite.Group()
         self.pickup_group    = pygame.sprite.Group()
+        # Projectiles connus des clients (sprite -> id réseau) et événements à envoyer
+        self._proj_live: dict = {}
+        self._proj_events: list = []
+        self._proj_clock = 0.0
 
         # Machine d'amélioration
         col, row = UPGRADE_MACHINE_TILE
@@ -127,8 +163,26 @@ class ServerGame:
             enemy_group  = self.enemy_group,
             pickup_group = self.pickup_group,
             all_groups   = (self.all_sprites,),
+            rng          = self.rng,
         )
 
+    def _next_match_seed(self) -> int:
+        """Graine du prochain monde. Surchargé par le rejeu (graines enregistrées)."""
+        return self.seed if self.seed is not None else random.randrange(1 << 32)
+
+    def start_recording(self, path: str, fixed_dt: float | None = None) -> None:
+        """Enregistrer les messages réseau traités à chaque tick (rejouables avec
+        replay_match.py). Les inputs clavier/souris de l'hôte local ne sont pas
+        enregistrés : seul un serveur dédié est rejouable à l'identique."""
+        from game.network.match_log import MatchRecorder
+        self.recorder = MatchRecorder(path, self._tick, self.match_seed, fixed_dt)
+        print(f"[record] Enregistrement de la partie → {path}")
+
+    def stop_recording(self) -> None:
+        if self.recorder:
+            self.recorder.close()
+            self.recorder = None
+
     # ------------------------------------------------------------------
     def run(self, owns_pygame: bool = False):
         """Boucle principale. Retourne normalement pour permettre le retour au menu.
@@ -140,9 +194,12 @@ class ServerGame:
             dt = self.clock.tick(FPS) / 1000.0
             dt = min(dt, 0.05)
             self._tick += 1
+            if self.recorder:
+                self.recorder.begin_tick(self._tick, dt)
 
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
+                    self.stop_recording()
                     self.server.stop()
                     if owns_pygame:
                         pygame.quit()
@@ -152,6 +209,7 @@ class ServerGame:
                 self._handle_local_event(event)
 
             if self._quit_requested:
+                self.stop_recording()
                 self.server.stop()
                 if owns_pygame:
                     pygame.quit()
@@ -160,6 +218,8 @@ class ServerGame:
                     pygame.mouse.set_visible(True)
                     return   # Retour propre vers main.py
 
+            if not self._warmup.done:
+                self._warmup.step()
             self._process_network_messages()
             self._update(dt)
             self._maybe_broadcast(dt)
@@ -170,6 +230,10 @@ class ServerGame:
     def _handle_local_event(self, event):
         host = self.players.get(self.host_player_id)
 
+        if event.type == pygame.KEYDOWN and event.key == KEYBINDS["debug"]:
+            self.debug.toggle()
+            return
+
         # Lobby : seul l'hôte gère l'événement de lancement
         if self.state == STATE_LOBBY:
             self.menus.handle_lobby_event(event, is_host=True)
@@ -209,7 +273,10 @@ class ServerGame:
         host.handle_event(event)
 
     def _process_network_messages(self):
-        for msg in self.server.get_pending_inputs():
+        msgs = self.server.get_pending_inputs()
+        if self.recorder:
+            self.recorder.messages(msgs)
+        for msg in msgs:
             mtype = msg.get("type")
 
             if mtype == MSG_PLAYER_JOINED:
@@ -228,6 +295,7 @@ class ServerGame:
 
             elif mtype == MSG_PLAYER_LEFT:
                 pid = msg["player_id"]
+                self.pending_inputs.pop(pid, None)
                 if pid in self.players:
                     name = self.players[pid].player_name
                     del self.players[pid]
@@ -242,7 +310,9 @@ class ServerGame:
                 pid = msg["player_id"]
                 inp = msg["input"]
                 if inp.get("type") == MSG_INPUT:
-                    self.pending_inputs[pid] = inp
+                    # Inputs complets ou partiels (champs modifies seulement) :
+                    # fusion dans le dernier etat connu du joueur
+                    self.pending_inputs.setdefault(pid, {}).update(inp)
                 elif inp.get("type") == "reload_req":
                     player = self.players.get(pid)
                     if player and player.state == "alive" and not player.is_reloading:
@@ -360,6 +430,9 @@ class ServerGame:
             return
 
         # ---- Ennemis ----
+        self.pathfinder.service.tick()
+        self.squads.update(dt, self.enemy_group, players_list)
+        self.perception.update(self.enemy_group, players_list)
         dead_enemies = []
         for enemy in list(self.enemy_group):
             enemy.update(dt, self.tilemap, players_list,
@@ -416,6 +489,8 @@ class ServerGame:
     # ------------------------------------------------------------------
     def _apply_remote_input(self, player: Player, inp: dict, dt: float):
         """Applique un dict d'input reseau sur un joueur distant."""
+        # Renvoyé dans les snapshots (serialize_player) : latence input -> état
+        player.last_input_tick = int(inp.get("tick", 0))
         dx = float(inp.get("dx", 0))
         dy = float(inp.get("dy", 0))
         if dx != 0 and dy != 0:
@@ -453,7 +528,7 @@ class ServerGame:
                     wdata  = player.get_weapon_data()
                     spread = wdata.get("spread", 0)
                     angle  = math.radians(player.facing_angle) + \
-                             math.radians(random.uniform(-spread, spread))
+                             math.radians(self.rng.uniform(-spread, spread))
                     speed  = wdata["bullet_speed"]
                     Bullet(
                         player.pos.x, player.pos.y,
@@ -490,16 +565,40 @@ class ServerGame:
                 return
 
     # ------------------------------------------------------------------
+    def _track_projectiles(self, dt: float):
+        """Chaque tick : apparitions / disparitions de balles et grenades."""
+        self._proj_clock += dt
+        live = self._proj_live
+        for group, spawn in ((self.bullet_group, bullet_spawn),
+                             (self.grenade_group, grenade_spawn)):
+            for sprite in group:
+                if sprite not in live:
+                    self._proj_next_id += 1
+                    live[sprite] = self._proj_next_id
+                    self._proj_events.append(
+                        (self._proj_clock, spawn(sprite, self._proj_next_id, self._tick)))
+        for sprite in [sp for sp in live if not sp.alive()]:
+            self._proj_events.append(
+                (self._proj_clock, projectile_despawn(live.pop(sprite), self._tick, sprite.pos)))
+
     def _maybe_broadcast(self, dt: float):
+        self._track_projectiles(dt)
         self._broadcast_timer += dt
         if self._broadcast_timer < self._broadcast_interval:
             return
         self._broadcast_timer = 0.0
 
+        # Événements de projectiles d'abord : le snapshot qui suit n'en contient plus
+        if self._proj_events:
+            events = []
+            for t, ev in self._proj_events:
+                ev[3] = round(self._proj_clock - t, 3)   # âge à l'envoi
+                events.append(ev)
+            self._proj_events = []
+            self.server.broadcast(encode(make_projectiles(self._tick, events)))
+
         players_data    = [serialize_player(p)    for p  in self.players.values()]
         enemies_data    = [serialize_enemy(e)     for e  in self.enemy_group]
-        bullets_data    = [serialize_bullet(b)    for b  in self.bullet_group]
-        grenades_data   = [serialize_grenade(g)   for g  in self.grenade_group]
         pickups_data    = [serialize_pickup(pk)   for pk in self.pickup_group]
         explosions_data = [serialize_explosion(ex) for ex in self.explosion_group]
         wave_info = {
@@ -512,7 +611,6 @@ class ServerGame:
         snapshot = make_game_state(
             self._tick,
             players_data, enemies_data,
-            bullets_data, grenades_data,
             pickups_data, wave_info,
             upgrade_levels=dict(self.upgrade_machine.upgrade_levels),
             explosions_data=explosions_data,
@@ -520,6 +618,17 @@ class ServerGame:
         self.server.broadcast(encode(snapshot))
 
     # ------------------------------------------------------------------
+    def _debug_lines(self) -> list[str]:
+        """Lignes de l'overlay de debug (F3)."""
+        batch = self._batch
+        return [
+            f"FPS {self.clock.get_fps():.0f}   tick {self._tick}",
+            f"Sprites : {batch.drawn} dessines / {batch.culled} hors vue",
+            f"Prechauffage : {'fini' if self._warmup.done else 'en cours'}  "
+            f"{self._warmup.work_ms:.0f} ms / {self._warmup.frames} frames",
+            cache_summary(),
+        ]
+
     def _draw(self):
         host = self.players.get(self.host_player_id)
 
@@ -565,33 +674,52 @@ class ServerGame:
         self.screen.fill((80, 72, 55))
         self.tilemap.draw(self.screen, self.camera.offset)
 
+        # Monde : entites hors vue ecartees, le reste rendu couche par couche
+        batch = self._batch
+        batch.begin(self.camera)
+
         # Ramassages
-        font_small = pygame.font.SysFont("Arial", 12)
+        font_small = get_font(12)
         for pickup in self.pickup_group:
-            pickup.draw(self.screen, self.camera, font_small)
+            if batch.visible(pickup.pos.x, pickup.pos.y, 24):
+                batch.add_draw(LAYER_PICKUPS, pickup.draw, self.camera, font_small)
 
         # Machine d'amélioration
-        self.upgrade_machine.draw(self.screen, self.camera, host)
+        batch.add_draw(LAYER_PICKUPS, self.upgrade_machine.draw, self.camera, host)
 
         # Tous les joueurs
         for player in self.players.values():
-            player.draw(self.screen, self.camera)
+            if batch.visible(player.pos.x, player.pos.y, 32):
+                batch.add_draw(LAYER_ENTITIES, player.draw, self.camera)
 
-        # Ennemis
+        # Ennemis : sprite groupe + barre de vie / etat IA par-dessus
         for enemy in self.enemy_group:
-            enemy.draw(self.screen, self.camera)
+            if batch.visible(enemy.pos.x, enemy.pos.y, 32):
+                batch.add_centered(LAYER_ENTITIES, enemy_sprite(
+                    enemy.enemy_type, enemy.color, enemy.facing_angle),
+                    enemy.pos.x, enemy.pos.y)
+                batch.add_draw(LAYER_ENTITIES, draw_enemy_overlay,
+                               *batch.to_screen(enemy.pos.x, enemy.pos.y),
+                               enemy.hp, enemy.max_hp, enemy.ai.state)
 
         # Grenades
         for grenade in self.grenade_group:
-            grenade.draw(self.screen, self.camera)
+            if batch.visible(grenade.pos.x, grenade.pos.y):
+                batch.add_centered(LAYER_ENTITIES, grenade.image,
+                                   grenade.pos.x, grenade.pos.y)
 
         # Explosions
         for expl in self.explosion_group:
-            expl.draw(self.screen, self.camera)
+            if batch.visible(expl.pos.x, expl.pos.y, expl.blast_radius):
+                batch.add_centered(LAYER_FX, expl.image, expl.pos.x, expl.pos.y)
 
         # Balles
         for bullet in self.bullet_group:
-            bullet.draw(self.screen, self.camera)
+            if batch.visible(bullet.pos.x, bullet.pos.y):
+                batch.add_centered(LAYER_BULLETS, bullet.image,
+                                   bullet.pos.x, bullet.pos.y)
+
+        batch.flush(self.screen)
 
         # HUD du host
         if host:
@@ -611,9 +739,9 @@ class ServerGame:
         self.upgrade_machine.draw_result_message(self.screen, SCREEN_W, SCREEN_H)
 
         # Indicateur de connexion (barre en bas)
-        font_net = pygame.font.SysFont("Arial", 13)
+        font_net = get_font(13)
         nb_clients = len(self.server.clients)
-        net_txt = font_net.render(
+        net_txt = render_text(font_net,
             f"HOST  {self._local_ip}:{NET_PORT}  |  {nb_clients} client(s)",
             True, (180, 220, 180))
         self.screen.blit(net_txt, (10, SCREEN_H - 20))
@@ -622,8 +750,8 @@ class ServerGame:
         if self._ip_splash_timer > 0:
             alpha = min(255, int(self._ip_splash_timer / 8.0 * 255 * 3))
             alpha = min(255, alpha)
-            font_ip_big  = pygame.font.SysFont("Arial", 28, bold=True)
-            font_ip_sub  = pygame.font.SysFont("Arial", 18)
+            font_ip_big  = get_font(28, bold=True)
+            font_ip_sub  = get_font(18)
             splash_w, splash_h = 500, 90
             splash_x = SCREEN_W // 2 - splash_w // 2
             splash_y = SCREEN_H - 130
@@ -632,17 +760,22 @@ class ServerGame:
             self.screen.blit(bg, (splash_x, splash_y))
             pygame.draw.rect(self.screen, (80, 200, 80),
                              (splash_x, splash_y, splash_w, splash_h), 2, border_radius=6)
-            t1 = font_ip_big.render(
+            t1 = render_text(font_ip_big,
                 f"Donnez cette IP aux clients : {self._local_ip}", True, (120, 255, 120))
-            t2 = font_ip_sub.render(
+            t2 = render_text(font_ip_sub,
                 f"port {NET_PORT}  —  python main_client.py {self._local_ip}  [Nom]",
                 True, (180, 220, 180))
+            t1, t2 = t1.copy(), t2.copy()   # surfaces du cache partage
             t1.set_alpha(alpha); t2.set_alpha(alpha)
             self.screen.blit(t1, (splash_x + splash_w // 2 - t1.get_width() // 2,
                                   splash_y + 12))
             self.screen.blit(t2, (splash_x + splash_w // 2 - t2.get_width() // 2,
                                   splash_y + 52))
 
+        # Overlay de debug (F3)
+        if self.debug.visible:
+            self.debug.draw(self.screen, self._debug_lines())
+
         # Menu pause en overlay
         if self.state == STATE_PAUSED:
             pause_result = self.menus.draw_pause(self.screen)
@@ -0,0 +1,105 @@
+"""replay_match.py — Rejeu headless d'une partie enregistrée, à vitesse CPU maximale.
+
+Enregistrement côté serveur :
+    python server_headless.py --record                       # recordings/match_<date>.jsonl
+    python server_headless.py --record m.jsonl --hash-log live.txt
+
+Rejeu (aucun réseau, aucun affichage, aucune attente dans clock.tick) :
+    python replay_match.py recordings/match_20250101-120000.jsonl
+    python replay_match.py m.jsonl --profile replay.pstats    # sous cProfile
+    python replay_match.py m.jsonl --hash-log replay.txt      # diff avec live.txt
+
+Le rejeu réutilise DedicatedServer._step() tel quel : les messages enregistrés
+sont réinjectés via OfflineServer et les graines de monde enregistrées
+remplacent le tirage aléatoire (_next_match_seed).
+"""
+import argparse
+import cProfile
+import os
+import sys
+import time
+from collections import deque
+
+# Doit être défini AVANT pygame.init()
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from server_headless import DedicatedServer
+from game.network.server import OfflineServer
+from game.network.match_log import read_match_log
+
+
+class ReplayServer(DedicatedServer):
+    """DedicatedServer alimenté par un enregistrement au lieu du réseau."""
+
+    def __init__(self, header: dict, hash_log: str | None = None):
+        self._seeds: deque[int] = deque([header["seed"]])
+        super().__init__(status_port=None, fixed_dt=header.get("fixed_dt"),
+                         hash_log=hash_log, net_server=OfflineServer())
+        self._tick = header["t"]
+
+    def _next_match_seed(self) -> int:
+        if not self._seeds:
+            raise RuntimeError("enregistrement incohérent : graine de monde manquante")
+        return self._seeds.popleft()
+
+
+def replay(path: str, hash_log: str | None = None) -> dict:
+    header, ticks = read_match_log(path)
+    srv = ReplayServer(header, hash_log)
+    sim_time = 0.0
+    n_ticks = 0
+
+    t0 = time.perf_counter()
+    for tick, dt, msgs, worlds in ticks:
+        srv._seeds.extend(worlds)
+        srv.server.push(msgs)
+        srv._step(dt)
+        if srv._tick != tick:
+            raise RuntimeError(f"désynchronisation : tick {srv._tick} au lieu de {tick}")
+        sim_time += dt
+        n_ticks += 1
+    wall = time.perf_counter() - t0
+
+    if srv._hash_log:
+        srv._hash_log.close()
+    return {
+        "ticks":     n_ticks,
+        "sim_s":     sim_time,
+        "wall_s":    wall,
+        "wave":      srv.wave_manager.wave_number,
+        "bytes_out": srv.server.bytes_broadcast,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Rejeu headless d'une partie enregistrée")
+    parser.add_argument("recording", help="fichier .jsonl produit par --record")
+    parser.add_argument("--profile", default=None, help="écrire un profil cProfile (.pstats)")
+    parser.add_argument("--hash-log", default=None,
+                        help="écrire « tick empreinte » à chaque tick de jeu")
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))   # surface factice (SDL dummy driver)
+
+    profile = cProfile.Profile() if args.profile else None
+    if profile:
+        profile.enable()
+    res = replay(args.recording, args.hash_log)
+    if profile:
+        profile.disable()
+        profile.dump_stats(args.profile)
+        print(f"[rejeu] Profil → {args.profile}")
+
+    speed = res["sim_s"] / res["wall_s"] if res["wall_s"] > 0 else float("inf")
+    print(f"[rejeu] {res['ticks']} ticks, {res['sim_s']:.1f} s simulées en "
+          f"{res['wall_s']:.2f} s (x{speed:.1f}), vague {res['wave']}, "
+          f"{res['bytes_out'] / 1e6:.1f} Mo de snapshots")
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,9 @@
 
 Lancement :
     python server_headless.py
+    python server_headless.py --port 8766 --status-port 8081 --max-players 8
+    python server_headless.py --seed 42 --fixed-dt --hash-log hashes.txt   # déterministe
+    python server_headless.py --record            # enregistre dans recordings/ (replay_match.py)
 
 Fonctionne sur un VPS Linux sans carte graphique ni écran (SDL dummy driver).
 Les clients se connectent en WebSocket normalement — aucun changement côté client.
@@ -10,9 +13,16 @@ Comportement :
   - Le 1er joueur connecté est l'hôte virtuel (bouton "Lancer" dans son lobby).
   - Les autres joueurs voient le lobby et attendent.
   - Après une partie, le serveur réinitialise automatiquement le lobby.
+
+Profilage à chaud (sans redémarrage ni déconnexion) :
+    kill -USR1 <pid>                     → profil de PROFILE_DEFAULT_SECONDS
+    POST /profile?seconds=N (status_api) → profil de N secondes simulées
+Résultats .pstats / .collapsed dans profiles/live/.
 """
+import argparse
 import os
 import signal
+import time
 
 # Doit être défini AVANT pygame.init()
 os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
@@ -20,9 +30,14 @@ os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
 
 import pygame
 import status_api
+from server_profiling import TickWatchdog, LiveProfiler
 from main_server import ServerGame
-from settings import STATE_LOBBY, STATE_PLAYING, STATE_GAMEOVER, NET_PORT
+from settings import (
+    STATE_LOBBY, STATE_PLAYING, STATE_GAMEOVER, NET_PORT, NET_MAX_PLAYERS,
+    PROFILE_DEFAULT_SECONDS, FPS, RECORD_DIR,
+)
 from game.network.messages import encode, make_lobby_state, MSG_START_GAME
+from game.systems.determinism import state_hash
 from game.world.map_data import PLAYER_START
 
 _GAMEOVER_RESET_DELAY = 10.0   # secondes avant réinitialisation du lobby
@@ -38,19 +53,44 @@ class DedicatedServer(ServerGame):
     - Démarrage manuel via bouton "Lancer" de l'hôte virtuel.
     - Réinitialisation automatique du lobby après game over.
     - Arrêt propre sur SIGTERM / Ctrl-C.
+    - Watchdog des ticks lents (server_profiling.TickWatchdog).
+    - Profil à la demande via SIGUSR1 ou POST /profile (server_profiling.LiveProfiler).
+    - Mode déterministe : graine fixe (seed) + pas de temps fixe (fixed_dt),
+      empreinte d'état par tick optionnelle (hash_log).
+    - Enregistrement des inputs rejouable (record, voir replay_match.py).
     """
 
-    def __init__(self):
-        super().__init__(host_name="__dedicated__")
+    def __init__(self, port: int = NET_PORT, status_port: int | None = 8080,
+                 max_players: int = NET_MAX_PLAYERS, seed: int | None = None,
+                 fixed_dt: float | None = None, hash_log: str | None = None,
+                 record: str | None = None, net_server=None):
+        super().__init__(host_name="__dedicated__", port=port, seed=seed,
+                         net_server=net_server)
+        self.port = port
+        self.fixed_dt = fixed_dt
+        self._hash_log = open(hash_log, "w", encoding="utf-8") if hash_log else None
 
         # Retirer le slot hôte local créé par ServerGame.__init__
         self.players.pop(self.host_player_id, None)
         self.host_player_id = 0          # sentinelle : pas d'hôte local
+        self.server.max_clients = max_players   # pas de slot réservé à l'hôte
 
         self._gameover_timer: float | None = None
 
-        # Démarrer l'API statut HTTP (port 8080) dans un thread daemon
-        status_api.start(port=8080)
+        # Surveillance des ticks lents (captures de piles dans profiles/watchdog)
+        self._watchdog = TickWatchdog()
+        self._profiler = LiveProfiler()
+        status_api.set_profile_handler(self._profiler.request)
+        status_api.set_section("watchdog", self._watchdog.summary)
+        status_api.set_section("profiler", self._profiler.summary)
+
+        # Démarrer l'API statut HTTP (port 8080 par défaut) dans un thread daemon
+        # status_port=None : pas d'API (rejeu, simulation hors ligne)
+        if status_port is not None:
+            status_api.start(port=status_port)
+
+        if record:
+            self.start_recording(record, fixed_dt)
 
     # ------------------------------------------------------------------ lobby
 
@@ -102,7 +142,8 @@ class DedicatedServer(ServerGame):
         self.state = STATE_PLAYING
         self.server.broadcast(encode({"type": MSG_START_GAME}))
         self.wave_manager.players = list(self.players.values())
-        print(f"[dédié] Partie lancée par {self.players[pid].player_name}.")
+        print(f"[dédié] Partie lancée par {self.players[pid].player_name} "
+              f"(graine {self.match_seed}).")
 
     # ------------------------------------------------------------------ rendu
 
@@ -122,20 +163,21 @@ class DedicatedServer(ServerGame):
 
         signal.signal(signal.SIGTERM, _shutdown)
         signal.signal(signal.SIGINT,  _shutdown)
+        if hasattr(signal, "SIGUSR1"):   # absent sous Windows
+            signal.signal(signal.SIGUSR1,
+                          lambda sig, frame: self._profiler.request_from_signal(
+                              PROFILE_DEFAULT_SECONDS))
 
-        print(f"[dédié] En attente de joueurs sur le port {NET_PORT} …")
+        print(f"[dédié] En attente de joueurs sur le port {self.port} …")
+        self._watchdog.start()
 
         while not self._quit_requested:
-            dt = self.clock.tick(60) / 1000.0
-            dt = min(dt, 0.05)
-            self._tick += 1
+            dt = self.clock.tick(FPS) / 1000.0
+            dt = self.fixed_dt if self.fixed_dt else min(dt, 0.05)
+            self._watchdog.tick_begin()
+            self._profiler.tick_begin()
 
-            pygame.event.get()   # vider la queue (pas de QUIT sur SDL dummy)
-
-            self._process_network_messages()
-            self._update(dt)
-            self._maybe_broadcast(dt)
-            self._draw()
+            self._step(dt)
 
             # Mettre à jour l'API statut HTTP
             status_api.update(
@@ -145,25 +187,74 @@ class DedicatedServer(ServerGame):
                 enemies_remaining=getattr(self.wave_manager, "enemies_remaining", 0),
             )
 
-            # Réinitialisation automatique après game over
-            if self.state == STATE_GAMEOVER:
-                if self._gameover_timer is None:
-                    self._gameover_timer = _GAMEOVER_RESET_DELAY
-                    print(f"[dédié] Partie terminée — réinitialisation dans {int(_GAMEOVER_RESET_DELAY)}s …")
-                else:
-                    self._gameover_timer -= dt
-                    if self._gameover_timer <= 0:
-                        self._reset_game()
+            self._profiler.tick_end(dt)
+            self._watchdog.tick_end()
 
         print("[dédié] Arrêt du serveur …")
+        self._watchdog.stop()
+        self.stop_recording()
         self.server.stop()
+        if self._hash_log:
+            self._hash_log.close()
         pygame.quit()
 
+    def _step(self, dt: float) -> None:
+        """Un tick de simulation complet (réseau, monde, broadcast, cycle de vie)."""
+        self._tick += 1
+        if self.recorder:
+            self.recorder.begin_tick(self._tick, dt)
+
+        pygame.event.get()   # vider la queue (pas de QUIT sur SDL dummy)
+
+        self._process_network_messages()
+        self._update(dt)
+        if self._hash_log and self.state == STATE_PLAYING:
+            self._hash_log.write(f"{self._tick} {state_hash(self)}\n")
+        self._maybe_broadcast(dt)
+        self._draw()
+
+        # Réinitialisation automatique après game over
+        if self.state == STATE_GAMEOVER:
+            if self._gameover_timer is None:
+                self._gameover_timer = _GAMEOVER_RESET_DELAY
+                print(f"[dédié] Partie terminée — réinitialisation dans {int(_GAMEOVER_RESET_DELAY)}s …")
+            else:
+                self._gameover_timer -= dt
+                if self._gameover_timer <= 0:
+                    self._reset_game()
+
 
 # --------------------------------------------------------------------------
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serveur dédié WW2 Survival")
+    parser.add_argument("--port", type=int, default=NET_PORT,
+                        help=f"port WebSocket (défaut: {NET_PORT})")
+    parser.add_argument("--status-port", type=int, default=8080,
+                        help="port de l'API HTTP /status (défaut: 8080)")
+    parser.add_argument("--max-players", type=int, default=NET_MAX_PLAYERS,
+                        help=f"joueurs max dans la salle (défaut: {NET_MAX_PLAYERS})")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="graine fixe de chaque partie (défaut: aléatoire)")
+    parser.add_argument("--fixed-dt", action="store_true",
+                        help=f"pas de temps fixe 1/{FPS} s au lieu de l'horloge murale")
+    parser.add_argument("--hash-log", default=None,
+                        help="écrire « tick empreinte » à chaque tick de jeu dans ce fichier")
+    parser.add_argument("--record", nargs="?", const="", default=None,
+                        help=f"enregistrer les inputs (fichier, défaut: {RECORD_DIR}/match_<date>.jsonl)")
+    args, unknown = parser.parse_known_args()
+    if unknown:
+        print(f"[dédié] Arguments ignorés : {' '.join(unknown)}")
+
+    record = args.record
+    if record == "":
+        os.makedirs(RECORD_DIR, exist_ok=True)
+        record = os.path.join(RECORD_DIR, f"match_{time.strftime('%Y%m%d-%H%M%S')}.jsonl")
+
     print("=== WW2 Survival — Serveur dédié ===")
     pygame.init()
     pygame.display.set_mode((1, 1))   # surface factice (SDL dummy driver)
-    DedicatedServer().run(owns_pygame=True)
+    DedicatedServer(port=args.port, status_port=args.status_port,
+                    max_players=args.max_players, seed=args.seed,
+                    fixed_dt=(1.0 / FPS) if args.fixed_dt else None,
+                    hash_log=args.hash_log, record=record).run(owns_pygame=True)
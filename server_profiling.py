@@ -0,0 +1,369 @@
+"""server_profiling.py — Outils de profilage du serveur dédié.
+
+Utilisé par server_headless.py.
+
+TickWatchdog : thread de surveillance de la boucle de simulation. Quand un tick
+dépasse le budget (WATCHDOG_TICK_MS), il échantillonne la pile du thread de
+simulation via sys._current_frames() tant que le tick lent est en cours, puis
+écrit les piles au format « collapsed » (une ligne « f1;f2;f3 N » par pile,
+lisible par flamegraph.pl ou speedscope) dans un dossier tournant.
+
+LiveProfiler : profilage à la demande (POST /profile ou SIGUSR1). Active cProfile
+sur le thread de simulation et un échantillonneur statistique pendant exactement
+N secondes de simulation (somme des dt des ticks profilés), puis écrit un
+fichier .pstats et un fichier .collapsed — sans redémarrer la boucle.
+
+Exemple de capture :
+    main (server_headless.py:160);run (server_headless.py:114);_update (main_server.py:291) 12
+"""
+import cProfile
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+
+from settings import (
+    WATCHDOG_TICK_MS, WATCHDOG_SAMPLE_MS, WATCHDOG_DIR,
+    WATCHDOG_MAX_FILES, WATCHDOG_MIN_INTERVAL, WATCHDOG_WINDOW_TICKS,
+    PROFILE_MAX_SECONDS, PROFILE_SAMPLE_MS, PROFILE_DIR,
+)
+
+
+def collapse_stack(frame) -> str:
+    """Pile d'appels au format collapsed : 'racine;...;feuille'."""
+    parts = []
+    while frame is not None:
+        code = frame.f_code
+        parts.append(f"{code.co_name} "
+                     f"({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+        frame = frame.f_back
+    parts.reverse()
+    return ";".join(parts)
+
+
+def write_collapsed(path: str, samples: Counter) -> None:
+    """Écrit un Counter {pile: nb_échantillons} au format collapsed."""
+    with open(path, "w", encoding="utf-8") as f:
+        for stack, count in samples.most_common():
+            f.write(f"{stack} {count}\n")
+
+
+def rotate_dir(directory: str, max_files: int) -> None:
+    """Supprime les fichiers les plus anciens au-delà de max_files."""
+    try:
+        entries = [os.path.join(directory, n) for n in os.listdir(directory)]
+    except OSError:
+        return
+    entries = [e for e in entries if os.path.isfile(e)]
+    entries.sort(key=os.path.getmtime)
+    for old in entries[:max(0, len(entries) - max_files)]:
+        try:
+            os.remove(old)
+        except OSError:
+            pass
+
+
+class TickWatchdog:
+    """
+    Surveille la durée des ticks du thread de simulation.
+
+    Le thread de simulation encadre chaque tick par tick_begin() / tick_end()
+    (deux affectations, coût négligeable). Le thread daemon « tick-watchdog »
+    scrute le tick en cours et, dès qu'il atteint la moitié du seuil, échantillonne
+    la pile du thread de simulation toutes les WATCHDOG_SAMPLE_MS ms jusqu'à la fin
+    du tick ; les échantillons sont jetés si le tick finit sous le seuil. En
+    pratique la cadence réelle est bornée par sys.getswitchinterval() (5 ms par
+    défaut) tant que le thread de simulation garde le GIL.
+
+    L'écriture sur disque se fait dans le thread watchdog, jamais dans la boucle
+    de jeu, et au plus une fois toutes les WATCHDOG_MIN_INTERVAL secondes.
+    """
+
+    def __init__(self,
+                 threshold_ms: float = WATCHDOG_TICK_MS,
+                 sample_ms: float = WATCHDOG_SAMPLE_MS,
+                 out_dir: str = WATCHDOG_DIR,
+                 max_files: int = WATCHDOG_MAX_FILES,
+                 min_interval: float = WATCHDOG_MIN_INTERVAL):
+        self.threshold = threshold_ms / 1000.0
+        self.sample_interval = sample_ms / 1000.0
+        self.out_dir = out_dir
+        self.max_files = max_files
+        self.min_interval = min_interval
+
+        # Écrits par le thread de simulation, lus par le watchdog
+        self._sim_thread_id: int | None = None
+        self._tick_seq = 0
+        self._tick_start: float | None = None
+        self._recent: deque = deque(maxlen=16)          # (seq, durée ms)
+        self._window: deque = deque(maxlen=WATCHDOG_WINDOW_TICKS)   # durées ms
+
+        # Compteurs exposés dans /status
+        self.overruns        = 0
+        self.captures        = 0
+        self.captures_skipped = 0
+        self.last_overrun_ms = 0.0
+        self.worst_tick_ms   = 0.0
+        self.last_capture    = ""
+
+        # Échantillons du tick lent en cours (thread watchdog uniquement)
+        self._samples: Counter = Counter()
+        self._samples_seq = 0
+        self._last_write = 0.0
+
+        self._running = False
+        self._thread: threading.Thread | None = None
+
+    # ------------------------------------------------------------------ boucle de jeu
+    def start(self) -> None:
+        """Démarrer le watchdog. À appeler depuis le thread de simulation."""
+        self._sim_thread_id = threading.get_ident()
+        self._running = True
+        self._thread = threading.Thread(target=self._watch, name="tick-watchdog",
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._running = False
+
+    def tick_begin(self) -> None:
+        self._tick_seq += 1
+        self._tick_start = time.perf_counter()
+
+    def tick_end(self) -> None:
+        start = self._tick_start
+        if start is None:
+            return
+        ms = (time.perf_counter() - start) * 1000.0
+        # Durée publiée avant _tick_start : le watchdog la lit dès qu'il voit None
+        self._recent.append((self._tick_seq, ms))
+        self._tick_start = None
+        self._window.append(ms)
+        if ms > self.worst_tick_ms:
+            self.worst_tick_ms = ms
+        if ms > self.threshold * 1000.0:
+            self.overruns += 1
+            self.last_overrun_ms = ms
+
+    def summary(self) -> dict:
+        """Compteurs destinés à status_api, calculés dans le thread HTTP à
+        chaque GET /status (tri de la fenêtre : hors de la boucle de jeu)."""
+        window = sorted(list(self._window))   # list() : copie atomique sous le GIL
+        avg = sum(window) / len(window) if window else 0.0
+        p99 = window[min(len(window) - 1, int(len(window) * 0.99))] if window else 0.0
+        return {
+            "threshold_ms":     round(self.threshold * 1000.0, 1),
+            "window_ticks":     len(window),
+            "avg_tick_ms":      round(avg, 2),
+            "p99_tick_ms":      round(p99, 2),
+            "overruns":         self.overruns,
+            "captures":         self.captures,
+            "captures_skipped": self.captures_skipped,
+            "last_overrun_ms":  round(self.last_overrun_ms, 1),
+            "worst_tick_ms":    round(self.worst_tick_ms, 1),
+            "last_capture":     self.last_capture,
+        }
+
+    # ------------------------------------------------------------------ thread watchdog
+    def _watch(self) -> None:
+        while self._running:
+            time.sleep(self.sample_interval)
+            start = self._tick_start
+            seq   = self._tick_seq
+
+            # Le tick échantillonné est terminé → écrire la capture
+            if self._samples and (start is None or seq != self._samples_seq):
+                self._flush()
+
+            if start is None or time.perf_counter() - start < self.threshold * 0.5:
+                continue
+
+            frame = sys._current_frames().get(self._sim_thread_id)
+            if frame is None:
+                continue
+            self._samples_seq = seq
+            self._samples[collapse_stack(frame)] += 1
+            del frame
+
+    def _flush(self) -> None:
+        samples, self._samples = self._samples, Counter()
+        seq = self._samples_seq
+        ms = next((d for s, d in list(self._recent) if s == seq), None)
+        if ms is None:
+            ms = 0.0   # durée inconnue (hors de l'historique récent)
+        elif ms <= self.threshold * 1000.0:
+            return     # tick finalement sous le seuil : pré-échantillons jetés
+
+        now = time.monotonic()
+        if self._last_write and now - self._last_write < self.min_interval:
+            self.captures_skipped += 1
+            return
+        self._last_write = now
+
+        try:
+            os.makedirs(self.out_dir, exist_ok=True)
+            name = (f"overrun_{time.strftime('%Y%m%d-%H%M%S')}"
+                    f"_tick{seq}_{int(ms)}ms.collapsed")
+            path = os.path.join(self.out_dir, name)
+            write_collapsed(path, samples)
+            rotate_dir(self.out_dir, self.max_files)
+        except OSError as e:
+            print(f"[watchdog] Écriture impossible : {e}")
+            return
+        self.captures += 1
+        self.last_capture = name
+        print(f"[watchdog] Tick {seq} lent ({ms:.1f} ms) — capture {path}")
+
+
+class LiveProfiler:
+    """
+    Profil cProfile + statistique déclenché à chaud.
+
+    request() peut être appelé depuis n'importe quel thread (handler HTTP) :
+    il ne fait que poser une demande. Le thread de simulation la prend en
+    compte au tick suivant via tick_begin() / tick_end(dt). Un gestionnaire de
+    signal passe par request_from_signal() : le signal interrompt le thread de
+    simulation lui-même, éventuellement dans _start() qui tient déjà _lock
+    (non réentrant) ou au milieu d'un print ; il ne fait donc que poser un
+    attribut, relu par tick_begin().
+    cProfile n'est actif qu'à l'intérieur des ticks (pas pendant clock.tick) et
+    l'échantillonneur ne relève la pile que pendant un tick. L'écriture des
+    fichiers se fait dans un thread séparé.
+    """
+
+    def __init__(self, sample_ms: float = PROFILE_SAMPLE_MS, out_dir: str = PROFILE_DIR):
+        self.sample_interval = sample_ms / 1000.0
+        self.out_dir = out_dir
+
+        self._lock = threading.Lock()
+        self._pending: float | None = None      # durée demandée, pas encore démarrée
+        self._signaled: float | None = None     # demande posée par un signal (sans verrou)
+        self._seconds = 0.0                      # durée visée de la session en cours
+        self._elapsed = 0.0                      # secondes simulées déjà profilées
+        self._ticks   = 0
+        self._profile: cProfile.Profile | None = None
+        self._samples: Counter = Counter()
+        self._in_tick = False
+        self._sim_thread_id: int | None = None
+        self._sampler: threading.Thread | None = None
+        self._stop: threading.Event | None = None   # fin de la session (propre à chacune)
+
+        self.last_result: dict = {}
+
+    # ------------------------------------------------------------------ API
+    @property
+    def active(self) -> bool:
+        return self._profile is not None
+
+    def request(self, seconds: float) -> dict:
+        """Programmer un profil de `seconds` secondes simulées. Thread-safe."""
+        seconds = max(0.1, min(float(seconds), PROFILE_MAX_SECONDS))
+        with self._lock:
+            if self._pending is not None or self.active:
+                return {"status": "busy", **self.summary()}
+            self._pending = seconds
+        print(f"[profil] Profil de {seconds:.1f}s simulées programmé.")
+        return {"status": "scheduled", "seconds": seconds}
+
+    def request_from_signal(self, seconds: float) -> None:
+        """Depuis un gestionnaire de signal : ni verrou, ni print."""
+        self._signaled = seconds
+
+    def summary(self) -> dict:
+        """État courant destiné à status_api (lecture seule)."""
+        if self.active:
+            state = "running"
+        elif self._pending is not None:
+            state = "pending"
+        else:
+            state = "idle"
+        return {
+            "state":       state,
+            "seconds":     round(self._seconds, 2),
+            "elapsed":     round(self._elapsed, 2),
+            "last_result": self.last_result,
+        }
+
+    # ------------------------------------------------------------------ boucle de jeu
+    def tick_begin(self) -> None:
+        if self._signaled is not None:
+            seconds, self._signaled = self._signaled, None
+            if self.request(seconds)["status"] == "busy":
+                print("[profil] Signal ignoré : un profil est déjà en cours.")
+        if self._profile is None:
+            if self._pending is None:
+                return
+            self._start()
+        self._in_tick = True
+        self._profile.enable()
+
+    def tick_end(self, dt: float) -> None:
+        profile = self._profile
+        if profile is None:
+            return
+        profile.disable()
+        self._in_tick = False
+        self._elapsed += dt
+        self._ticks   += 1
+        if self._elapsed >= self._seconds - 1e-9:
+            self._finish()
+
+    def _start(self) -> None:
+        with self._lock:
+            self._seconds, self._pending = self._pending, None
+        self._elapsed = 0.0
+        self._ticks   = 0
+        self._samples = Counter()
+        self._sim_thread_id = threading.get_ident()
+        self._profile = cProfile.Profile()
+        # Événement et Counter propres à la session : un échantillonneur en
+        # retard ne voit jamais la session suivante
+        self._stop = threading.Event()
+        self._sampler = threading.Thread(target=self._sample,
+                                         args=(self._stop, self._samples),
+                                         name="live-profiler", daemon=True)
+        self._sampler.start()
+        print(f"[profil] Démarrage ({self._seconds:.1f}s simulées).")
+
+    def _finish(self) -> None:
+        profile, self._profile = self._profile, None
+        sampler, self._sampler = self._sampler, None
+        self._stop.set()                                # arrête l'échantillonneur
+        info = {"seconds": round(self._elapsed, 3), "ticks": self._ticks}
+        threading.Thread(target=self._dump,
+                         args=(profile, sampler, self._samples, info),
+                         name="live-profiler-dump", daemon=True).start()
+
+    # ------------------------------------------------------------------ threads auxiliaires
+    def _sample(self, stop: threading.Event, samples: Counter) -> None:
+        while not stop.wait(self.sample_interval):
+            if not self._in_tick:
+                continue
+            frame = sys._current_frames().get(self._sim_thread_id)
+            if frame is None:
+                continue
+            samples[collapse_stack(frame)] += 1
+            del frame
+
+    def _dump(self, profile: cProfile.Profile, sampler: threading.Thread | None,
+              samples: Counter, info: dict) -> None:
+        if sampler is not None:
+            sampler.join()
+        base = os.path.join(
+            self.out_dir,
+            f"live_{time.strftime('%Y%m%d-%H%M%S')}_{info['seconds']:.0f}s")
+        try:
+            os.makedirs(self.out_dir, exist_ok=True)
+            profile.dump_stats(base + ".pstats")
+            write_collapsed(base + ".collapsed", samples)
+        except OSError as e:
+            print(f"[profil] Écriture impossible : {e}")
+            self.last_result = {"error": str(e)}
+            return
+        self.last_result = {**info,
+                            "pstats":    base + ".pstats",
+                            "collapsed": base + ".collapsed",
+                            "samples":   sum(samples.values())}
+        print(f"[profil] Terminé ({info['seconds']:.2f}s simulées, "
+              f"{info['ticks']} ticks) — {base}.pstats / .collapsed")
@@ -12,6 +12,7 @@ MAP_COLS = 40
 MAP_ROWS = 30
 MAP_W = MAP_COLS * TILE_SIZE   # 1920
 MAP_H = MAP_ROWS * TILE_SIZE   # 1440
+TILEMAP_CHUNK = 8              # tuiles par cote d'un chunk de fond pre-rendu
 
 # Types de tuiles
 TILE_GROUND  = 0
@@ -85,6 +86,20 @@ LOS_STEP            = 0.4  # fraction de TILE_SIZE pour le raycasting
 SUPPRESSION_DIST    = 80   # px - balle proche = suppression
 PATH_RECALC_TIME    = 0.6  # secondes entre recalculs A*
 MAX_ASTAR_NODES     = 250
+PATH_MODE           = "astar"  # "astar" (A* + lissage) ou "theta" (lazy Theta*, angles libres)
+PATH_LOS_CACHE      = 32768  # paires de tuiles memorisees (lignes de vue, mode theta)
+PATH_WORKERS        = 0    # processus du service A* asynchrone (0 = dans le tick) ;
+                           # carte 40x30 : A* < 1 ms, le pool (IPC) coute plus qu'il ne rapporte
+PATH_ASYNC_TICKS    = 2    # ticks minimum entre une demande et sa livraison (pool)
+PATH_SOLVES_PER_TICK = 2   # A* calcules dans le tick au plus (workers=0), le reste attend
+COVER_SECTORS       = 16   # secteurs angulaires de l'index de couverture
+COVER_PROBE         = 72   # px - portee du rayon qui teste un secteur protege
+COVER_TOP_K         = 4    # candidats verifies par raycast exact
+SQUAD_RADIUS        = 160  # px - distance max au chef pour rejoindre une escouade
+SQUAD_MAX           = 6    # membres max par escouade
+SQUAD_THINK_TIME    = 0.25 # secondes entre deux reflexions d'escouade
+SQUAD_SPACING       = 40   # px - ecart entre rangs de la formation
+PERCEPTION_NUMPY_MIN = 12  # ennemis min. pour la passe de perception NumPy
 
 # --- Vagues ---
 WAVE_COOLDOWN    = 8.0
@@ -129,6 +144,28 @@ LAYER_BULLETS  = 3
 LAYER_FX       = 4
 LAYER_HUD      = 5
 
+# --- Rendu (caches, culling) ---
+SPRITE_ANGLE_BUCKETS   = 64         # orientations pre-calculees par sprite (5.6 deg)
+# Plafonds memoire des caches de surfaces (LRU, game/render/surface_cache.py)
+SPRITE_ATLAS_MAX_BYTES = 16 << 20   # sprites pivotes (atlas)
+SPRITE_BASE_MAX_BYTES  = 1 << 20    # sprites de base non pivotes (atlas)
+TEXT_CACHE_MAX_BYTES   = 4 << 20    # textes rendus
+EXPL_CACHE_MAX_BYTES   = 8 << 20    # images d'explosion (6 par rayon)
+CHUNK_CACHE_MAX_BYTES  = 16 << 20   # chunks de fond (carte entiere ~11 Mo + reduite ~3 Mo)
+ICON_CACHE_MAX_BYTES   = 1 << 20    # icones d'armes et pickups
+SCALED_CACHE_MAX_BYTES = 4 << 20    # sprites reduits (rendu en resolution reduite)
+CULL_MARGIN            = 64         # px autour de l'ecran encore dessines (sprites a cheval)
+WARMUP_FRAME_MS        = 3.0        # temps de prechauffage des assets par frame (lobby)
+
+# Gouverneur de qualite client (game/render/quality.py)
+QUALITY_WINDOW         = 60         # frames par fenetre de mesure
+QUALITY_DOWN_RATIO     = 0.9        # moyenne > 90 % du budget de frame : niveau suivant
+QUALITY_UP_RATIO       = 0.5        # moyenne < 50 % du budget ...
+QUALITY_UP_WINDOWS     = 3          # ... pendant 3 fenetres : niveau precedent
+QUALITY_UP_MAX_WINDOWS = 48         # attente max. apres des remontees ratees (doublee a chaque echec)
+QUALITY_MAX_EXPLOSIONS = 3          # explosions dessinees par frame (niveau >= 2)
+QUALITY_RENDER_SCALE   = 0.5        # resolution interne du monde (niveau 4)
+
 # --- Etats du jeu ---
 STATE_MENU     = "menu"
 STATE_PLAYING  = "playing"
@@ -141,6 +178,9 @@ NET_PORT           = 8765
 NET_MAX_PLAYERS    = 4
 NET_BROADCAST_RATE = 60      # snapshots/s envoyes aux clients (16ms entre chaque)
 NET_TIMEOUT        = 10.0    # secondes avant kick client silencieux
+NET_INPUT_RATE     = 30      # echantillons d'input/s envoyes par le client (independant du FPS)
+NET_KEEPALIVE      = 0.5     # secondes max sans input complet renvoye au serveur
+NET_AIM_EPSILON    = 0.5     # degres : variation de visee minimale pour renvoyer aim_angle
 
 # --- Revive (coop) ---
 REVIVE_TIME    = 3.0    # secondes pour relever (touche E maintenue)
@@ -181,6 +221,7 @@ KEYBINDS: dict = {
     "slot_2":     _pg.K_2,
     "slot_3":     _pg.K_3,
     "slot_4":     _pg.K_4,
+    "debug":      _pg.K_F3,   # overlay de debug (compteurs de rendu)
 }
 KEYBINDS_DEFAULT: dict = dict(KEYBINDS)  # copie pour reset
 
@@ -188,3 +229,21 @@ KEYBINDS_DEFAULT: dict = dict(KEYBINDS)  # copie pour reset
 STATE_SETTINGS     = "settings"
 STATE_NETWORK_MENU = "network_menu"
 STATE_LOBBY        = "lobby"
+
+# --- Profilage serveur dédié ---
+WATCHDOG_TICK_MS      = 25.0    # au-delà, un tick est considéré comme en dépassement
+WATCHDOG_SAMPLE_MS    = 1.0     # période d'échantillonnage de la pile pendant un tick lent
+WATCHDOG_DIR          = "profiles/watchdog"   # dossier tournant des captures
+WATCHDOG_MAX_FILES    = 50      # nombre max de captures conservées
+WATCHDOG_MIN_INTERVAL = 30.0    # secondes minimum entre deux captures écrites
+WATCHDOG_WINDOW_TICKS = 600     # fenêtre glissante des stats de tick (/status)
+
+# Profilage à la demande (POST /profile sur status_api ou SIGUSR1)
+PROFILE_DEFAULT_SECONDS = 10.0  # durée simulée profilée par défaut (SIGUSR1)
+PROFILE_MAX_SECONDS     = 120.0 # durée maximale acceptée par POST /profile
+PROFILE_SAMPLE_MS       = 1.0   # période de l'échantillonneur statistique
+PROFILE_DIR             = "profiles/live"
+PROFILE_TOKEN_ENV       = "WW2_PROFILE_TOKEN"   # jeton exigé par POST /profile (route désactivée si absent)
+
+# --- Enregistrement / rejeu de parties ---
+RECORD_DIR = "recordings"       # dossier par défaut de server_headless.py --record
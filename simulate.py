@@ -0,0 +1,201 @@
+"""simulate.py — Simulation accélérée headless (pas de temps fixe, sans attente).
+
+Lancement :
+    python simulate.py --players 2 --seed 7                     # jusqu'au game over
+    python simulate.py --players 4 --until-wave 15 --invulnerable --profile sim.pstats
+    python simulate.py --players 2 --seed 7 --record sim.jsonl  # rejouable (replay_match.py)
+
+Les joueurs sont des BotPlayer (game/systems/bot_player.py) injectés comme des
+clients réseau via OfflineServer : même chemin de code que le serveur dédié
+(DedicatedServer._step), sans réseau, sans affichage réel (SDL dummy) et sans
+clock.tick. Affiche les secondes simulées par seconde réelle.
+"""
+import argparse
+import cProfile
+import os
+import random
+import signal
+import sys
+import time
+
+# Doit être défini AVANT pygame.init()
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from server_headless import DedicatedServer
+from settings import FPS, STATE_PLAYING, STATE_GAMEOVER
+from game.network.server import OfflineServer
+from game.network.messages import MSG_PLAYER_JOINED
+from game.systems.bot_player import BotPlayer
+
+
+class SimServer(DedicatedServer):
+    """DedicatedServer hors ligne ; snapshots désactivés par défaut."""
+
+    def __init__(self, seed: int, dt: float, snapshots: bool = False,
+                 record: str | None = None, path_workers: int | None = None):
+        self._snapshots = snapshots
+        if path_workers is not None:
+            self.path_workers = path_workers
+        super().__init__(status_port=None, seed=seed, fixed_dt=dt,
+                         record=record, net_server=OfflineServer())
+
+    def _maybe_broadcast(self, dt: float):
+        if self._snapshots:
+            super()._maybe_broadcast(dt)
+
+
+def run_simulation(players: int = 2, seed: int = 1, until_wave: int = 0,
+                   max_sim_s: float = 3600.0, invulnerable: bool = False,
+                   dt: float = 1.0 / FPS, snapshots: bool = False,
+                   record: str | None = None, progress_every: float = 0.0,
+                   wave_tuning: dict | None = None,
+                   path_workers: int | None = None) -> dict:
+    """Joue une partie complète avec des bots. Renvoie un résumé par vague.
+
+    Arrêt : game over, vague until_wave atteinte (0 = pas de limite) ou
+    max_sim_s secondes simulées. wave_tuning surcharge les paramètres
+    d'équilibrage du WaveManager (base_enemies, wave_scale, ...).
+    """
+    srv = SimServer(seed, dt, snapshots, record, path_workers)
+    for name, value in (wave_tuning or {}).items():
+        setattr(srv.wave_manager, name, value)
+    bot_rng = random.Random(seed ^ 0x5EED)
+    pids = list(range(2, 2 + players))
+    bots = [BotPlayer(pid, random.Random(bot_rng.randrange(1 << 32))) for pid in pids]
+
+    srv.server.push([{"type": MSG_PLAYER_JOINED, "player_id": pid,
+                      "player_name": f"Bot{pid - 1}"} for pid in pids])
+    srv._step(dt)
+    srv.server.push([{"player_id": pids[0], "input": {"type": "start_game_req"}}])
+    srv._step(dt)
+
+    waves: list[dict] = []
+    cur = None
+    sim_s = 0.0
+    next_progress = progress_every
+    t0 = time.perf_counter()
+    end_reason = "max_sim"
+
+    try:
+        while sim_s < max_sim_s:
+            if invulnerable:
+                for p in srv.players.values():
+                    p.iframe_timer = float("inf")
+            srv.server.push([{"player_id": b.player_id, "input": b.think(srv, dt)}
+                             for b in bots])
+
+            t_tick = time.perf_counter()
+            srv._step(dt)
+            tick_ms = (time.perf_counter() - t_tick) * 1000.0
+            sim_s += dt
+
+            wave = srv.wave_manager.wave_number
+            if cur is None or cur["wave"] != wave:
+                cur = {"wave": wave, "start_s": round(sim_s, 3), "ticks": 0,
+                       "tick_ms_sum": 0.0, "tick_ms_max": 0.0, "enemies_max": 0,
+                       "alive_end": 0}
+                waves.append(cur)
+            cur["ticks"]       += 1
+            cur["tick_ms_sum"] += tick_ms
+            cur["tick_ms_max"]  = max(cur["tick_ms_max"], tick_ms)
+            cur["enemies_max"]  = max(cur["enemies_max"], len(srv.enemy_group))
+            cur["alive_end"]    = sum(1 for p in srv.players.values() if p.state == "alive")
+
+            if progress_every and sim_s >= next_progress:
+                next_progress += progress_every
+                wall = time.perf_counter() - t0
+                print(f"[sim] {sim_s:7.0f} s simulées  vague {wave:2d}  "
+                      f"ennemis {len(srv.enemy_group):3d}  x{sim_s / max(wall, 1e-9):.1f}")
+
+            if srv.state == STATE_GAMEOVER:
+                end_reason = "gameover"
+                break
+            if until_wave and wave >= until_wave:
+                end_reason = "until_wave"
+                break
+            if srv.state != STATE_PLAYING:
+                end_reason = srv.state
+                break
+    except KeyboardInterrupt:   # Ctrl-C / SIGTERM : rapport partiel
+        end_reason = "interrupted"
+
+    wall_s = time.perf_counter() - t0
+    srv.stop_recording()
+    for w in waves:
+        w["tick_ms_mean"] = round(w.pop("tick_ms_sum") / max(1, w["ticks"]), 4)
+        w["tick_ms_max"]  = round(w["tick_ms_max"], 4)
+        w["duration_s"]   = round(w["ticks"] * dt, 3)
+    service = srv.pathfinder.service
+    return {
+        "path_requests": service.requests,
+        "path_queued":   service.queued,
+        "path_waits":    service.waits,
+        "path_inline":   service.inline,
+        "seed":        seed,
+        "players":     players,
+        "match_seed":  srv.match_seed,
+        "end":         end_reason,
+        "wave":        srv.wave_manager.wave_number,
+        "sim_s":       round(sim_s, 3),
+        "wall_s":      round(wall_s, 3),
+        "speed":       round(sim_s / wall_s, 2) if wall_s > 0 else 0.0,
+        "score":       sum(p.score for p in srv.players.values()),
+        "waves":       waves,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Simulation accélérée headless")
+    parser.add_argument("--players", type=int, default=2, help="nombre de bots (défaut: 2)")
+    parser.add_argument("--seed", type=int, default=1, help="graine de la partie (défaut: 1)")
+    parser.add_argument("--until-wave", type=int, default=0,
+                        help="arrêter en atteignant cette vague (0 = game over)")
+    parser.add_argument("--max-sim", type=float, default=3600.0,
+                        help="secondes simulées max (défaut: 3600)")
+    parser.add_argument("--invulnerable", action="store_true",
+                        help="bots invulnérables (atteindre les vagues hautes)")
+    parser.add_argument("--dt", type=float, default=1.0 / FPS, help="pas de temps fixe (s)")
+    parser.add_argument("--snapshots", action="store_true",
+                        help="sérialiser les snapshots comme en production")
+    parser.add_argument("--path-workers", type=int, default=None,
+                        help="processus A* (défaut: PATH_WORKERS, 0 = A* dans le tick sous budget)")
+    parser.add_argument("--record", default=None, help="enregistrer la partie (.jsonl)")
+    parser.add_argument("--profile", default=None, help="écrire un profil cProfile (.pstats)")
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))   # surface factice (SDL dummy driver)
+    # SDL convertit SIGINT/SIGTERM en événement QUIT, vidé par _step() :
+    # rétablir l'interruption Python pour pouvoir arrêter une longue simulation.
+    signal.signal(signal.SIGINT,  signal.default_int_handler)
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    profile = cProfile.Profile() if args.profile else None
+    if profile:
+        profile.enable()
+    res = run_simulation(args.players, args.seed, args.until_wave, args.max_sim,
+                         args.invulnerable, args.dt, args.snapshots, args.record,
+                         progress_every=60.0, path_workers=args.path_workers)
+    if profile:
+        profile.disable()
+        profile.dump_stats(args.profile)
+        print(f"[sim] Profil → {args.profile}")
+
+    print(f"[sim] Fin ({res['end']}) : vague {res['wave']}, {res['sim_s']:.0f} s simulées "
+          f"en {res['wall_s']:.1f} s → {res['speed']:.1f} s simulées / s réelle")
+    print(f"[sim] A* : {res['path_requests']} demandes, "
+          f"{res['path_inline']} calculées dans le processus "
+          f"({res['path_queued']} reportées par le budget), "
+          f"{res['path_waits']} reports du pool")
+    for w in res["waves"]:
+        print(f"  vague {w['wave']:2d}  {w['duration_s']:7.1f} s  "
+              f"ennemis max {w['enemies_max']:3d}  tick moy {w['tick_ms_mean']:.3f} ms  "
+              f"max {w['tick_ms_max']:.2f} ms")
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
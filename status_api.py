@@ -3,6 +3,12 @@
 Utilisé par server_headless.py comme thread interne.
 Répond à GET /status avec du JSON lisible par le site vitrine.
 
+POST /profile?seconds=N déclenche un profil à chaud (server_profiling.LiveProfiler).
+Route réservée aux connexions locales et protégée par un jeton :
+    WW2_PROFILE_TOKEN=secret python server_headless.py
+    curl -X POST -H "X-Profile-Token: secret" "http://127.0.0.1:8080/profile?seconds=15"
+Sans variable WW2_PROFILE_TOKEN, la route est désactivée.
+
 Exemple de réponse :
     {
         "state":   "playing",
@@ -10,15 +16,23 @@ Exemple de réponse :
         "players": 2,
         "max_players": 4,
         "enemies_remaining": 12,
-        "online": true
+        "online": true,
+        "watchdog": {"overruns": 3, "captures": 1, ...},
+        "profiler": {"state": "idle", ...}
     }
 """
+import hmac
 import json
+import os
 import threading
 from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from settings import PROFILE_DEFAULT_SECONDS, PROFILE_TOKEN_ENV
 
 # Dict partagé mis à jour par DedicatedServer chaque tick
 # Accédé en lecture seule par le handler HTTP (GIL suffit pour la cohérence)
+# watchdog / profiler : calculés à la demande (voir set_section)
 _STATUS: dict = {
     "state":             "waiting",
     "wave":              0,
@@ -26,8 +40,18 @@ _STATUS: dict = {
     "max_players":       4,
     "enemies_remaining": 0,
     "online":            True,
+    "watchdog":          {},
+    "profiler":          {},
 }
 
+# Callable(seconds) -> dict enregistré par DedicatedServer (LiveProfiler.request)
+_profile_handler = None
+
+# Sections calculées par le thread HTTP à chaque GET /status : {clé: callable() -> dict}
+_SECTIONS: dict = {}
+
+_LOCAL_ADDRS = ("127.0.0.1", "::1", "::ffff:127.0.0.1")
+
 
 def update(state: str, wave: int, players: int, enemies_remaining: int) -> None:
     """Mettre à jour l'état partagé depuis la boucle de jeu."""
@@ -37,6 +61,18 @@ def update(state: str, wave: int, players: int, enemies_remaining: int) -> None:
     _STATUS["enemies_remaining"] = enemies_remaining
 
 
+def set_section(key: str, summary) -> None:
+    """Enregistrer un callable() -> dict appelé à chaque GET /status (ex.
+    TickWatchdog.summary) : son coût reste hors de la boucle de jeu."""
+    _SECTIONS[key] = summary
+
+
+def set_profile_handler(handler) -> None:
+    """Enregistrer le callable appelé par POST /profile avec la durée demandée."""
+    global _profile_handler
+    _profile_handler = handler
+
+
 class _Handler(BaseHTTPRequestHandler):
     def log_message(self, fmt, *args):
         pass   # silencer les logs HTTP dans le terminal du jeu
@@ -53,10 +89,37 @@ class _Handler(BaseHTTPRequestHandler):
 
     def do_GET(self):
         if self.path in ("/status", "/status/", "/"):
-            self._send_json(_STATUS)
+            status = dict(_STATUS)
+            for key, summary in list(_SECTIONS.items()):
+                status[key] = summary()
+            self._send_json(status)
         else:
             self._send_json({"error": "not found"}, 404)
 
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path.rstrip("/") != "/profile":
+            self._send_json({"error": "not found"}, 404)
+            return
+        token = os.environ.get(PROFILE_TOKEN_ENV, "")
+        if not token or _profile_handler is None:
+            self._send_json({"error": "profiling disabled"}, 403)
+            return
+        if self.client_address[0] not in _LOCAL_ADDRS:
+            self._send_json({"error": "local only"}, 403)
+            return
+        given = self.headers.get("X-Profile-Token", "")
+        if not hmac.compare_digest(given.encode(), token.encode()):
+            self._send_json({"error": "unauthorized"}, 401)
+            return
+        try:
+            seconds = float(parse_qs(url.query).get("seconds", [PROFILE_DEFAULT_SECONDS])[0])
+        except ValueError:
+            self._send_json({"error": "invalid seconds"}, 400)
+            return
+        result = _profile_handler(seconds)
+        self._send_json(result, 202 if result.get("status") == "scheduled" else 409)
+
     def do_OPTIONS(self):
         # Pré-vol CORS pour les navigateurs modernes
         self.send_response(204)
@@ -0,0 +1,316 @@
+"""wave_balance.py — Équilibrage des vagues par Monte-Carlo sur un pool de processus.
+
+Chaque point de la grille de paramètres est joué sur N graines par des bots
+(simulate.run_simulation) ; toutes les parties tournent en parallèle, un
+processus par cœur.
+
+Lancement :
+    python wave_balance.py --param BASE_ENEMIES=4,5,6 --param WAVE_SCALE=1.3,1.4 --seeds 200
+    python wave_balance.py --param ENEMY_TYPES.heavy.hp=120,160 --seeds 50 --out balance/heavy
+    python wave_balance.py --grid grille.json --seeds 500 --workers 8
+    python wave_balance.py --out balance/heavy --aggregate      # ré-agréger seulement
+
+Paramètres réglables : BASE_ENEMIES, WAVE_SCALE, SPAWN_INTERVAL, WAVE_COOLDOWN
+(attributs du WaveManager) et ENEMY_TYPES.<type>.<clé> (stats des ennemis).
+Fichier --grid : {"BASE_ENEMIES": [4, 5, 6], "ENEMY_TYPES.heavy.hp": [120, 160]}.
+
+Reprise : chaque partie terminée est ajoutée à <out>/runs.jsonl ; relancer la
+même commande ne rejoue que les parties manquantes (Ctrl-C sans perte).
+
+Sorties dans <out>/ :
+    runs.jsonl       une ligne par partie (config, graine, vague atteinte, détail par vague)
+    summary.csv      par config : vague atteinte (moyenne, quantiles, min, max)
+    survival.csv     par config : distribution de la vague atteinte
+    waves.csv        par config et vague : parties l'ayant atteinte, durée,
+                     coût du tick (moyen / max), ennemis simultanés max
+    aggregate.json   les trois tables ci-dessus
+"""
+import argparse
+import copy
+import csv
+import hashlib
+import itertools
+import json
+import os
+import statistics
+import sys
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import settings
+
+# Constantes de settings.py -> attribut du WaveManager
+_WAVE_PARAMS = {
+    "BASE_ENEMIES":   "base_enemies",
+    "WAVE_SCALE":     "wave_scale",
+    "SPAWN_INTERVAL": "spawn_interval",
+    "WAVE_COOLDOWN":  "wave_cooldown",
+}
+_DEFAULT_OUT = "balance"
+
+
+# ---------------------------------------------------------------- grille
+
+def _parse_value(text: str):
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            pass
+    raise argparse.ArgumentTypeError(f"valeur non numérique : {text!r}")
+
+
+def _check_param(name: str) -> None:
+    if name in _WAVE_PARAMS:
+        return
+    parts = name.split(".")
+    if (len(parts) == 3 and parts[0] == "ENEMY_TYPES"
+            and parts[1] in settings.ENEMY_TYPES
+            and parts[2] in settings.ENEMY_TYPES[parts[1]]):
+        return
+    raise SystemExit(f"[équilibrage] paramètre inconnu : {name}")
+
+
+def build_grid(grid: dict[str, list]) -> list[dict]:
+    """Produit cartésien {nom: [valeurs]} -> liste de configs {nom: valeur}."""
+    for name in grid:
+        _check_param(name)
+    names = sorted(grid)
+    return [dict(zip(names, values))
+            for values in itertools.product(*(grid[n] for n in names))]
+
+
+def config_key(params: dict) -> str:
+    """Identifiant court et stable d'une config (reprise, agrégation)."""
+    raw = json.dumps(params, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(raw.encode(), digest_size=4).hexdigest()
+
+
+# ---------------------------------------------------------------- worker
+
+_ENEMY_TYPES_DEFAULT: dict | None = None
+
+
+def _worker_init() -> None:
+    global _ENEMY_TYPES_DEFAULT
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame
+    pygame.init()
+    pygame.display.set_mode((1, 1))   # surface factice (SDL dummy driver)
+    _ENEMY_TYPES_DEFAULT = copy.deepcopy(settings.ENEMY_TYPES)
+    # Les logs du serveur (lobby, partie lancée, ...) noieraient la sortie
+    sys.stdout = open(os.devnull, "w")
+
+
+def _run_job(job: dict) -> dict:
+    """Une partie dans un processus du pool. Renvoie la ligne de runs.jsonl."""
+    from simulate import run_simulation
+
+    # ENEMY_TYPES est lu à la création de chaque ennemi : restaurer puis
+    # surcharger le dict partagé (le processus enchaîne plusieurs configs).
+    for etype, data in _ENEMY_TYPES_DEFAULT.items():
+        settings.ENEMY_TYPES[etype].clear()
+        settings.ENEMY_TYPES[etype].update(data)
+    tuning = {}
+    for name, value in job["params"].items():
+        if name in _WAVE_PARAMS:
+            tuning[_WAVE_PARAMS[name]] = value
+        else:
+            _, etype, key = name.split(".")
+            settings.ENEMY_TYPES[etype][key] = value
+
+    # Tous les cœurs jouent déjà des parties : A* dans le tick (même résultat)
+    res = run_simulation(job["players"], job["seed"], max_sim_s=job["max_sim"],
+                         wave_tuning=tuning, path_workers=0)
+    return {
+        "config": job["config"],
+        "params": job["params"],
+        "seed":   job["seed"],
+        "end":    res["end"],
+        "wave":   res["wave"],
+        "sim_s":  res["sim_s"],
+        "wall_s": res["wall_s"],
+        "score":  res["score"],
+        "waves":  [[w["wave"], w["duration_s"], w["tick_ms_mean"], w["tick_ms_max"],
+                    w["enemies_max"]] for w in res["waves"] if w["wave"] > 0],
+    }
+
+
+# ---------------------------------------------------------------- reprise
+
+def _load_runs(path: str) -> list[dict]:
+    runs = []
+    if not os.path.exists(path):
+        return runs
+    with open(path, encoding="utf-8") as f:
+        for raw in f:
+            try:
+                runs.append(json.loads(raw))
+            except json.JSONDecodeError:
+                pass   # dernière ligne tronquée par une interruption
+    return runs
+
+
+def run_sweep(configs: list[dict], seeds: list[int], out_dir: str,
+              players: int = 2, max_sim: float = 1800.0,
+              workers: int | None = None) -> None:
+    os.makedirs(out_dir, exist_ok=True)
+    runs_path = os.path.join(out_dir, "runs.jsonl")
+    done = {(r["config"], r["seed"]) for r in _load_runs(runs_path)}
+
+    # Graine en boucle externe : une campagne interrompue couvre déjà
+    # toutes les configs avec quelques graines.
+    jobs = [{"config": config_key(p), "params": p, "seed": s,
+             "players": players, "max_sim": max_sim}
+            for s in seeds for p in configs]
+    todo = [j for j in jobs if (j["config"], j["seed"]) not in done]
+    workers = workers or os.cpu_count() or 1
+    print(f"[équilibrage] {len(configs)} config(s) × {len(seeds)} graine(s) = {len(jobs)} "
+          f"parties, {len(jobs) - len(todo)} déjà faites, {workers} processus.")
+    if not todo:
+        return
+
+    t0 = time.perf_counter()
+    n_done = 0
+    with open(runs_path, "a", encoding="utf-8") as out, \
+            ProcessPoolExecutor(max_workers=workers, initializer=_worker_init) as pool:
+        futures = [pool.submit(_run_job, j) for j in todo]
+        try:
+            for fut in as_completed(futures):
+                row = fut.result()
+                out.write(json.dumps(row, separators=(",", ":")) + "\n")
+                out.flush()
+                n_done += 1
+                if n_done % max(1, len(todo) // 20) == 0 or n_done == len(todo):
+                    elapsed = time.perf_counter() - t0
+                    eta = elapsed / n_done * (len(todo) - n_done)
+                    print(f"[équilibrage] {n_done}/{len(todo)} parties "
+                          f"({elapsed:.0f} s, reste ~{eta:.0f} s)")
+        except KeyboardInterrupt:
+            print("[équilibrage] Interrompu — fin des parties en cours, "
+                  "relancer la même commande pour reprendre.")
+            for fut in futures:
+                fut.cancel()
+            raise
+
+
+# ---------------------------------------------------------------- agrégation
+
+def _quantile(sorted_vals: list, q: float):
+    if not sorted_vals:
+        return 0
+    return sorted_vals[min(len(sorted_vals) - 1, int(q * len(sorted_vals)))]
+
+
+def aggregate(out_dir: str) -> dict:
+    """Agrège runs.jsonl en summary.csv, survival.csv, waves.csv et aggregate.json."""
+    runs = _load_runs(os.path.join(out_dir, "runs.jsonl"))
+    by_config: dict[str, list[dict]] = defaultdict(list)
+    for r in runs:
+        by_config[r["config"]].append(r)
+
+    summary, survival, waves = [], [], []
+    for key, rows in sorted(by_config.items()):
+        params = rows[0]["params"]
+        reached = sorted(r["wave"] for r in rows)
+        summary.append({
+            "config": key, **params,
+            "runs": len(rows),
+            "capped": sum(1 for r in rows if r["end"] != "gameover"),
+            "wave_mean":   round(statistics.fmean(reached), 3),
+            "wave_median": statistics.median(reached),
+            "wave_p10":    _quantile(reached, 0.10),
+            "wave_p90":    _quantile(reached, 0.90),
+            "wave_min":    reached[0],
+            "wave_max":    reached[-1],
+            "sim_s_mean":  round(statistics.fmean(r["sim_s"] for r in rows), 1),
+        })
+        for wave, count in sorted(Counter(reached).items()):
+            survival.append({"config": key, "wave": wave, "runs": count,
+                             "share": round(count / len(rows), 4)})
+
+        per_wave: dict[int, list] = defaultdict(list)
+        for r in rows:
+            for w in r["waves"]:
+                per_wave[w[0]].append(w)
+        for wave, ws in sorted(per_wave.items()):
+            waves.append({
+                "config": key, "wave": wave, "runs": len(ws),
+                "duration_s_mean":  round(statistics.fmean(w[1] for w in ws), 2),
+                "tick_ms_mean":     round(statistics.fmean(w[2] for w in ws), 4),
+                "tick_ms_max":      round(max(w[3] for w in ws), 3),
+                "enemies_max_mean": round(statistics.fmean(w[4] for w in ws), 2),
+                "enemies_max":      max(w[4] for w in ws),
+            })
+
+    _write_csv(os.path.join(out_dir, "summary.csv"), summary)
+    _write_csv(os.path.join(out_dir, "survival.csv"), survival)
+    _write_csv(os.path.join(out_dir, "waves.csv"), waves)
+    result = {"runs": len(runs), "summary": summary,
+              "survival": survival, "waves": waves}
+    with open(os.path.join(out_dir, "aggregate.json"), "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+    return result
+
+
+def _write_csv(path: str, rows: list[dict]) -> None:
+    fields: list[str] = []
+    for row in rows:
+        fields.extend(k for k in row if k not in fields)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+# ---------------------------------------------------------------- CLI
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Équilibrage des vagues par Monte-Carlo")
+    parser.add_argument("--param", action="append", default=[], metavar="NOM=V1,V2",
+                        help="valeurs à balayer (répétable)")
+    parser.add_argument("--grid", default=None, help="grille JSON {nom: [valeurs]}")
+    parser.add_argument("--seeds", type=int, default=20, help="graines par config (défaut: 20)")
+    parser.add_argument("--seed-base", type=int, default=1, help="première graine (défaut: 1)")
+    parser.add_argument("--players", type=int, default=2, help="bots par partie (défaut: 2)")
+    parser.add_argument("--max-sim", type=float, default=1800.0,
+                        help="secondes simulées max par partie (défaut: 1800)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="processus du pool (défaut: tous les cœurs)")
+    parser.add_argument("--out", default=_DEFAULT_OUT, help=f"dossier de sortie (défaut: {_DEFAULT_OUT})")
+    parser.add_argument("--aggregate", action="store_true",
+                        help="ne rien jouer, ré-agréger runs.jsonl")
+    args = parser.parse_args()
+
+    if not args.aggregate:
+        grid: dict[str, list] = {}
+        if args.grid:
+            with open(args.grid, encoding="utf-8") as f:
+                grid.update(json.load(f))
+        for spec in args.param:
+            name, _, values = spec.partition("=")
+            if not values:
+                parser.error(f"--param attendu sous la forme NOM=V1,V2 : {spec!r}")
+            grid[name.strip()] = [_parse_value(v) for v in values.split(",")]
+        configs = build_grid(grid)   # grille vide -> une config : les valeurs de settings.py
+        seeds = list(range(args.seed_base, args.seed_base + args.seeds))
+        try:
+            run_sweep(configs, seeds, args.out, args.players, args.max_sim, args.workers)
+        except KeyboardInterrupt:
+            pass
+
+    res = aggregate(args.out)
+    print(f"[équilibrage] {res['runs']} parties agrégées → {args.out}/"
+          f"{{summary,survival,waves}}.csv, aggregate.json")
+    for row in res["summary"]:
+        params = " ".join(f"{k}={row[k]}" for k in row
+                          if k not in ("config", "runs", "capped") and not k.startswith(("wave_", "sim_s")))
+        print(f"  {row['config']}  {params or '(settings.py)'}  {row['runs']} parties  "
+              f"vague moy {row['wave_mean']:.2f}  p10 {row['wave_p10']}  p90 {row['wave_p90']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())